@@ -0,0 +1,37 @@
+"""
+Compare `EntityInterface.get_entities` à une boucle séquentielle sur `get_entity`.
+
+Usage : python -m benchmarks.bulk [nombre d'IDs] [latence en ms]
+"""
+
+import sys
+import time
+
+import nsarchive
+
+from .server import Dataset, spawn
+
+def main(count: int = 200, latency: float = 0.02):
+    url, process = spawn(size = count, latency = latency)
+    ids = nsarchive.NSID.many(Dataset(count).individuals)
+
+    interface = nsarchive.EntityInterface(url, "token", transport = nsarchive.Transport(pool_maxsize = 32))
+
+    start = time.perf_counter()
+    sequential = [ interface.get_entity(id) for id in ids ]
+    seq_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = interface.get_entities(ids, max_workers = 32)
+    bulk_time = time.perf_counter() - start
+
+    assert [ e.id for e in sequential ] == [ e.id for e in bulk ]
+
+    print(f"{count} entités, {latency * 1000:.0f} ms de latence")
+    print(f"séquentiel   : {seq_time:.3f} s")
+    print(f"get_entities : {bulk_time:.3f} s (x{seq_time / bulk_time:.1f})")
+
+    process.terminate()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200, float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.02)
@@ -0,0 +1,58 @@
+"""
+Compare la commande `/top` : `fetch_entities(_class = "individuals")` puis tri à chaque appel, contre un `Leaderboard` construit une fois puis interrogé (rang, page) et tenu à jour par `add_xp`.
+
+Usage : python -m benchmarks.leaderboard [nombre d'entités] [nombre de requêtes]
+"""
+
+import random
+import sys
+import time
+
+import nsarchive
+
+from .server import FakeNationDB
+
+def timed(fn: callable) -> float:
+    start = time.perf_counter()
+    fn()
+
+    return time.perf_counter() - start
+
+def main(size: int = 5000, queries: int = 200):
+    with FakeNationDB(size = size) as server:
+        entities = nsarchive.EntityInterface(server.url, "token")
+        rng = random.Random(0)
+
+        def legacy_top():
+            users = entities.fetch_entities(_class = "individuals")
+            users.sort(key = lambda user: user.xp, reverse = True)
+
+            return users[:10]
+
+        build = timed(lambda: entities.build_leaderboard())
+        board = entities.leaderboard
+        users = list(board._users.values())
+
+        assert [ user.xp for user in board.top(10) ] == [ user.xp for user in legacy_top() ]
+
+        legacy = timed(lambda: [ legacy_top() for _ in range(queries // 20 or 1) ]) / (queries // 20 or 1)
+        pages = timed(lambda: [ board.page(rng.randrange(50), 10) for _ in range(queries) ]) / queries
+        ranks = timed(lambda: [ board.rank(rng.choice(users)) for _ in range(queries) ]) / queries
+        zoned = timed(lambda: [ board.top(10, zone = 20) for _ in range(queries) ]) / queries
+
+        user = board.top(1)[-1] if len(board) < 2 else board.page(len(board) // 10 - 1, 10)[-1]
+        before = board.rank(user)
+        writes = timed(lambda: [ user.add_xp(1000) for _ in range(20) ]) / 20
+        after = board.rank(user)
+
+        print(f"{len(board)} membres classés, construction en {build * 1000:.1f} ms\n")
+        print(f"{'fetch + tri':<16} {legacy * 1000:>10.3f} ms / requête")
+        print(f"{'page':<16} {pages * 1000:>10.3f} ms / requête  x{legacy / pages:.0f}")
+        print(f"{'rang':<16} {ranks * 1000:>10.3f} ms / requête  x{legacy / ranks:.0f}")
+        print(f"{'top de zone':<16} {zoned * 1000:>10.3f} ms / requête  x{legacy / zoned:.0f}")
+        print(f"\nadd_xp : {writes * 1000:.2f} ms / écriture, rang {before} -> {after}")
+
+        entities.transport.close()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000, int(sys.argv[2]) if len(sys.argv) > 2 else 200)
@@ -0,0 +1,51 @@
+"""
+Compare le calcul des niveaux d'XP : ancienne boucle de `User.get_level`, `level_for_xp` (table des seuils + bisect) et `levels_for_xp` (NumPy).
+
+Usage : python -m benchmarks.levels [nombre de membres] [XP maximale]
+"""
+
+import random
+import sys
+import time
+
+from nsarchive.models.entities import level_for_xp, levels_for_xp
+
+def legacy_level(xp: int) -> int:
+    """
+    Boucle utilisée par `User.get_level` avant la table des seuils.
+    """
+
+    i = 0
+    while xp > int(round(25 * (i * 2.5) ** 2, -2)):
+        i += 1
+
+    return i
+
+def timed(fn: callable) -> tuple[float, list]:
+    start = time.perf_counter()
+    res = fn()
+
+    return time.perf_counter() - start, res
+
+def main(count: int = 100000, max_xp: int = 200000):
+    rng = random.Random(0)
+    values = [ rng.randrange(0, max_xp) for _ in range(count) ]
+
+    results = {
+        "ancienne boucle": timed(lambda: [ legacy_level(xp) for xp in values ]),
+        "level_for_xp": timed(lambda: [ level_for_xp(xp) for xp in values ]),
+        "levels_for_xp": timed(lambda: levels_for_xp(values).tolist())
+    }
+
+    reference = results["ancienne boucle"]
+
+    for name, (_, levels) in results.items():
+        assert levels == reference[1], name
+
+    print(f"{count} membres, XP < {max_xp}\n")
+
+    for name, (elapsed, _) in results.items():
+        print(f"{name:<16} {elapsed * 1000:>8.1f} ms  x{reference[0] / elapsed:.0f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000, int(sys.argv[2]) if len(sys.argv) > 2 else 200000)
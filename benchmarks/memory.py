@@ -0,0 +1,54 @@
+"""
+Mesure avec `tracemalloc` la mémoire occupée par les modèles chargés (octets par objet), sans compter les données brutes reçues du serveur.
+
+Usage : python -m benchmarks.memory [nombre d'objets]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import nsarchive
+
+from .server import Dataset
+
+def measure(load: callable, rows: list[dict], lazy: bool = False) -> float:
+    gc.collect()
+    tracemalloc.start()
+
+    before = tracemalloc.get_traced_memory()[0]
+    models = [ load(_data, lazy) if lazy else load(_data) for _data in rows ]
+    after = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    del models
+
+    return (after - before) / len(rows)
+
+def main(count: int = 10000):
+    ds = Dataset(count)
+
+    url = "http://127.0.0.1:8000"
+    entities = nsarchive.EntityInterface(url, "token")
+    economy = nsarchive.EconomyInterface(url, "token")
+
+    individuals = [ ds.entity(id) for id in ds.individuals ]
+    organizations = [ ds.entity(id) for id in ds.organizations ]
+    accounts = list(ds.accounts.values())
+    inventories = list(ds.inventories.values())
+    sales = list(ds.sales.values())
+
+    print(f"{'modèle':<24} {'objets':>7} {'octets/objet':>13}")
+
+    for name, load, rows, lazy in (
+        ("User", entities._load_entity, individuals, False),
+        ("User (lazy)", entities._load_entity, individuals, True),
+        ("Organization", entities._load_entity, organizations, False),
+        ("BankAccount", economy._load_account, accounts, False),
+        ("Inventory", economy._load_inventory, inventories, False),
+        ("Sale", economy._load_sale, sales, False)
+    ):
+        print(f"{name:<24} {len(rows):>7} {measure(load, rows, lazy):>13.0f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
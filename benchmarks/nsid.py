@@ -0,0 +1,79 @@
+"""
+Micro-benchmark de la construction des `NSID` : ancienne conversion, `NSID()` avec et sans table d'internement, et `NSID.many`.
+
+La charge reproduit celle d'un `_load` : des IDs reçus en `str` (souvent les mêmes d'un objet à l'autre), quelques `int` et des `NSID` déjà convertis.
+
+Usage : python -m benchmarks.nsid [nombre de valeurs] [nombre d'IDs distincts]
+"""
+
+import random
+import sys
+import time
+
+from nsarchive import NSID
+
+class LegacyNSID(str):
+    """
+    Conversion utilisée avant la table d'internement.
+    """
+
+    def __new__(cls, value):
+        if type(value) == int:
+            value = hex(value)
+        elif type(value) in (str, NSID, LegacyNSID):
+            value = hex(int(value, 16))
+        else:
+            raise TypeError(f"<{value}> is not NSID serializable")
+
+        if value.startswith("0x"):
+            value = value[2:]
+
+        return super(LegacyNSID, cls).__new__(cls, value.upper())
+
+def workload(count: int, distinct: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    pool = [ 0x100000 + i for i in range(distinct) ]
+    values = []
+
+    for _ in range(count):
+        number = rng.choice(pool)
+        kind = rng.random()
+
+        if kind < 0.8:
+            values.append(format(number, 'X'))
+        elif kind < 0.9:
+            values.append(number)
+        else:
+            values.append(NSID(number))
+
+    return values
+
+def timed(fn: callable) -> float:
+    start = time.perf_counter()
+    fn()
+
+    return time.perf_counter() - start
+
+def main(count: int = 100000, distinct: int = 20000):
+    values = workload(count, distinct)
+
+    results = {
+        "ancien NSID()": timed(lambda: [ LegacyNSID(value) for value in values ])
+    }
+
+    NSID._interned.clear()
+    results["NSID() à froid"] = timed(lambda: [ NSID(value) for value in values ])
+    results["NSID() internés"] = timed(lambda: [ NSID(value) for value in values ])
+    results["NSID.many"] = timed(lambda: NSID.many(values))
+
+    assert NSID.many(values) == [ LegacyNSID(value) for value in values ]
+
+    print(f"{count} valeurs, {distinct} IDs distincts\n")
+
+    reference = results["ancien NSID()"]
+
+    for name, elapsed in results.items():
+        print(f"{name:<18} {elapsed * 1000:>8.1f} ms  x{reference / elapsed:.1f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000, int(sys.argv[2]) if len(sys.argv) > 2 else 20000)
@@ -0,0 +1,688 @@
+"""
+Serveur NationDB factice pour les benchmarks.
+
+Il implémente les routes utilisées par les interfaces (`/model`, `/fetch`, `/bank`, `/marketplace`, `/votes`, `/elections`, `/parties`, `/justice`, `/upload_file`, `/drive`) sur un jeu de données généré en mémoire, avec une latence configurable. Les lectures renvoient un `ETag` et répondent `304` aux requêtes conditionnelles, comme le vrai serveur.
+
+Usage : python -m benchmarks.server [--size N] [--latency MS] [--port PORT]
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import random
+import threading
+import time
+import typing
+import urllib.parse
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_PERMISSIONS = ("aliases", "bots", "candidacies", "constitution", "database", "inventories", "items", "laws", "loans", "members", "mines", "money", "national_channel", "organizations", "reports", "sales", "sanctions", "state_budgets", "votes")
+
+_POSITIONS = {
+    "membre": ("Membre", { "inventories": "a---", "items": "---r", "members": "---r", "organizations": "---r", "sales": "a--r" }),
+    "depute": ("Député", { "laws": "a---", "votes": "a--r", "candidacies": "a---" }),
+    "ministre": ("Ministre", { "laws": "am--", "state_budgets": "amer", "votes": "am-r" }),
+    "juge": ("Juge", { "reports": "-m-r", "sanctions": "amer" }),
+    "banquier": ("Banquier", { "inventories": "amer", "loans": "amer", "money": "a---" }),
+    "admin": ("Administrateur", { key: "amer" for key in _PERMISSIONS })
+}
+
+_ITEMS = (("Bois", "🪵", "raw"), ("Pierre", "🪨", "raw"), ("Fer", "⛓️", "raw"), ("Or", "🪙", "raw"), ("Pain", "🍞", "food"), ("Pomme", "🍎", "food"), ("Épée", "🗡️", "tool"), ("Pioche", "⛏️", "tool"))
+
+class Dataset:
+    """
+    Jeu de données déterministe de taille `size` (nombre d'individus). Les autres tables sont dimensionnées en proportion.
+
+    ## Paramètres
+    size: `int` (optionnel)\n
+        Nombre d'individus
+    seed: `int` (optionnel)\n
+        Graine du générateur aléatoire
+    """
+
+    def __init__(self, size: int = 1000, seed: int = 0) -> None:
+        self.size = size
+        self.lock = threading.Lock()
+
+        rng = random.Random(seed)
+        now = round(time.time())
+
+        self.positions = {
+            id: {
+                "id": id,
+                "name": name,
+                "is_global_scope": id != "membre",
+                "permissions": dict(permissions),
+                "manager_permissions": { "members": "-m--" }
+            } for id, (name, permissions) in _POSITIONS.items()
+        }
+
+        self.individuals = {}
+        self.organizations = {}
+
+        for i in range(size):
+            id = f"{0x100000 + i:X}"
+            position = rng.choices(list(self.positions), weights = (90, 4, 2, 2, 1, 1))[0]
+
+            self.individuals[id] = {
+                "id": id,
+                "_class": "individuals",
+                "name": f"Membre {i}",
+                "register_date": now - rng.randrange(0, 3 * 365 * 86400),
+                "zone": rng.choice((10, 20, 20, 20, 30)),
+                "position": position,
+                "additional": { "bio": f"Membre n°{i}" } if rng.random() < 0.3 else {},
+                "xp": rng.randrange(0, 200000),
+                "boosts": { "default": 1 } if rng.random() < 0.8 else {},
+                "votes": []
+            }
+
+        individuals = list(self.individuals)
+
+        for i in range(max(1, size // 20)):
+            id = f"{0x200000 + i:X}"
+            members = rng.sample(individuals, min(len(individuals), rng.randrange(2, 30)))
+
+            self.organizations[id] = {
+                "id": id,
+                "_class": "organizations",
+                "name": f"Organisation {i}",
+                "register_date": now - rng.randrange(0, 3 * 365 * 86400),
+                "zone": 20,
+                "position": "membre",
+                "additional": {},
+                "owner_id": members[0],
+                "members": [ { "id": member, "level": 5 if member == members[0] else rng.randrange(0, 4) } for member in members ],
+                "certifications": { "verified": now + 2419200 } if rng.random() < 0.2 else {}
+            }
+
+        owners = individuals + list(self.organizations)
+
+        self.accounts = {}
+        self.inventories = {}
+        self.items = {}
+        self.sales = {}
+
+        for i in range(size + len(self.organizations)):
+            id = f"{0x300000 + i:X}"
+
+            self.accounts[id] = {
+                "id": id,
+                "owner_id": owners[i % len(owners)],
+                "register_date": now - rng.randrange(0, 3 * 365 * 86400),
+                "tag": "inconnu",
+                "bank": rng.choice(("HexaBank", "HexaBank", "BanqueNationale")),
+                "amount": rng.randrange(0, 100000),
+                "income": 0,
+                "frozen": rng.random() < 0.01,
+                "flagged": rng.random() < 0.02
+            }
+
+        for i, (name, emoji, category) in enumerate(_ITEMS):
+            id = f"{0x400000 + i:X}"
+            self.items[id] = { "id": id, "name": name, "emoji": emoji, "category": category, "craft": {} }
+
+        for i in range(size):
+            id = f"{0x500000 + i:X}"
+
+            self.inventories[id] = {
+                "id": id,
+                "owner_id": owners[i % len(owners)],
+                "tag": "inconnu",
+                "register_date": now - rng.randrange(0, 3 * 365 * 86400),
+                "items": { item: rng.randrange(1, 64) for item in rng.sample(list(self.items), rng.randrange(0, 4)) }
+            }
+
+        for i in range(max(1, size // 5)):
+            id = f"{0x600000 + i:X}"
+
+            self.sales[id] = {
+                "id": id,
+                "open": rng.random() < 0.8,
+                "seller_id": rng.choice(owners),
+                "item_id": rng.choice(list(self.items)),
+                "quantity": rng.randrange(1, 64),
+                "price": rng.randrange(1, 500)
+            }
+
+        self.votes = {}
+        self.elections = {}
+        self.parties = {}
+
+        for i in range(max(1, size // 50)):
+            id = f"{0x700000 + i:X}"
+
+            self.votes[id] = {
+                "id": id,
+                "title": f"Vote {i}",
+                "author": rng.choice(individuals),
+                "start": now - 86400,
+                "end": now + 86400,
+                "options": { "yes": { "title": "Pour", "count": rng.randrange(0, 100) }, "no": { "title": "Contre", "count": rng.randrange(0, 100) } }
+            }
+
+        for i, vote in enumerate(list(self.votes)[:max(1, len(self.votes) // 4)]):
+            id = f"{0x800000 + i:X}"
+            self.elections[id] = { "id": id, "type": rng.choice(("full", "partial")), "vote_id": vote }
+
+        for org in list(self.organizations)[:max(1, len(self.organizations) // 4)]:
+            self.parties[org] = {
+                "org_id": org,
+                "color": rng.randrange(0, 0xFFFFFF),
+                "motto": "Liberté, égalité",
+                "politiscales": { "DEM": rng.random(), "SRV": rng.random(), "LIB": rng.random() },
+                "last_election": None
+            }
+
+        self.reports = {}
+        self.lawsuits = {}
+        self.sanctions = {}
+
+        for i in range(max(1, size // 20)):
+            report_id, lawsuit_id, sanction_id = (f"{base + i:X}" for base in (0x900000, 0xA00000, 0xB00000))
+            target = rng.choice(individuals)
+
+            self.reports[report_id] = { "id": report_id, "author": rng.choice(individuals), "target": target, "date": now - 3600, "status": "pending", "reason": "spam", "details": None }
+            self.lawsuits[lawsuit_id] = { "id": lawsuit_id, "target": target, "judge": rng.choice(individuals), "title": f"Affaire {i}", "date": now - 1800, "report": report_id, "private": 0, "status": 0 }
+            self.sanctions[sanction_id] = { "id": sanction_id, "target": target, "type": "ban", "date": now - 600, "duration": 86400, "title": "Spam", "lawsuit": lawsuit_id }
+
+        self.files: dict[tuple[str, str], bytes] = {}
+
+        self._next_id = 0xF00000
+
+    def new_id(self) -> str:
+        self._next_id += 1
+
+        return f"{self._next_id:X}"
+
+    """
+    ---- SÉRIALISATION ----
+    """
+
+    def entity(self, id: str, _class: str = 'entities') -> dict | None:
+        if _class in ('entities', 'individuals') and id in self.individuals:
+            _data = dict(self.individuals[id])
+        elif _class in ('entities', 'organizations') and id in self.organizations:
+            _data = dict(self.organizations[id])
+            _data['owner'] = self.entity(_data.pop('owner_id'))
+        else:
+            return None
+
+        _data['position'] = self.positions[_data['position']]
+
+        return _data
+
+    def vote(self, id: str) -> dict | None:
+        return self.votes.get(id)
+
+    def election(self, id: str) -> dict | None:
+        _election = self.elections.get(id)
+
+        if _election is None:
+            return None
+
+        return { "id": _election['id'], "type": _election['type'], "vote": self.votes[_election['vote_id']] }
+
+    def table(self, _class: str) -> dict[str, dict]:
+        if _class == 'entities':
+            return { **self.individuals, **self.organizations }
+
+        return getattr(self, _class)
+
+    def serialize(self, _class: str, id: str) -> dict | None:
+        if _class in ('entities', 'individuals', 'organizations'):
+            return self.entity(id, _class)
+        elif _class == 'elections':
+            return self.election(id)
+        else:
+            return self.table(_class).get(id)
+
+
+class _Abort(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        self.status = status
+        self.message = message
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    server: 'FakeNationDB'
+
+    def log_message(self, *args):
+        pass
+
+    """
+    ---- RÉPONSES ----
+    """
+
+    def _send(self, status: int, body: bytes = b'', content_type: str = "application/json", headers: dict = {}):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+
+        for key, value in headers.items():
+            self.send_header(key, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, _data, status: int = 200):
+        body = json.dumps(_data).encode()
+
+        if self.command == 'GET' and status == 200 and self.server.etag:
+            etag = '"' + hashlib.blake2b(body, digest_size = 8).hexdigest() + '"'
+
+            if self.headers.get('If-None-Match') == etag:
+                return self._send(304, headers = { "ETag": etag })
+
+            return self._send(status, body, headers = { "ETag": etag })
+
+        self._send(status, body)
+
+    def _error(self, status: int, message: str):
+        self._json({ "message": message }, status)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get('Content-Length') or 0)
+
+        if not length:
+            return {}
+
+        raw = self.rfile.read(length)
+
+        if not self.headers.get('Content-Type', '').startswith('application/json'):
+            return { "_raw": raw }
+
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return {}
+
+    def _route(self):
+        time.sleep(self.server.latency + (random.uniform(0, self.server.jitter) if self.server.jitter else 0))
+
+        parsed = urllib.parse.urlparse(self.path)
+        path = [ part for part in parsed.path.split('/') if part ]
+        query = { key: values[-1] for key, values in urllib.parse.parse_qs(parsed.query).items() }
+        body = self._body()
+
+        if self.server.auth and not self.headers.get('Authorization', '').startswith('Bearer ') and path[:2] != ['auth', 'login']:
+            return self._error(401, "Missing token")
+
+        key = self.headers.get('Idempotency-Key') if self.command != 'GET' else None
+
+        with self.server.dataset.lock:
+            if key in self.server.idempotency:
+                # Écriture déjà appliquée : on renvoie la même réponse
+                status, _data = self.server.idempotency[key]
+                return self._json(_data, status)
+
+            try:
+                status, _data = 200, getattr(self, f"_{self.command.lower()}")(path, query, body)
+            except _Abort as e:
+                status, _data = e.status, { "message": e.message }
+            except (KeyError, IndexError, ValueError, AttributeError) as e:
+                status, _data = 400, { "message": f"Bad request: {e!r}" }
+
+            if _data is None:
+                status, _data = 404, { "message": "Not found" }
+
+            if key:
+                self.server.idempotency[key] = (status, _data)
+
+        if self.command != 'GET' and self.server.drop and random.random() < self.server.drop:
+            # Coupure après application : le client ne sait pas si l'écriture a eu lieu
+            self.close_connection = True
+            return
+
+        if status != 200:
+            return self._json(_data, status)
+
+        if isinstance(_data, bytes):
+            return self._send(200, _data, "application/octet-stream")
+
+        self._json(_data)
+
+    do_GET = do_POST = do_PUT = _route
+
+    """
+    ---- LECTURES ----
+    """
+
+    def _get(self, path: list[str], query: dict, body: dict):
+        ds = self.server.dataset
+
+        match path:
+            case ['ping']:
+                return { "_version": 300 }
+            case ['model', 'individuals', id, 'groups']:
+                return [ ds.entity(org) for org, _org in ds.organizations.items() if any(m['id'] == id for m in _org['members']) ]
+            case ['model', 'positions', id]:
+                return ds.positions.get(id)
+            case ['model', _class, id]:
+                return ds.entity(id.upper(), _class)
+            case ['fetch', _class]:
+                return self._fetch(_class, query)
+            case ['bank', 'accounts', id]:
+                return ds.accounts.get(id.upper())
+            case ['bank', 'inventories', id]:
+                return ds.inventories.get(id.upper())
+            case ['marketplace', 'items', id]:
+                return ds.items.get(id.upper())
+            case ['marketplace', 'sales', id]:
+                return ds.sales.get(id.upper())
+            case ['votes', id]:
+                return ds.vote(id.upper())
+            case ['elections', id]:
+                return ds.election(id.upper())
+            case ['parties', id]:
+                return ds.parties.get(id.upper())
+            case ['justice', 'reports' | 'lawsuits' | 'sanctions' as table, id]:
+                return ds.table(table).get(id.upper())
+            case ['drive', bucket, *name]:
+                return ds.files.get((bucket, '/'.join(name)))
+
+    def _fetch(self, _class: str, query: dict) -> list | None:
+        ds = self.server.dataset
+
+        if _class not in ('entities', 'individuals', 'organizations', 'positions', 'accounts', 'inventories', 'items', 'sales', 'votes', 'reports', 'lawsuits', 'sanctions'):
+            return None
+
+        res = []
+
+        for id, _data in ds.table(_class).items():
+            if all(str(_data.get(key)).lower() == str(value).lower() for key, value in query.items()):
+                res.append(ds.serialize(_class, id))
+
+        return res
+
+    """
+    ---- ÉCRITURES ----
+    """
+
+    def _post(self, path: list[str], query: dict, body: dict):
+        ds = self.server.dataset
+
+        match path:
+            case ['auth', 'login']:
+                return { "token": hashlib.sha256(json.dumps(body).encode()).hexdigest() }
+            case [endpoint] if endpoint.startswith('delete_'):
+                table = ds.table(endpoint.removeprefix('delete_'))
+
+                for id in body.get('ids', []):
+                    table.pop(str(id).upper(), None)
+
+                return {}
+            case ['model', 'positions', id, 'update_permissions']:
+                ds.positions[id]['permissions'].update(query)
+            case ['model', _class, id, action]:
+                return self._entity_action(_class, id.upper(), action, query)
+            case ['bank', 'accounts', id, action]:
+                return self._account_action(ds.accounts[id.upper()], action, query)
+            case ['bank', 'inventories', id, 'deposit']:
+                items = ds.inventories[id.upper()]['items']
+                items[query['item']] = items.get(query['item'], 0) + int(query['amount'])
+            case ['bank', 'inventories', id, 'sell_item']:
+                sale_id = ds.new_id()
+                ds.sales[sale_id] = { "id": sale_id, "open": True, "seller_id": ds.inventories[id.upper()]['owner_id'], "item_id": query['item'], "quantity": int(query['quantity']), "price": int(query['price']) }
+
+                return { "sale_id": sale_id }
+            case ['marketplace', 'items', id, 'rename']:
+                ds.items[id.upper()]['name'] = query['name']
+            case ['votes' | 'elections' as table, id, 'vote']:
+                vote = ds.votes[id.upper()] if table == 'votes' else ds.votes[ds.elections[id.upper()]['vote_id']]
+                vote['options'][query['option']]['count'] += 1
+            case ['votes' | 'elections' as table, id, 'close']:
+                vote = ds.votes[id.upper()] if table == 'votes' else ds.votes[ds.elections[id.upper()]['vote_id']]
+                vote['end'] = round(time.time())
+            case ['justice', 'reports', id, 'update']:
+                ds.reports[id.upper()]['status'] = query['status']
+            case _:
+                return None
+
+        return {}
+
+    def _entity_action(self, _class: str, id: str, action: str, query: dict):
+        ds = self.server.dataset
+        entity = ds.individuals.get(id) or ds.organizations.get(id)
+
+        if entity is None:
+            return None
+
+        match action:
+            case 'delete':
+                ds.individuals.pop(id, None)
+                ds.organizations.pop(id, None)
+            case 'rename':
+                entity['name'] = query['name']
+            case 'change_position':
+                entity['position'] = query['position']
+            case 'add_link':
+                # Les entiers sont stockés sous la forme "\n<valeur>"
+                entity['additional'][query['link']] = query['value'] if query.get('type') == 'string' else '\n' + query['value']
+            case 'remove_link':
+                entity['additional'].pop(query['link'], None)
+            case 'add_xp':
+                entity['xp'] += int(float(query['amount']))
+            case 'edit_boost':
+                if int(query['multiplier']) >= 0:
+                    entity['boosts'][query['boost']] = int(query['multiplier'])
+                else:
+                    entity['boosts'].pop(query['boost'], None)
+            case 'add_certification':
+                entity['certifications'][query['name']] = round(time.time()) + int(query['duration'])
+            case 'remove_certification':
+                entity['certifications'].pop(query['name'], None)
+            case 'add_member':
+                entity['members'].append({ "id": query['id'], "level": int(query.get('level', 0)) })
+            case 'remove_member':
+                entity['members'] = [ m for m in entity['members'] if m['id'] != query['id'] ]
+            case _:
+                return None
+
+        return {}
+
+    def _account_action(self, account: dict, action: str, query: dict):
+        ds = self.server.dataset
+
+        match action:
+            case 'freeze':
+                account['frozen'] = query['frozen'] == 'true'
+            case 'flag':
+                account['flagged'] = query['flagged'] == 'true'
+            case 'debit':
+                amount = int(float(query['amount']))
+
+                if account['frozen']:
+                    raise _Abort(403, "Account is frozen")
+
+                account['amount'] -= amount
+
+                if 'target' in query:
+                    ds.accounts[query['target'].upper()]['amount'] += amount
+            case 'deposit':
+                account['amount'] += int(float(query['amount']))
+            case _:
+                return None
+
+        return {}
+
+    def _put(self, path: list[str], query: dict, body: dict):
+        ds = self.server.dataset
+        now = round(time.time())
+
+        match path:
+            case ['new_model', _class]:
+                table = ds.individuals if _class == 'individuals' else ds.organizations
+                id = query['id'].upper()
+
+                table[id] = {
+                    "id": id,
+                    "_class": _class,
+                    "name": query['name'],
+                    "register_date": now,
+                    "zone": int(query.get('zone', 20)),
+                    "position": query.get('position', 'membre'),
+                    "additional": {},
+                    **({ "xp": 0, "boosts": {}, "votes": [] } if _class == 'individuals' else { "owner_id": id, "members": [], "certifications": {} })
+                }
+
+                return {}
+            case ['bank', 'register_account']:
+                id = ds.new_id()
+                ds.accounts[id] = { **body, "id": id, "owner_id": query['owner'], "register_date": now, "tag": body.get('tag', 'inconnu'), "flagged": False }
+
+                return { "id": id, "digicode": f"{random.randrange(0, 10 ** 8):08d}" }
+            case ['bank', 'register_inventory']:
+                id = ds.new_id()
+                ds.inventories[id] = { **body, "id": id, "owner_id": query['owner'], "register_date": now }
+
+                return { "id": id, "digicode": f"{random.randrange(0, 10 ** 8):08d}" }
+            case ['marketplace', 'register_item']:
+                id = ds.new_id()
+                ds.items[id] = { **body, "id": id }
+
+                return { "id": id }
+            case ['open_vote']:
+                id = ds.new_id()
+                ds.votes[id] = {
+                    "id": id,
+                    "title": body.get('title', ''),
+                    "author": "0",
+                    "start": now,
+                    "end": body.get('end_date', 0),
+                    "options": { option.get('id', str(i)): { "title": option.get('title', ''), "count": 0 } for i, option in enumerate(body.get('options', [])) }
+                }
+
+                return ds.votes[id]
+            case ['open_election']:
+                id = ds.new_id()
+                ds.elections[id] = { "id": id, "type": query.get('type', 'full'), "vote_id": query['vote'].upper() }
+
+                return ds.election(id)
+            case ['register_party']:
+                org = query['candidate'].upper()
+                ds.parties[org] = { "org_id": org, "color": body.get('color', 0), "motto": body.get('motto'), "politiscales": body.get('politiscales', {}), "last_election": None }
+
+                return ds.parties[org]
+            case ['elections', id, 'submit' | 'cancel_candidacy']:
+                return {} if id.upper() in ds.elections else None
+            case ['justice', 'submit_report']:
+                id = ds.new_id()
+                ds.reports[id] = { "id": id, "author": "0", "target": query["target"], "date": now, "status": "pending", "reason": body.get('reason'), "details": body.get('details') }
+
+                return ds.reports[id]
+            case ['justice', 'open_lawsuit']:
+                id = ds.new_id()
+                ds.lawsuits[id] = { "id": id, "target": query['target'], "judge": "0", "title": body.get('title'), "date": now, "report": query.get('report'), "private": 0, "status": 0 }
+
+                return ds.lawsuits[id]
+            case ['justice', 'add_sanction']:
+                id = ds.new_id()
+                ds.sanctions[id] = { "id": id, "target": query['target'], "type": query['type'], "date": int(query['date']), "duration": int(query.get('duration', 0)), "title": body.get('title'), "lawsuit": query.get('case', '0') }
+
+                return ds.sanctions[id]
+            case ['upload_file', bucket]:
+                name = body.get('name', ds.new_id())
+                ds.files[(bucket, name)] = body.get('_raw', b'')
+
+                return { "bucket": bucket, "name": name, "size": len(ds.files[(bucket, name)]) }
+
+
+class FakeNationDB(ThreadingHTTPServer):
+    """
+    Serveur NationDB local, lancé dans un thread.
+
+    ## Paramètres
+    size: `int` (optionnel)\n
+        Nombre d'individus du jeu de données
+    latency: `float` (optionnel)\n
+        Délai (secondes) ajouté à chaque requête
+    jitter: `float` (optionnel)\n
+        Délai aléatoire supplémentaire maximal (secondes)
+    etag: `bool` (optionnel)\n
+        Envoyer des `ETag` et répondre `304` aux requêtes conditionnelles
+    auth: `bool` (optionnel)\n
+        Refuser les requêtes sans token (`401`)
+    drop: `float` (optionnel)\n
+        Probabilité de couper la connexion sans répondre après avoir appliqué une écriture
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, size: int = 1000, latency: float = 0.0, jitter: float = 0.0, etag: bool = True, auth: bool = False, drop: float = 0.0, host: str = "127.0.0.1", port: int = 0, seed: int = 0) -> None:
+        self.dataset = Dataset(size, seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.etag = etag
+        self.auth = auth
+        self.drop = drop
+        self.idempotency: dict[str, tuple[int, typing.Any]] = {} # Réponses déjà envoyées, par clé d'idempotence
+
+        super().__init__((host, port), _Handler)
+
+        self._thread: threading.Thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_port}"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target = self.serve_forever, daemon = True)
+        self._thread.start()
+
+        return self.url
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> 'FakeNationDB':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+def _serve(queue: multiprocessing.Queue, kwargs: dict) -> None:
+    server = FakeNationDB(**kwargs)
+    queue.put(server.url)
+    server.serve_forever()
+
+def spawn(**kwargs) -> tuple[str, multiprocessing.Process]:
+    """
+    Lance un `FakeNationDB` dans un processus séparé, pour que le serveur ne partage pas le GIL avec le client mesuré. Les paramètres sont ceux de `FakeNationDB`.
+
+    ## Renvoie
+    - L'URL du serveur et son processus (à arrêter avec `terminate()`)
+    """
+
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target = _serve, args = (queue, kwargs), daemon = True)
+    process.start()
+
+    return queue.get(timeout = 60), process
+
+def main():
+    parser = argparse.ArgumentParser(description = "Serveur NationDB factice")
+    parser.add_argument("--size", type = int, default = 1000, help = "nombre d'individus")
+    parser.add_argument("--latency", type = float, default = 0, help = "latence ajoutée (ms)")
+    parser.add_argument("--jitter", type = float, default = 0, help = "latence aléatoire supplémentaire (ms)")
+    parser.add_argument("--port", type = int, default = 8000)
+    args = parser.parse_args()
+
+    server = FakeNationDB(args.size, args.latency / 1000, args.jitter / 1000, port = args.port)
+    print(f"NationDB factice sur {server.url} ({args.size} individus, {args.latency:.0f} ms)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
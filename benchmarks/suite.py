@@ -0,0 +1,222 @@
+"""
+Benchmark de bout en bout des quatre interfaces contre le serveur NationDB factice (`benchmarks.server`).
+
+Chaque scénario enchaîne des opérations réelles (`get_entity`, `fetch_accounts`, `debit`, `add_vote`...) depuis plusieurs threads et rapporte le débit et les latences p50/p99. Les résultats peuvent être enregistrés puis comparés à une référence pour détecter les régressions avant une publication.
+
+Usage : python -m benchmarks.suite [--size N] [--latency MS] [--ops N] [--concurrency N] [--only PRÉFIXE] [--save FICHIER] [--compare FICHIER] [--tolerance 0.2]
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+import nsarchive
+
+from .server import Dataset, spawn
+
+class Context:
+    """
+    Interfaces et IDs disponibles pour les scénarios.
+    """
+
+    def __init__(self, url: str, ds: Dataset, concurrency: int, seed: int = 0) -> None:
+        transport = lambda: nsarchive.Transport(pool_maxsize = concurrency)
+
+        self.rng = random.Random(seed)
+
+        self.entities = nsarchive.EntityInterface(url, "token", transport = transport())
+        self.economy = nsarchive.EconomyInterface(url, "token", transport = transport())
+        self.state = nsarchive.StateInterface(url, "token", transport = transport())
+        self.justice = nsarchive.JusticeInterface(url, "token", transport = transport())
+
+        self.individuals = list(ds.individuals)
+        self.organizations = list(ds.organizations)
+        self.accounts = [ id for id, _acc in ds.accounts.items() if not _acc['frozen'] ]
+        self.inventories = list(ds.inventories)
+        self.sales = list(ds.sales)
+        self.votes = list(ds.votes)
+        self.elections = list(ds.elections)
+        self.parties = list(ds.parties)
+        self.reports = list(ds.reports)
+        self.lawsuits = list(ds.lawsuits)
+        self.sanctions = list(ds.sanctions)
+
+        # Modèles déjà chargés pour les scénarios d'écriture
+        self.users = self.entities.get_entities(self.individuals[:50])
+        self.bank_accounts = self.economy.get_accounts(self.accounts[:50])
+        self.vote_models = [ self.state.get_vote(id) for id in self.votes[:10] ]
+
+    def pick(self, ids: list):
+        return self.rng.choice(ids)
+
+    def close(self) -> None:
+        for interface in (self.entities, self.economy, self.state, self.justice):
+            interface.transport.close()
+
+# Nom -> (fabrique de l'opération, part du nombre d'opérations)
+SCENARIOS: dict[str, tuple[callable, float]] = {
+    "entities.get_entity": (lambda ctx: lambda: ctx.entities.get_entity(ctx.pick(ctx.individuals)), 1),
+    "entities.get_organization": (lambda ctx: lambda: ctx.entities.get_entity(ctx.pick(ctx.organizations)), 1),
+    "entities.get_entities[20]": (lambda ctx: lambda: ctx.entities.get_entities(ctx.rng.sample(ctx.individuals, 20)), 0.1),
+    "entities.fetch_entities": (lambda ctx: lambda: ctx.entities.fetch_entities(_class = "individuals", position = "depute"), 0.05),
+    "entities.add_xp": (lambda ctx: lambda: ctx.pick(ctx.users).add_xp(10), 1),
+
+    "economy.get_account": (lambda ctx: lambda: ctx.economy.get_account(ctx.pick(ctx.accounts)), 1),
+    "economy.get_inventory": (lambda ctx: lambda: ctx.economy.get_inventory(ctx.pick(ctx.inventories)), 1),
+    "economy.get_sale": (lambda ctx: lambda: ctx.economy.get_sale(ctx.pick(ctx.sales)), 1),
+    "economy.fetch_accounts": (lambda ctx: lambda: ctx.economy.fetch_accounts(bank = "BanqueNationale"), 0.05),
+    "economy.fetch_accounts[columnar]": (lambda ctx: lambda: ctx.economy.fetch_accounts(columnar = True, bank = "BanqueNationale").total_supply(), 0.05),
+    "economy.debit": (lambda ctx: lambda: ctx.pick(ctx.bank_accounts).debit(1, target = ctx.pick(ctx.accounts)), 1),
+
+    "state.get_vote": (lambda ctx: lambda: ctx.state.get_vote(ctx.pick(ctx.votes)), 1),
+    "state.get_election": (lambda ctx: lambda: ctx.state.get_election(ctx.pick(ctx.elections)), 1),
+    "state.get_party": (lambda ctx: lambda: ctx.state.get_party(ctx.pick(ctx.parties)), 1),
+    "state.add_vote": (lambda ctx: lambda: ctx.pick(ctx.vote_models).add_vote("yes"), 1),
+
+    "justice.get_report": (lambda ctx: lambda: ctx.justice.get_report(ctx.pick(ctx.reports)), 1),
+    "justice.get_lawsuit": (lambda ctx: lambda: ctx.justice.get_lawsuit(ctx.pick(ctx.lawsuits)), 1),
+    "justice.get_sanction": (lambda ctx: lambda: ctx.justice.get_sanction(ctx.pick(ctx.sanctions)), 1),
+    "justice.submit_report": (lambda ctx: lambda: ctx.justice.submit_report(ctx.pick(ctx.individuals), reason = "benchmark"), 1)
+}
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def run(operation: callable, ops: int, concurrency: int) -> dict:
+    """
+    Exécute `ops` fois `operation` répartie sur `concurrency` threads.
+
+    ## Renvoie
+    - `dict` avec le débit (opérations par seconde), les latences p50/p99 (ms) et le nombre d'erreurs
+    """
+
+    latencies: list[float] = []
+    errors = [0]
+    remaining = iter(range(ops))
+    lock = threading.Lock()
+
+    def _worker():
+        local = []
+
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+
+            start = time.perf_counter()
+
+            try:
+                operation()
+            except Exception:
+                with lock:
+                    errors[0] += 1
+
+            local.append(time.perf_counter() - start)
+
+        with lock:
+            latencies.extend(local)
+
+    threads = [ threading.Thread(target = _worker) for _ in range(concurrency) ]
+
+    start = time.perf_counter()
+
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ops": ops,
+        "errors": errors[0],
+        "throughput": ops / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 0.5) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000
+    }
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """
+    Renvoie les scénarios dont le débit a baissé ou dont la latence p50 a augmenté de plus de `tolerance` (fraction) par rapport à la référence.
+    """
+
+    regressions = []
+
+    for name, res in results.items():
+        ref = baseline.get(name)
+
+        if ref is None:
+            continue
+
+        if res["throughput"] < ref["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: débit {res['throughput']:.0f}/s contre {ref['throughput']:.0f}/s")
+
+        if res["p50"] > ref["p50"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {res['p50']:.2f} ms contre {ref['p50']:.2f} ms")
+
+    return regressions
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark des interfaces nsarchive")
+    parser.add_argument("--size", type = int, default = 1000, help = "nombre d'individus du jeu de données")
+    parser.add_argument("--latency", type = float, default = 2, help = "latence ajoutée par le serveur (ms)")
+    parser.add_argument("--ops", type = int, default = 500, help = "nombre d'opérations par scénario")
+    parser.add_argument("--concurrency", type = int, default = 8, help = "nombre de threads")
+    parser.add_argument("--only", default = "", help = "ne lancer que les scénarios commençant par ce préfixe")
+    parser.add_argument("--save", help = "enregistrer les résultats (JSON)")
+    parser.add_argument("--compare", help = "comparer à des résultats enregistrés (JSON)")
+    parser.add_argument("--tolerance", type = float, default = 0.2, help = "écart toléré avant de signaler une régression")
+    args = parser.parse_args(argv)
+
+    results = {}
+
+    # Même graine que le serveur : le jeu de données local sert uniquement à connaître les IDs
+    url, process = spawn(size = args.size, latency = args.latency / 1000)
+
+    try:
+        ctx = Context(url, Dataset(args.size), args.concurrency)
+
+        print(f"{args.size} individus, {args.latency:.0f} ms de latence, {args.concurrency} threads\n")
+        print(f"{'scénario':<34} {'ops':>6} {'ops/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'erreurs':>8}")
+
+        for name, (factory, share) in SCENARIOS.items():
+            if not name.startswith(args.only):
+                continue
+
+            res = run(factory(ctx), max(1, int(args.ops * share)), args.concurrency)
+            results[name] = res
+
+            print(f"{name:<34} {res['ops']:>6} {res['throughput']:>9.1f} {res['p50']:>9.2f} {res['p99']:>9.2f} {res['errors']:>8}")
+
+        ctx.close()
+    finally:
+        process.terminate()
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent = 4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+
+        if regressions:
+            print("\nRégressions :")
+
+            for line in regressions:
+                print(f"- {line}")
+
+            return 1
+
+        print("\nAucune régression.")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
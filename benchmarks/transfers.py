@@ -0,0 +1,50 @@
+"""
+Compare une paie versée par `BankAccount.debit` séquentiels et par `EconomyInterface.transfer_many`, puis vérifie qu'aucun virement n'est appliqué deux fois lorsque le serveur coupe des connexions après avoir appliqué l'écriture.
+
+Usage : python -m benchmarks.transfers [nombre de virements] [latence (ms)] [taux de coupure]
+"""
+
+import sys
+import time
+
+import nsarchive
+
+from .server import FakeNationDB
+
+def main(count: int = 200, latency: float = 5, drop: float = 0.2):
+    with FakeNationDB(size = max(count * 2, 1000), latency = latency / 1000, drop = drop) as server:
+        ds = server.dataset
+        transport = nsarchive.Transport(pool_maxsize = 16, retry = nsarchive.RetryPolicy(retries = 10, backoff = 0.001), breaker = None)
+        economy = nsarchive.EconomyInterface(server.url, "token", transport = transport)
+
+        ids = [ id for id, _acc in ds.accounts.items() if not _acc['frozen'] ][:count + 1]
+        payer = economy.get_account(ids[0])
+        recipients = ids[1:]
+
+        server.drop = 0 # Les débits séquentiels ne peuvent pas être rejoués sans risque
+
+        start = time.perf_counter()
+
+        for target in recipients:
+            payer.debit(10, "salaire", target)
+
+        sequential = time.perf_counter() - start
+
+        server.drop = drop
+        before = { id: ds.accounts[id]['amount'] for id in ids }
+
+        start = time.perf_counter()
+        report = economy.transfer_many([ (payer, target, 10, "salaire") for target in recipients ])
+        batched = time.perf_counter() - start
+
+        applied = before[ids[0]] - ds.accounts[ids[0]]['amount']
+
+        print(f"{count} virements, latence {latency} ms, {drop:.0%} de réponses perdues\n")
+        print(f"{'debit séquentiels':<20} {sequential * 1000:>9.1f} ms")
+        print(f"{'transfer_many':<20} {batched * 1000:>9.1f} ms  x{sequential / batched:.1f}")
+        print(f"\n{sum(t.ok for t in report)}/{count} réussis, {applied // 10} appliqués, solde local {'cohérent' if payer.amount == ds.accounts[ids[0]]['amount'] else 'INCOHÉRENT'}")
+
+        transport.close()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200, float(sys.argv[2]) if len(sys.argv) > 2 else 5, float(sys.argv[3]) if len(sys.argv) > 3 else 0.2)
@@ -0,0 +1,65 @@
+"""
+Compare l'évaluation d'inventaires en parcourant les annonces de `fetch_sales` pour chaque objet, et avec un `PriceIndex` construit une fois puis mis à jour.
+
+Usage : python -m benchmarks.valuation [nombre d'individus] [inventaires évalués par l'ancienne méthode]
+"""
+
+import sys
+import time
+
+import nsarchive
+
+from .server import FakeNationDB
+
+def legacy_value(inventory: nsarchive.Inventory, sales: list[nsarchive.Sale]) -> float:
+    """
+    Valeur au prix moyen pondéré, en parcourant toutes les annonces pour chaque objet.
+    """
+
+    total = 0
+
+    for item, quantity in inventory.items.items():
+        lots = [ sale for sale in sales if sale.open and sale.item_id == item and sale.quantity > 0 ]
+
+        if lots:
+            total += quantity * sum(sale.price for sale in lots) / sum(sale.quantity for sale in lots)
+
+    return total
+
+def timed(fn: callable) -> tuple[float, object]:
+    start = time.perf_counter()
+    res = fn()
+
+    return time.perf_counter() - start, res
+
+def main(size: int = 5000, sample: int = 500):
+    with FakeNationDB(size = size) as server:
+        economy = nsarchive.EconomyInterface(server.url, "token")
+
+        inventories = economy.fetch_inventories()
+        sample = min(sample, len(inventories))
+
+        fetch, sales = timed(lambda: economy.fetch_sales())
+        legacy, expected = timed(lambda: [ legacy_value(inventory, sales) for inventory in inventories[:sample] ])
+        legacy = fetch + legacy * len(inventories) / sample
+
+        build, index = timed(lambda: economy.build_price_index())
+        valuation, values = timed(lambda: index.values(inventories))
+
+        assert all(abs(a - b) <= 1e-6 * max(1, b) for a, b in zip(values.tolist(), expected))
+
+        for id in list(server.dataset.sales)[:10]:
+            server.dataset.sales[id]['open'] = False
+
+        refresh, changed = timed(lambda: economy.refresh_price_index(index))
+
+        print(f"{len(inventories)} inventaires, {len(sales)} annonces, {len(index)} objets\n")
+        print(f"{'fetch_sales + parcours':<24} {legacy * 1000:>9.1f} ms  (extrapolé depuis {sample} inventaires)")
+        print(f"{'build_price_index':<24} {build * 1000:>9.1f} ms")
+        print(f"{'values':<24} {valuation * 1000:>9.1f} ms  x{legacy / (build + valuation):.0f} avec la construction")
+        print(f"{'refresh_price_index':<24} {refresh * 1000:>9.1f} ms  ({changed} objets recalculés)")
+
+        economy.transport.close()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000, int(sys.argv[2]) if len(sys.argv) > 2 else 500)
@@ -9,6 +9,9 @@ Auteur : happex <110610727+okayhappex@users.noreply.github.com>
 Dependencies:
 - Python ^3.10
 - pillow ^10.4
+- aiohttp ^3.9 (optionnel, interfaces asynchrones)
+- orjson ^3.9 ou msgspec (optionnel, décodage JSON plus rapide)
+- numpy >=1.24 (optionnel, analyses par colonnes)
 
 Le fichier README.md fournit des détails supplémentaires pour l'utilisation.
 """
@@ -25,8 +28,15 @@ from .models.justice import *
 from .models.scale import *
 
 # Import des interfaces
-from .models.base import Interface
+from .models.base import Interface, Transport, Cache, SnapshotStore, ValidatorStore, SingleFlight, RetryPolicy, CircuitBreaker, CircuitOpenError, Metrics, JSONCodec
 from .interfaces._entities import EntityInterface
 from .interfaces._economy import EconomyInterface
 from .interfaces._state import StateInterface
-from .interfaces._justice import JusticeInterface
\ No newline at end of file
+from .interfaces._justice import JusticeInterface
+
+# Import des interfaces asynchrones
+from .models.base import AsyncInterface
+from .interfaces._async_entities import AsyncEntityInterface
+from .interfaces._async_economy import AsyncEconomyInterface
+from .interfaces._async_state import AsyncStateInterface
+from .interfaces._async_justice import AsyncJusticeInterface
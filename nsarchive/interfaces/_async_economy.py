@@ -0,0 +1,365 @@
+from ..models.base import *
+from ..models.economy import *
+
+from ._economy import EconomyInterface
+
+class AsyncEconomyInterface(AsyncInterface, EconomyInterface):
+    """
+    Équivalent asynchrone de `.EconomyInterface`. Toutes les méthodes réseau doivent être attendues (`await`).
+
+    Les modèles renvoyés sont les mêmes que ceux de l'interface synchrone. Leurs méthodes asynchrones sont préfixées par `a` (`adebit`, `adeposit`, `afreeze`...).
+    """
+
+    """
+    ---- COMPTES EN BANQUE ----
+    """
+
+    async def get_account(self, id: NSID) -> BankAccount:
+        """
+        Récupère les informations d'un compte bancaire.
+
+        ## Paramètres
+        id: `NSID`\n
+            ID du compte.
+
+        ## Renvoie
+        - `.BankAccount`
+        """
+
+        id = NSID(id)
+        _data = await self._get_cached('accounts', id, f"{self.url}/bank/accounts/{id}")
+
+        if _data is None:
+            return None
+
+        return self._load_account(_data)
+
+    async def get_accounts(self, ids: list[NSID], max_workers: int = None) -> list[BankAccount]:
+        """
+        Récupère plusieurs comptes en parallèle.
+
+        ## Paramètres
+        ids: `list[NSID]`\n
+            IDs des comptes à récupérer
+        max_workers: `int` (optionnel)\n
+            Nombre maximal de requêtes simultanées
+
+        ## Renvoie
+        - `list[.BankAccount]` dans l'ordre des IDs, avec `None` pour les comptes introuvables
+        """
+
+        return await self._get_many(self.get_account, ids, max_workers)
+
+    async def save_account(self, account: BankAccount) -> str:
+        """
+        Sauvegarde un compte bancaire dans la base de données.
+
+        ## Paramètres
+        - account: `.BankAccount`\n
+            Compte à sauvegarder
+        """
+
+        _data = self._account_payload(account)
+
+        res = await self._request_json('PUT', f"{self.url}/bank/register_account?owner={_data['owner_id']}", _data)
+
+        return self._registered(account, f"/bank/accounts/{account.id}", res)
+
+    async def fetch_accounts(self, columnar: bool = False, **query: typing.Any) -> list[BankAccount] | AccountFrame:
+        """
+        Récupère une liste de comptes en banque en fonction d'une requête.
+
+        ## Paramètres
+        columnar: `bool` (optionnel)\n
+            Renvoie les comptes par colonnes (`.AccountFrame`, nécessite numpy) sans construire d'objet `.BankAccount`
+        query: `**dict`\n
+            La requête pour filtrer les comptes.
+
+        ## Renvoie
+        - `list[.BankAccount]`
+        - `.AccountFrame` si `columnar` est vrai
+        """
+
+        if columnar:
+            # Les comptes lus en flux vont directement dans les colonnes
+            add, build = AccountFrame.builder()
+
+            async for _data in self.iter_fetch('accounts', **query):
+                add(_data)
+
+            return build()
+
+        _data = await self._fetch_rows('accounts', **query)
+
+        return self._load_rows(_data, self._load_account)
+
+    async def iter_accounts(self, **query: typing.Any) -> typing.AsyncIterator[BankAccount]:
+        """
+        Parcourt les comptes en banque correspondant à une requête sans charger la liste complète en mémoire.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les comptes en banque.
+
+        ## Renvoie
+        - `AsyncIterator[.BankAccount]`
+        """
+
+        async for _data in self.iter_fetch('accounts', **query):
+            yield self._load_account(_data)
+
+    def reconcile_accounts(self, mirror: LedgerMirror, page_size: int = 1000, **query: typing.Any) -> Reconciliation:
+        """
+        Équivalent asynchrone de `EconomyInterface.reconcile_accounts`, à parcourir avec `async for` ou à exécuter avec `arun`.
+        """
+
+        return Reconciliation(mirror, self.iter_fetch('accounts', **query), page_size)
+
+    async def transfer_many(self, transfers: list[tuple | Transfer], max_workers: int = None, digicode: str = None) -> list[Transfer]:
+        """
+        Équivalent asynchrone de `EconomyInterface.transfer_many`.
+        """
+
+        items, accounts = self._prepare_transfers(transfers)
+        semaphore = asyncio.Semaphore(max_workers or self.transport.pool_maxsize)
+
+        async def _transfer(transfer: Transfer) -> None:
+            try:
+                url, kwargs = self._transfer_request(transfer, digicode)
+
+                async with semaphore:
+                    res = await self.transport.apost(url, **kwargs)
+
+                self._apply_transfer(transfer, res, accounts)
+            except Exception as e:
+                transfer.error = e
+
+        await asyncio.gather(*( _transfer(transfer) for transfer in items ))
+
+        return items
+
+    """
+    ---- INVENTAIRES ----
+    """
+
+    async def get_inventory(self, id: NSID) -> Inventory:
+        """
+        Récupère les informations d'un inventaire.
+
+        ## Paramètres
+        id: `NSID`\n
+            ID de l'inventaire.
+
+        ## Renvoie
+        - `.Inventory`
+        """
+
+        id = NSID(id)
+        _data = await self._get_cached('inventories', id, f"{self.url}/bank/inventories/{id}")
+
+        if _data is None:
+            return None
+
+        return self._load_inventory(_data)
+
+    async def get_inventories(self, ids: list[NSID], max_workers: int = None) -> list[Inventory]:
+        """
+        Récupère plusieurs inventaires en parallèle.
+
+        ## Paramètres
+        ids: `list[NSID]`\n
+            IDs des inventaires à récupérer
+        max_workers: `int` (optionnel)\n
+            Nombre maximal de requêtes simultanées
+
+        ## Renvoie
+        - `list[.Inventory]` dans l'ordre des IDs, avec `None` pour les inventaires introuvables
+        """
+
+        return await self._get_many(self.get_inventory, ids, max_workers)
+
+    async def save_inventory(self, inventory: Inventory) -> str:
+        """
+        Sauvegarde un inventaire dans la base de données.
+
+        ## Paramètres
+        - inventory: `.Inventory`\n
+            Inventaire à sauvegarder
+        """
+
+        _data = inventory._export()
+
+        res = await self._request_json('PUT', f"{self.url}/bank/register_inventory?owner={_data['owner_id']}", _data)
+
+        return self._registered(inventory, f"/bank/inventories/{inventory.id}", res)
+
+    async def fetch_inventories(self, **query: typing.Any) -> list[Inventory]:
+        """
+        Récupère une liste d'inventaires en fonction d'une requête.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les inventaires.
+
+        ## Renvoie
+        - `list[.Inventory]`
+        """
+
+        _data = await self._fetch_rows('inventories', **query)
+
+        return self._load_rows(_data, self._load_inventory)
+
+    async def iter_inventories(self, **query: typing.Any) -> typing.AsyncIterator[Inventory]:
+        """
+        Parcourt les inventaires correspondant à une requête sans charger la liste complète en mémoire.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les inventaires.
+
+        ## Renvoie
+        - `AsyncIterator[.Inventory]`
+        """
+
+        async for _data in self.iter_fetch('inventories', **query):
+            yield self._load_inventory(_data)
+
+    """
+    ---- ITEMS ----
+    """
+
+    async def get_item(self, id: NSID) -> Item:
+        """
+        Récupère les informations d'un item.
+
+        ## Paramètres
+        id: `NSID`\n
+            ID de l'item.
+
+        ## Renvoie
+        - `.Item`
+        """
+
+        id = NSID(id)
+        _data = await self._get_cached('items', id, f"{self.url}/marketplace/items/{id}")
+
+        if _data is None:
+            return None
+
+        return self._load_item(_data)
+
+    async def save_item(self, item: Item) -> None:
+        """
+        Sauvegarde un item dans le marketplace.
+
+        ## Paramètres
+        - item: `.Item`\n
+            Item à sauvegarder
+        """
+
+        _data = item._export()
+
+        res = await self._request_json('PUT', f"{self.url}/marketplace/register_item", _data)
+
+        self._registered(item, f"/bank/inventories/{item.id}", res)
+
+    async def fetch_items(self, **query: typing.Any) -> list[Item]:
+        """
+        Récupère une liste d'items en fonction d'une requête.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les items.
+
+        ## Renvoie
+        - `list[.Item]`
+        """
+
+        _data = await self._fetch_rows('items', **query)
+
+        return self._load_rows(_data, self._load_item)
+
+    async def iter_items(self, **query: typing.Any) -> typing.AsyncIterator[Item]:
+        """
+        Parcourt les items correspondant à une requête sans charger la liste complète en mémoire.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les items.
+
+        ## Renvoie
+        - `AsyncIterator[.Item]`
+        """
+
+        async for _data in self.iter_fetch('items', **query):
+            yield self._load_item(_data)
+
+
+    """
+    ---- VENTES ----
+    """
+
+    async def get_sale(self, id: NSID) -> Sale:
+        """
+        Récupère les informations d'une annonce.
+
+        ## Paramètres
+        id: `NSID`\n
+            ID de la annonce.
+
+        ## Renvoie
+        - `.Sale`
+        """
+
+        id = NSID(id)
+        _data = await self._get_cached('sales', id, f"{self.url}/marketplace/sales/{id}")
+
+        if _data is None:
+            return None
+
+        return self._load_sale(_data)
+
+    async def fetch_sales(self, **query: typing.Any) -> list[Sale]:
+        """
+        Récupère une liste d'annonces en fonction d'une requête.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les annonces.
+
+        ## Renvoie
+        - `list[.Sale]`
+        """
+
+        _data = await self._fetch_rows('sales', **query)
+
+        return self._load_rows(_data, self._load_sale)
+
+    async def iter_sales(self, **query: typing.Any) -> typing.AsyncIterator[Sale]:
+        """
+        Parcourt les annonces correspondant à une requête sans charger la liste complète en mémoire.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les annonces.
+
+        ## Renvoie
+        - `AsyncIterator[.Sale]`
+        """
+
+        async for _data in self.iter_fetch('sales', **query):
+            yield self._load_sale(_data)
+
+    async def build_price_index(self, **query: typing.Any) -> PriceIndex:
+        """
+        Équivalent asynchrone de `EconomyInterface.build_price_index`.
+        """
+
+        return PriceIndex([ _data async for _data in self.iter_fetch('sales', **query) ])
+
+    async def refresh_price_index(self, index: PriceIndex, **query: typing.Any) -> int:
+        """
+        Équivalent asynchrone de `EconomyInterface.refresh_price_index`.
+        """
+
+        return index.refresh([ _data async for _data in self.iter_fetch('sales', **query) ])
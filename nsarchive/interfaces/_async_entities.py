@@ -0,0 +1,186 @@
+from ..models.base import *
+from ..models.entities import *
+
+from ._entities import EntityInterface
+
+class AsyncEntityInterface(AsyncInterface, EntityInterface):
+    """
+    Équivalent asynchrone de `.EntityInterface`. Toutes les méthodes réseau doivent être attendues (`await`).
+
+    Les modèles renvoyés sont les mêmes que ceux de l'interface synchrone. Leurs méthodes asynchrones sont préfixées par `a` (`aset_name`, `aadd_xp`, `aadd_member`...).
+    """
+
+    """
+    ---- ENTITÉS ----
+    """
+
+    async def get_entity(self, id: NSID, _class: str = None) -> User | Organization | Entity:
+        """
+        Fonction permettant de récupérer le profil public d'une entité.\n
+
+        ## Paramètres
+        id: `NSID`
+            ID héxadécimal de l'entité à récupérer
+        _class: `str`
+            Classe du modèle à prendre (`.User` ou `.Organization`)
+
+        ## Renvoie
+        - `.User` dans le cas où l'entité choisie est un membre
+        - `.Organization` dans le cas où c'est un groupe
+        - `.Entity` dans le cas où c'est indéterminé
+        """
+
+        _data = await self._get_by_ID(self._ENTITY_CLASSES.get(_class, 'entities'), NSID(id))
+
+        if _data is None: # ID inexistant chez les entités
+            return None
+
+        return self._load_entity(_data)
+
+    async def get_entities(self, ids: list[NSID], _class: str = None, max_workers: int = None) -> list[User | Organization | Entity]:
+        """
+        Récupère plusieurs entités en parallèle.
+
+        ## Paramètres
+        ids: `list[NSID]`
+            IDs des entités à récupérer
+        _class: `str`
+            Classe du modèle à prendre (`.User` ou `.Organization`)
+        max_workers: `int` (optionnel)
+            Nombre maximal de requêtes simultanées
+
+        ## Renvoie
+        - `list[.User | .Organization | .Entity]` dans l'ordre des IDs, avec `None` pour les entités introuvables
+        """
+
+        return await self._get_many(lambda id: self.get_entity(id, _class), ids, max_workers)
+
+    async def create_entity(self, id: NSID, name: str, _class: str, position: str = 'membre', zone: int = 10):
+        """
+        Fonction permettant de créer ou modifier une entité.
+
+        ## Paramètres
+        - id (`NSID`): Identifiant NSID
+        - name (`str`): Nom d'usage
+        - _class (`"user"` ou `"group"`): Type de l'entité
+        - position (`str`, optionnel): ID de la position civile
+        - zone (`int`, optionnel): ID de la zone civile
+        """
+
+        id = NSID(id)
+        _class = self._MODEL_CLASSES.get(_class)
+
+        if _class is None:
+            return
+
+        await self._put_in_db(
+            f"/new_model/{_class}?id={id}&name={name}&position={position}&zone={zone}",
+            headers = self.default_headers,
+            use_PUT = True
+        )
+
+        if self.cache is not None:
+            self.cache.invalidate(_class, id)
+
+        if self.snapshots is not None:
+            self.snapshots.invalidate(_class, id)
+            self.snapshots.invalidate_fetches(_class)
+
+        return self._bind_created(await self.get_entity(id), _class)
+
+    async def delete_entity(self, entity: Entity):
+        """
+        Fonction permettant de supprimer le profil d'une entité
+
+        ## Paramètres
+        entity: `.Entity`\n
+            L'entité à supprimer
+        """
+
+        await self._request_json('POST', f"{entity._url}/delete")
+
+    async def fetch_entities(self, **query: typing.Any) -> list[ Entity | User | Organization ]:
+        """
+        Récupère une liste d'entités en fonction d'une requête.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les entités.
+
+        ## Renvoie
+        - `list[.Entity | .User | .Organization]`, dont la position, les infos supplémentaires, les votes, le propriétaire et les membres ne sont construits qu'à leur première lecture si `self.lazy` est activé
+        """
+
+        return self._load_entities(await self.fetch(self._fetch_class(query), **query))
+
+    async def iter_entities(self, **query: typing.Any) -> typing.AsyncIterator[ Entity | User | Organization ]:
+        """
+        Parcourt les entités correspondant à une requête sans charger la liste complète en mémoire.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les entités.
+
+        ## Renvoie
+        - `AsyncIterator[.Entity | .User | .Organization]`
+        """
+
+        async for _entity in self.iter_fetch(self._fetch_class(query), **query):
+            yield self._load_entity(_entity, self.lazy)
+
+    async def build_index(self, **query: typing.Any) -> EntityIndex:
+        """
+        Équivalent asynchrone de `EntityInterface.build_index`.
+        """
+
+        self._attach('index', EntityIndex(query = query))
+
+        async for _ in self.iter_entities(**query):
+            pass
+
+        return self.index
+
+    async def build_leaderboard(self, **query: typing.Any) -> Leaderboard:
+        """
+        Équivalent asynchrone de `EntityInterface.build_leaderboard`.
+        """
+
+        self._attach('leaderboard', Leaderboard(query = query))
+
+        async for _ in self.iter_entities(_class = 'individuals', **query):
+            pass
+
+        return self.leaderboard
+
+    async def get_position(self, id: str) -> Position:
+        """
+        Récupère une position légale (métier, domaine professionnel).
+
+        ## Paramètres
+        id: `str`\n
+            ID de la position (SENSIBLE À LA CASSE !)
+
+        ## Renvoie
+        - `.Position` modifiable, propre à l'appelant (le catalogue `self.positions` est mis à jour au passage)
+        """
+
+        _data = await self._get_by_ID('positions', id)
+
+        if _data is None:
+            return None
+
+        return self._load_position(_data).copy()
+
+    async def fetch_positions(self, **query: typing.Any) -> list[Position]:
+        """
+        Récupère une liste de positions en fonction d'une requête. Les positions reçues sont ajoutées au catalogue `self.positions`, ou y remplacent en place les données des positions déjà connues : appeler `fetch_positions()` sans filtre charge ou rafraîchit tout le catalogue.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les positions.
+
+        ## Renvoie
+        - `list[.Position]`, partagées avec les entités chargées par l'interface
+        """
+
+        return self._load_rows(await self.fetch('positions', **query), self._load_position)
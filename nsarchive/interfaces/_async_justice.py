@@ -0,0 +1,63 @@
+from ..models.base import *
+from ..models.justice import *
+
+from ._justice import JusticeInterface
+
+class AsyncJusticeInterface(AsyncInterface, JusticeInterface):
+    """
+    Équivalent asynchrone de `.JusticeInterface`. Toutes les méthodes réseau doivent être attendues (`await`).
+    """
+
+    """
+    SIGNALEMENTS
+    """
+
+    async def get_report(self, id: NSID) -> Report:
+        return self._load_report(await self._request_json('GET', f"{self.url}/justice/reports/{id}"))
+
+    async def submit_report(self, target: NSID, reason: str = None, details: str = None) -> Report:
+        _data = await self._request_json('PUT', f"{self.url}/justice/submit_report?target={target}", self._report_payload(reason, details))
+
+        return self._load_report(_data)
+
+    """
+    PROCÈS
+    """
+
+    async def get_lawsuit(self, id: NSID) -> Lawsuit:
+        return self._load_lawsuit(await self._request_json('GET', f"{self.url}/justice/lawsuits/{id}"))
+
+    async def open_lawsuit(self, target: NSID, title: str = None, report: Report = None) -> Lawsuit:
+        _data = await self._request_json('PUT', self._lawsuit_url(target, report), self._title_payload(title))
+
+        return self._load_lawsuit(_data)
+
+    """
+    SANCTIONS
+    """
+
+    async def get_sanction(self, id: NSID) -> Sanction:
+        id = NSID(id)
+
+        return self._load_sanction(await self._get_cached('sanctions', id, f"{self.url}/justice/sanctions/{id}"))
+
+    async def get_sanctions(self, ids: list[NSID], max_workers: int = None) -> list[Sanction]:
+        """
+        Récupère plusieurs sanctions en parallèle.
+
+        ## Paramètres
+        ids: `list[NSID]`\n
+            IDs des sanctions à récupérer
+        max_workers: `int` (optionnel)\n
+            Nombre maximal de requêtes simultanées
+
+        ## Renvoie
+        - `list[.Sanction]` dans l'ordre des IDs, avec `None` pour les sanctions introuvables
+        """
+
+        return await self._get_many(self.get_sanction, ids, max_workers)
+
+    async def add_sanction(self, target: NSID, _type: str, duration: int = None, title: str = None, lawsuit: Lawsuit = None) -> Sanction:
+        _data = await self._request_json('PUT', self._sanction_url(target, _type, duration, lawsuit), self._title_payload(title))
+
+        return self._load_sanction(_data)
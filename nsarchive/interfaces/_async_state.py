@@ -0,0 +1,120 @@
+from ..models.base import *
+from ..models.republic import *
+from ..models.state import *
+from ..models.scale import *
+
+from ._state import StateInterface
+
+class AsyncStateInterface(AsyncInterface, StateInterface):
+    """
+    Équivalent asynchrone de `.StateInterface`. Toutes les méthodes réseau doivent être attendues (`await`).
+
+    Les modèles renvoyés sont les mêmes que ceux de l'interface synchrone. Leurs méthodes asynchrones sont préfixées par `a` (`aadd_vote`, `aclose`...).
+    """
+
+    """
+    ---- VOTES ----
+    """
+
+    async def get_vote(self, id: NSID) -> Vote:
+        """
+        Récupère un vote.
+
+        ## Paramètres
+        id: `NSID`\n
+            ID du vote.
+
+        ## Renvoie
+        - `.Vote`
+        """
+
+        _data = await self._get_optional(f"{self.url}/votes/{NSID(id)}")
+
+        return self._load_vote(_data) if _data else None
+
+    async def open_vote(self, title: str = None, options: list[dict] = [], end: int = 0) -> Vote:
+        """
+        Déclenche un vote dans la base de données.
+
+        ## Paramètres
+        - title: `str`\n
+            Titre du vote
+        - options: list[dict]\n
+            Liste des choix disponibles
+        - end: `int`\n
+            Fin du vote (timestamp)
+        """
+
+        return self._load_vote(await self._request_json('PUT', f"{self.url}/open_vote", self._vote_payload(title, options, end)))
+
+    async def get_election(self, id: NSID) -> Election:
+        """
+        Récupère une élection.
+
+        ## Paramètres
+        id: `NSID`\n
+            ID de l'élection.
+
+        ## Renvoie
+        - `.Election`
+        """
+
+        return self._load_election(await self._request_json('GET', f"{self.url}/elections/{NSID(id)}"))
+
+    async def open_election(self, vote: Vote, start: int = None, full: bool = False) -> Election:
+        """
+        Déclenche une élection dans la base de données.
+
+        ## Paramètres
+        - vote: `.Vote`\n
+            Vote associé
+        - start: `int` (optionnel)\n
+            Date de début du vote (timestamp, dure 4 jours)
+        - full: `bool` (optionnel)\n
+            Choix du type d'élections (True = présidentielles, False = législatives)
+        """
+
+        return self._load_election(await self._request_json('PUT', f"{self.url}/open_election?vote={vote.id}&type={'full' if full else 'partial'}{('&date=' + str(start)) if start else ''}", {}))
+
+    """
+    PARTIS
+    """
+
+    async def get_party(self, id: NSID) -> Party:
+        """
+        Récupère un parti politique.
+
+        ## Paramètres
+        id: `NSID`\n
+            ID du parti.
+
+        ## Renvoie
+        - `.Party`
+        """
+
+        id = NSID(id)
+
+        return self._load_party(await self._get_cached('parties', id, f"{self.url}/parties/{id}", conditional = True))
+
+    async def register_party(self, id: NSID, color: int, motto: str = None, scale: dict | Scale = {}) -> Party:
+        """
+        Enregistre un nouveau parti pour que ses députés puissent s'y présenter.
+
+        ## Paramètres
+        - id: `NSID`\n
+            ID de l'entreprise à laquelle correspond le parti
+        - color: `int`\n
+            Couleur du parti
+        - motto: `str, optional`\n
+            Devise du parti
+        - politiscales: `.Scale`\n
+            Résultats du parti au test Politiscales
+        """
+
+        payload = {
+            "color": color,
+            "motto": motto,
+            "scale": scale if isinstance(scale, dict) else scale._to_dict()
+        }
+
+        return self._load_party(await self._request_json('PUT', f"{self.url}/register_party?candidate={id}", payload))
@@ -8,8 +8,8 @@ from ..models import economy # Pour les default_headers
 class EconomyInterface(Interface):
     """Interface qui vous permettra d'interagir avec les comptes en banque et les transactions économiques."""
 
-    def __init__(self, url: str, token: str) -> None:
-        super().__init__(url, token)
+    def __init__(self, url: str, token: str, transport: Transport = None, cache: Cache = None, snapshots: SnapshotStore = None) -> None:
+        super().__init__(url, token, transport, cache, snapshots)
 
         economy.default_headers = self.default_headers
 
@@ -30,22 +30,35 @@ class EconomyInterface(Interface):
         """
 
         id = NSID(id)
-        res = requests.get(f"{self.url}/bank/accounts/{id}", headers = self.default_headers)
-
-        if res.status_code == 200:
-            _data = res.json()
-        else:
-            res.raise_for_status()
-            return
+        _data = self._get_cached('accounts', id, f"{self.url}/bank/accounts/{id}")
 
         if _data is None:
             return None
 
-        account = BankAccount(id)
-        account._load(_data, self.url, self.default_headers)
+        return self._load_account(_data)
+
+    def _load_account(self, _data: dict) -> BankAccount:
+        account = BankAccount(_data['owner_id'])
+        account._load(_data, self)
 
         return account
 
+    def get_accounts(self, ids: list[NSID], max_workers: int = None) -> list[BankAccount]:
+        """
+        Récupère plusieurs comptes en parallèle.
+
+        ## Paramètres
+        ids: `list[NSID]`\n
+            IDs des comptes à récupérer
+        max_workers: `int` (optionnel)\n
+            Nombre maximal de requêtes simultanées
+
+        ## Renvoie
+        - `list[.BankAccount]` dans l'ordre des IDs, avec `None` pour les comptes introuvables
+        """
+
+        return self._get_many(self.get_account, ids, max_workers)
+
     def save_account(self, account: BankAccount) -> str:
         """
         Sauvegarde un compte bancaire dans la base de données.
@@ -55,60 +68,183 @@ class EconomyInterface(Interface):
             Compte à sauvegarder
         """
 
-        _data = {
+        _data = self._account_payload(account)
+
+        res = self._request_json('PUT', f"{self.url}/bank/register_account?owner={_data['owner_id']}", _data)
+
+        return self._registered(account, f"/bank/accounts/{account.id}", res)
+
+    @staticmethod
+    def _account_payload(account: BankAccount) -> dict:
+        return {
             'id': NSID(account.id),
             'amount': account.amount,
-            'frozen': account.frozen, 
-            'owner_id': account.owner_id, 
+            'frozen': account.frozen,
+            'owner_id': account.owner_id,
             'bank': account.bank,
             'income': account.income
         }
 
-        res = requests.put(f"{self.url}/bank/register_account?owner={_data['owner_id']}", headers = self.default_headers, json = _data)
+    def _registered(self, model: BankAccount | Inventory | Item, path: str, _data: dict) -> str | None:
+        """
+        Associe un modèle enregistré à l'interface et lui attribue l'ID renvoyé par le serveur.
+
+        ## Renvoie
+        - `str` : digicode du compte ou de l'inventaire, `None` pour un item
+        """
 
-        if res.status_code == 200:
-            account._url = f"{self.url}/bank/accounts/{account.id}"
-            account.id = res.json()['id']
+        model._bind(self, path)
+        model.id = _data['id']
 
-            return res.json()['digicode']
-        else:
-            res.raise_for_status()
+        return _data.get('digicode')
 
-    def fetch_accounts(self, **query: typing.Any) -> list[BankAccount]:
+    def fetch_accounts(self, columnar: bool = False, **query: typing.Any) -> list[BankAccount] | AccountFrame:
         """
         Récupère une liste de comptes en banque en fonction d'une requête.
 
         ## Paramètres
+        columnar: `bool` (optionnel)\n
+            Renvoie les comptes par colonnes (`.AccountFrame`, nécessite numpy) sans construire d'objet `.BankAccount`
         query: `**dict`\n
             La requête pour filtrer les comptes.
 
         ## Renvoie
         - `list[.BankAccount]`
+        - `.AccountFrame` si `columnar` est vrai
         """
 
-        query = "&".join(f"{k}={ urllib.parse.quote(v) }" for k, v in query.items())
+        if columnar:
+            # Les comptes lus en flux vont directement dans les colonnes
+            return AccountFrame.from_rows(self.iter_fetch('accounts', **query))
 
-        _res = requests.get(f"{self.url}/fetch/accounts?{query}", headers = self.default_headers)
+        _data = self._fetch_rows('accounts', **query)
 
-        if _res.status_code == 200:
-            _data = _res.json()
-        else:
-            _res.raise_for_status()
-            return []
+        return self._load_rows(_data, self._load_account)
 
-        res = []
+    def iter_accounts(self, **query: typing.Any) -> typing.Iterator[BankAccount]:
+        """
+        Parcourt les comptes en banque correspondant à une requête sans charger la liste complète en mémoire.
 
-        for _acc in _data:
-            if not _acc: continue
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les comptes en banque.
 
-            account = BankAccount(_acc["owner_id"])
+        ## Renvoie
+        - `Iterator[.BankAccount]`
+        """
 
-            account.id = NSID(_acc['id'])
-            account._load(_acc, self.url, self.default_headers)
+        for _data in self.iter_fetch('accounts', **query):
+            yield self._load_account(_data)
+
+    def reconcile_accounts(self, mirror: LedgerMirror, page_size: int = 1000, **query: typing.Any) -> Reconciliation:
+        """
+        Compare en flux les comptes en banque de NationDB avec un miroir local.
+
+        ## Paramètres
+        mirror: `.LedgerMirror`\n
+            Miroir des comptes, qui garde d'une exécution à l'autre l'empreinte de chaque page
+        page_size: `int` (optionnel)\n
+            Nombre de comptes par page
+        query: `**dict`\n
+            La requête pour filtrer les comptes en banque
+
+        ## Renvoie
+        - `.Reconciliation`, à parcourir page par page ou à exécuter d'un coup (`run`)
+        """
+
+        return Reconciliation(mirror, self.iter_fetch('accounts', **query), page_size)
+
+    def transfer_many(self, transfers: list[tuple | Transfer], max_workers: int = None, digicode: str = None) -> list[Transfer]:
+        """
+        Effectue plusieurs virements en parallèle.
+
+        Chaque virement porte une clé d'idempotence générée par le client : il peut être rejoué sans risque, par le transport après une coupure réseau ou par un nouvel appel avec les `.Transfer` renvoyés (`transfer_many([ t for t in report if not t.ok ])`). Les `.BankAccount` passés en source ou en destination voient leur `amount` mis à jour à chaque virement réussi.
+
+        ## Paramètres
+        transfers: `list[tuple | .Transfer]`\n
+            Virements `(source, target, amount, reason)`, avec éventuellement une clé d'idempotence en cinquième élément. `source` et `target` sont des `.BankAccount` ou des IDs de comptes.
+        max_workers: `int` (optionnel)\n
+            Nombre maximal de virements simultanés (par défaut la taille du pool de connexions)
+        digicode: `str` (optionnel)\n
+            Digicode des comptes débités
+
+        ## Renvoie
+        - `list[.Transfer]` dans l'ordre des virements, avec le code de réponse et l'éventuelle erreur de chacun
+        """
+
+        items, accounts = self._prepare_transfers(transfers)
+        lock = threading.Lock()
+
+        def _transfer(transfer: Transfer) -> None:
+            # Toute erreur est inscrite sur son virement : les autres ont pu être appliqués, le bilan doit être complet
+            try:
+                url, kwargs = self._transfer_request(transfer, digicode)
+                res = self.transport.post(url, **kwargs)
+
+                with lock:
+                    self._apply_transfer(transfer, res, accounts)
+            except Exception as e:
+                transfer.error = e
+
+        if items:
+            with concurrent.futures.ThreadPoolExecutor(max_workers = min(max_workers or self.transport.pool_maxsize, len(items))) as executor:
+                list(executor.map(_transfer, items))
+
+        return items
+
+    @staticmethod
+    def _prepare_transfers(transfers: list[tuple | Transfer]) -> tuple[list[Transfer], dict[NSID, list[BankAccount]]]:
+        items = []
+        accounts: dict[NSID, list[BankAccount]] = {} # Modèles locaux à tenir à jour, par ID de compte
+
+        for transfer in transfers:
+            if not isinstance(transfer, Transfer):
+                source, target, *rest = transfer
+
+                for account in (source, target):
+                    if isinstance(account, BankAccount):
+                        models = accounts.setdefault(NSID(account.id), [])
+
+                        if not any(model is account for model in models):
+                            models.append(account)
+
+                transfer = Transfer(*( account.id if isinstance(account, BankAccount) else account for account in (source, target) ), *rest)
+            else:
+                transfer.status = None
+                transfer.error = None
+
+            items.append(transfer)
+
+        return items, accounts
+
+    def _transfer_request(self, transfer: Transfer, digicode: str = None) -> tuple[str, dict]:
+        url = f"{self.url}/bank/accounts/{transfer.source}/debit?amount={transfer.amount}&target={transfer.target}"
+
+        return url, {
+            "headers": { **self.default_headers, 'Idempotency-Key': transfer.key },
+            "json": {
+                "reason": transfer.reason,
+                "digicode": digicode
+            }
+        }
+
+    @staticmethod
+    def _apply_transfer(transfer: Transfer, res: requests.Response, accounts: dict[NSID, list[BankAccount]]) -> None:
+        transfer.status = res.status_code
+
+        if res.status_code != 200:
+            try:
+                res.raise_for_status()
+            except requests.HTTPError as e:
+                transfer.error = e
+
+            return
 
-            res.append(account)
+        for account in accounts.get(transfer.source, ()):
+            account.amount -= transfer.amount
 
-        return res
+        for account in accounts.get(transfer.target, ()):
+            account.amount += transfer.amount
 
     """
     ---- INVENTAIRES ----
@@ -127,22 +263,35 @@ class EconomyInterface(Interface):
         """
 
         id = NSID(id)
-        res = requests.get(f"{self.url}/bank/inventories/{id}", headers = self.default_headers)
-
-        if res.status_code == 200:
-            _data = res.json()
-        else:
-            res.raise_for_status()
-            return
+        _data = self._get_cached('inventories', id, f"{self.url}/bank/inventories/{id}")
 
         if _data is None:
             return None
 
-        inventory = Inventory(id)
-        inventory._load(_data, self.url, self.default_headers)
+        return self._load_inventory(_data)
+
+    def _load_inventory(self, _data: dict) -> Inventory:
+        inventory = Inventory(_data['owner_id'])
+        inventory._load(_data, self)
 
         return inventory
 
+    def get_inventories(self, ids: list[NSID], max_workers: int = None) -> list[Inventory]:
+        """
+        Récupère plusieurs inventaires en parallèle.
+
+        ## Paramètres
+        ids: `list[NSID]`\n
+            IDs des inventaires à récupérer
+        max_workers: `int` (optionnel)\n
+            Nombre maximal de requêtes simultanées
+
+        ## Renvoie
+        - `list[.Inventory]` dans l'ordre des IDs, avec `None` pour les inventaires introuvables
+        """
+
+        return self._get_many(self.get_inventory, ids, max_workers)
+
     def save_inventory(self, inventory: Inventory) -> str:
         """
         Sauvegarde un inventaire dans la base de données.
@@ -152,17 +301,11 @@ class EconomyInterface(Interface):
             Inventaire à sauvegarder
         """
 
-        _data = inventory.__dict__
-
-        res = requests.put(f"{self.url}/bank/register_inventory?owner={_data['owner_id']}", headers = self.default_headers, json = _data)
+        _data = inventory._export()
 
-        if res.status_code == 200:
-            inventory._url = f"{self.url}/bank/inventories/{inventory.id}"
-            inventory.id = res.json()['id']
+        res = self._request_json('PUT', f"{self.url}/bank/register_inventory?owner={_data['owner_id']}", _data)
 
-            return res.json()['digicode']
-        else:
-            res.raise_for_status()
+        return self._registered(inventory, f"/bank/inventories/{inventory.id}", res)
 
     def fetch_inventories(self, **query: typing.Any) -> list[Inventory]:
         """
@@ -176,29 +319,24 @@ class EconomyInterface(Interface):
         - `list[.Inventory]`
         """
 
-        query = "&".join(f"{k}={ urllib.parse.quote(v) }" for k, v in query.items())
-
-        _res = requests.get(f"{self.url}/fetch/inventories?{query}", headers = self.default_headers)
-
-        if _res.status_code == 200:
-            _data = _res.json()
-        else:
-            _res.raise_for_status()
-            return []
-
-        res = []
+        _data = self._fetch_rows('inventories', **query)
 
-        for _inv in _data:
-            if not _inv: continue
+        return self._load_rows(_data, self._load_inventory)
 
-            inventory = Inventory(_inv["owner_id"])
+    def iter_inventories(self, **query: typing.Any) -> typing.Iterator[Inventory]:
+        """
+        Parcourt les inventaires correspondant à une requête sans charger la liste complète en mémoire.
 
-            inventory.id = NSID(_inv['id'])
-            inventory._load(_inv, self.url, self.default_headers)
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les inventaires.
 
-            res.append(inventory)
+        ## Renvoie
+        - `Iterator[.Inventory]`
+        """
 
-        return res
+        for _data in self.iter_fetch('inventories', **query):
+            yield self._load_inventory(_data)
 
     """
     ---- ITEMS ----
@@ -217,21 +355,16 @@ class EconomyInterface(Interface):
         """
 
         id = NSID(id)
-        res = requests.get(f"{self.url}/marketplace/items/{id}", headers = self.default_headers)
-
-        if res.status_code == 200:
-            _data = res.json()
-        else:
-            res.raise_for_status()
-            return
+        _data = self._get_cached('items', id, f"{self.url}/marketplace/items/{id}")
 
         if _data is None:
             return None
 
-        item = Item()
+        return self._load_item(_data)
 
-        item.id = id
-        item._load(_data, self.url, self.default_headers)
+    def _load_item(self, _data: dict) -> Item:
+        item = Item()
+        item._load(_data, self)
 
         return item
 
@@ -244,15 +377,11 @@ class EconomyInterface(Interface):
             Item à sauvegarder
         """
 
-        _data = item.__dict__
+        _data = item._export()
 
-        res = requests.put(f"{self.url}/marketplace/register_item", headers = self.default_headers, json = _data)
+        res = self._request_json('PUT', f"{self.url}/marketplace/register_item", _data)
 
-        if res.status_code == 200:
-            item._url = f"{self.url}/bank/inventories/{item.id}"
-            item.id = res.json()['id']
-        else:
-            res.raise_for_status()
+        self._registered(item, f"/bank/inventories/{item.id}", res)
 
     def fetch_items(self, **query: typing.Any) -> list[Item]:
         """
@@ -266,29 +395,24 @@ class EconomyInterface(Interface):
         - `list[.Item]`
         """
 
-        query = "&".join(f"{k}={ urllib.parse.quote(v) }" for k, v in query.items())
-
-        _res = requests.get(f"{self.url}/fetch/items?{query}", headers = self.default_headers)
-
-        if _res.status_code == 200:
-            _data = _res.json()
-        else:
-            _res.raise_for_status()
-            return []
+        _data = self._fetch_rows('items', **query)
 
-        res = []
+        return self._load_rows(_data, self._load_item)
 
-        for _item in _data:
-            if not _item: continue
-
-            item = Item()
+    def iter_items(self, **query: typing.Any) -> typing.Iterator[Item]:
+        """
+        Parcourt les items correspondant à une requête sans charger la liste complète en mémoire.
 
-            item.id = NSID(_item['id'])
-            item._load(_item, self.url, self.default_headers)
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les items.
 
-            res.append(item)
+        ## Renvoie
+        - `Iterator[.Item]`
+        """
 
-        return res
+        for _data in self.iter_fetch('items', **query):
+            yield self._load_item(_data)
 
 
     """
@@ -308,21 +432,16 @@ class EconomyInterface(Interface):
         """
 
         id = NSID(id)
-        res = requests.get(f"{self.url}/marketplace/sales/{id}", headers = self.default_headers)
-
-        if res.status_code == 200:
-            _data = res.json()
-        else:
-            res.raise_for_status()
-            return
+        _data = self._get_cached('sales', id, f"{self.url}/marketplace/sales/{id}")
 
         if _data is None:
             return None
 
-        sale = Sale()
+        return self._load_sale(_data)
 
-        sale.id = id
-        sale._load(_data, self.url, self.default_headers)
+    def _load_sale(self, _data: dict) -> Sale:
+        sale = Sale()
+        sale._load(_data, self)
 
         return sale
 
@@ -338,26 +457,51 @@ class EconomyInterface(Interface):
         - `list[.Sale]`
         """
 
-        query = "&".join(f"{k}={ urllib.parse.quote(v) }" for k, v in query.items())
+        _data = self._fetch_rows('sales', **query)
 
-        _res = requests.get(f"{self.url}/fetch/sales?{query}", headers = self.default_headers)
+        return self._load_rows(_data, self._load_sale)
 
-        if _res.status_code == 200:
-            _data = _res.json()
-        else:
-            _res.raise_for_status()
-            return []
+    def iter_sales(self, **query: typing.Any) -> typing.Iterator[Sale]:
+        """
+        Parcourt les annonces correspondant à une requête sans charger la liste complète en mémoire.
 
-        res = []
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les annonces.
 
-        for _sale in _data:
-            if not _sale: continue
+        ## Renvoie
+        - `Iterator[.Sale]`
+        """
 
-            sale = Sale()
+        for _data in self.iter_fetch('sales', **query):
+            yield self._load_sale(_data)
 
-            sale.id = NSID(_sale['id'])
-            sale._load(_sale, self.url, self.default_headers)
+    def build_price_index(self, **query: typing.Any) -> PriceIndex:
+        """
+        Construit un index des prix unitaires de chaque objet à partir des annonces ouvertes. Nécessite numpy.
 
-            res.append(sale)
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les annonces
+
+        ## Renvoie
+        - `.PriceIndex`
+        """
+
+        return PriceIndex(self.iter_fetch('sales', **query))
+
+    def refresh_price_index(self, index: PriceIndex, **query: typing.Any) -> int:
+        """
+        Met à jour un `.PriceIndex` d'après les annonces actuelles, en ne recalculant que les objets dont les annonces ont changé.
+
+        ## Paramètres
+        index: `.PriceIndex`\n
+            Index à mettre à jour
+        query: `**dict`\n
+            La requête pour filtrer les annonces (la même qu'à la construction)
+
+        ## Renvoie
+        - `int` : nombre d'objets dont les prix ont changé
+        """
 
-        return res
\ No newline at end of file
+        return index.refresh(self.iter_fetch('sales', **query))
@@ -15,8 +15,12 @@ class EntityInterface(Interface):
     - Sanctions et modifications d'une entité: `.Action[ .AdminAction | .Sanction ]`
     """
 
-    def __init__(self, url: str, token: str = None) -> None:
-        super().__init__(url, token)
+    def __init__(self, url: str, token: str = None, transport: Transport = None, cache: Cache = None, snapshots: SnapshotStore = None) -> None:
+        super().__init__(url, token, transport, cache, snapshots)
+
+        self.positions = PositionCatalog(self) # Positions partagées par les entités chargées
+        self.index: EntityIndex = None # Index local tenu à jour par l'interface (voir `build_index`)
+        self.leaderboard: Leaderboard = None # Classement local tenu à jour par l'interface (voir `build_leaderboard`)
 
     """
     ---- ENTITÉS ----
@@ -38,29 +42,52 @@ class EntityInterface(Interface):
         - `.Entity` dans le cas où c'est indéterminé
         """
 
-        id = NSID(id)
-
-        if _class == "user":
-            _data = self._get_by_ID('individuals', id)
-        elif _class == "group":
-            _data = self._get_by_ID('organizations', id)
-        else:
-            _data = self._get_by_ID('entities', id)
+        _data = self._get_by_ID(self._ENTITY_CLASSES.get(_class, 'entities'), NSID(id))
 
         if _data is None: # ID inexistant chez les entités
             return None
 
+        return self._load_entity(_data)
+
+    _ENTITY_CLASSES = { "user": 'individuals', "group": 'organizations' } # Valeurs de `_class` acceptées par `get_entity`
+    _MODEL_CLASSES = { "user": 'individuals', "individual": 'individuals', "group": 'organizations', "organization": 'organizations' } # Valeurs de `_class` acceptées par `create_entity`
+
+    def _load_entity(self, _data: dict, lazy: bool = False) -> User | Organization | Entity:
         if _data['_class'] == 'individuals':
-            entity = User(id)
+            entity = User(_data['id'])
         elif _data['_class'] == 'organizations':
-            entity = Organization(id)
-        else: 
-            entity = Entity(id)
+            entity = Organization(_data['id'])
+        else:
+            entity = Entity(_data['id'])
+
+        entity._load(_data, self, lazy)
 
-        entity._load(_data, self.url, self.default_headers)
+        if self.index is not None:
+            self.index.receive(entity)
+
+        if self.leaderboard is not None:
+            self.leaderboard.receive(entity)
 
         return entity
 
+    def get_entities(self, ids: list[NSID], _class: str = None, max_workers: int = None) -> list[User | Organization | Entity]:
+        """
+        Récupère plusieurs entités en parallèle.
+
+        ## Paramètres
+        ids: `list[NSID]`
+            IDs des entités à récupérer
+        _class: `str`
+            Classe du modèle à prendre (`.User` ou `.Organization`)
+        max_workers: `int` (optionnel)
+            Nombre maximal de requêtes simultanées
+
+        ## Renvoie
+        - `list[.User | .Organization | .Entity]` dans l'ordre des IDs, avec `None` pour les entités introuvables
+        """
+
+        return self._get_many(lambda id: self.get_entity(id, _class), ids, max_workers)
+
     def create_entity(self, id: NSID, name: str, _class: str, position: str = 'membre', zone: int = 10):
         """
         Fonction permettant de créer ou modifier une entité.
@@ -74,12 +101,9 @@ class EntityInterface(Interface):
         """
 
         id = NSID(id)
+        _class = self._MODEL_CLASSES.get(_class)
 
-        if _class in ('group', 'organization'):
-            _class = 'organizations'
-        elif _class in ('user', 'individual'):
-            _class = 'individuals'
-        else:
+        if _class is None:
             return
 
         self._put_in_db(
@@ -88,19 +112,27 @@ class EntityInterface(Interface):
             use_PUT = True
         )
 
-        entity = self.get_entity(id)
+        if self.cache is not None:
+            self.cache.invalidate(_class, id)
 
+        if self.snapshots is not None:
+            self.snapshots.invalidate(_class, id)
+            self.snapshots.invalidate_fetches(_class)
+
+        return self._bind_created(self.get_entity(id), _class)
+
+    @staticmethod
+    def _bind_created(entity: Entity, _class: str) -> Entity:
         if _class == "individuals":
-            entity._url = f"{self.url}/model/individuals/{id}"
+            entity._bind(entity._interface, f"/model/individuals/{entity.id}")
         elif isinstance(entity, Organization):
-            entity._url = f"{self.url}/model/organizations/{id}"
+            entity._bind(entity._interface, f"/model/organizations/{entity.id}")
             entity.avatar_url = f"{entity._url}/avatar"
         else:
-            entity._url = f"{self.url}/model/entities/{id}"
+            entity._bind(entity._interface, f"/model/entities/{entity.id}")
 
         return entity
 
-
     def delete_entity(self, entity: Entity):
         """
         Fonction permettant de supprimer le profil d'une entité
@@ -110,10 +142,7 @@ class EntityInterface(Interface):
             L'entité à supprimer
         """
 
-        res = requests.post(f"{entity._url}/delete", headers = self.default_headers)
-
-        if res.status_code != 200:
-            res.raise_for_status()
+        self._request_json('POST', f"{entity._url}/delete")
 
     def fetch_entities(self, **query: typing.Any) -> list[ Entity | User | Organization ]:
         """
@@ -124,41 +153,85 @@ class EntityInterface(Interface):
             La requête pour filtrer les entités.
 
         ## Renvoie
-        - `list[.Entity | .User | .Organization]`
-        """
-
-        if "_class" in query.keys():
-            if query["_class"] == "individuals":
-                del query["_class"]
-                _res = self.fetch('individuals', **query)
-            elif query["_class"] == "organizations":
-                del query["_class"]
-                _res = self.fetch('organizations', **query)
-            else:
-                del query["_class"]
-                _res = self.fetch('entities', **query)
-        else:
-            _res = self.fetch('entities', **query)
+        - `list[.Entity | .User | .Organization]`, dont la position, les infos supplémentaires, les votes, le propriétaire et les membres ne sont construits qu'à leur première lecture si `self.lazy` est activé
+        """
 
-        res = []
+        return self._load_entities(self.fetch(self._fetch_class(query), **query))
 
-        for _entity in _res:
-            if _entity is None: continue
+    def _load_entities(self, rows: list[dict]) -> list[ Entity | User | Organization ]:
+        return self._load_rows(rows, lambda _data: self._load_entity(_data, self.lazy))
 
-            if _entity['_class'] == 'individuals':
-                entity = User(_entity["id"])
-            elif _entity['_class'] == 'organizations':
-                entity = Organization(_entity["id"])
-            else:
-                entity = Entity(_entity["id"])
+    @staticmethod
+    def _fetch_class(query: dict) -> str:
+        """
+        Retire `_class` de la requête et renvoie la classe à interroger (`entities` par défaut).
+        """
 
-            entity._load(_entity, self.url, self.default_headers)
+        _class = query.pop("_class", None)
 
-            res.append(entity)
+        return _class if _class in ("individuals", "organizations") else "entities"
 
-        return res
+    def iter_entities(self, **query: typing.Any) -> typing.Iterator[ Entity | User | Organization ]:
+        """
+        Parcourt les entités correspondant à une requête sans charger la liste complète en mémoire.
 
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les entités.
 
+        ## Renvoie
+        - `Iterator[.Entity | .User | .Organization]`
+        """
+
+        for _entity in self.iter_fetch(self._fetch_class(query), **query):
+            yield self._load_entity(_entity, self.lazy)
+
+    def build_index(self, **query: typing.Any) -> EntityIndex:
+        """
+        Charge les entités correspondant à une requête dans un nouvel `.EntityIndex` et l'associe à l'interface : les entités chargées par la suite y sont ajoutées si elles répondent à la requête, remplacent les anciennes si elles y étaient déjà, et celles modifiées par une écriture sont réindexées.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les entités (voir `fetch_entities`)
+
+        ## Renvoie
+        - `.EntityIndex`
+        """
+
+        self._attach('index', EntityIndex(query = query))
+
+        for _ in self.iter_entities(**query):
+            pass
+
+        return self.index
+
+    def build_leaderboard(self, **query: typing.Any) -> Leaderboard:
+        """
+        Charge les membres correspondant à une requête dans un nouveau `.Leaderboard` et l'associe à l'interface : les membres chargés par la suite y sont ajoutés s'ils répondent à la requête, remplacent les anciens s'ils étaient déjà classés, et ceux qui gagnent de l'XP sont replacés.
+
+        ## Paramètres
+        query: `**dict`\n
+            La requête pour filtrer les membres (voir `fetch_entities`), par exemple `zone = 20`
+
+        ## Renvoie
+        - `.Leaderboard`
+        """
+
+        self._attach('leaderboard', Leaderboard(query = query))
+
+        for _ in self.iter_entities(_class = 'individuals', **query):
+            pass
+
+        return self.leaderboard
+
+    def _attach(self, name: str, view: EntityIndex | Leaderboard) -> None:
+        previous = getattr(self, name)
+
+        if previous is not None and previous.invalidate_url in self.transport.on_write:
+            self.transport.on_write.remove(previous.invalidate_url)
+
+        setattr(self, name, view)
+        self.transport.on_write.append(view.invalidate_url)
 
     def get_position(self, id: str) -> Position:
         """
@@ -169,7 +242,7 @@ class EntityInterface(Interface):
             ID de la position (SENSIBLE À LA CASSE !)
 
         ## Renvoie
-        - `.Position`
+        - `.Position` modifiable, propre à l'appelant (le catalogue `self.positions` est mis à jour au passage)
         """
 
         _data = self._get_by_ID('positions', id)
@@ -177,30 +250,21 @@ class EntityInterface(Interface):
         if _data is None:
             return None
 
-        position = Position(id)
-        position._load(_data, self.url, self.default_headers)
+        return self._load_position(_data).copy()
 
-        return position
+    def _load_position(self, _data: dict) -> Position:
+        return self.positions.update(_data)
 
     def fetch_positions(self, **query: typing.Any) -> list[Position]:
         """
-        Récupère une liste de positions en fonction d'une requête.
+        Récupère une liste de positions en fonction d'une requête. Les positions reçues sont ajoutées au catalogue `self.positions`, ou y remplacent en place les données des positions déjà connues : appeler `fetch_positions()` sans filtre charge ou rafraîchit tout le catalogue.
 
         ## Paramètres
         query: `**dict`\n
             La requête pour filtrer les positions.
 
         ## Renvoie
-        - `list[.Position]`
+        - `list[.Position]`, partagées avec les entités chargées par l'interface
         """
 
-        _res = self.fetch('positions', **query)
-        res = []
-
-        for _data in _res:
-            pos = Position()
-            pos._load(_data, self.url, self.default_headers)
-
-            res.append(pos)
-
-        return res
\ No newline at end of file
+        return self._load_rows(self.fetch('positions', **query), self._load_position)
\ No newline at end of file
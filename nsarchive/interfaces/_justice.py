@@ -1,4 +1,3 @@
-import requests
 import time
 
 from ..models.base import *
@@ -9,114 +8,98 @@ class JusticeInterface(Interface):
     Gère les procès, sanctions et signalements.
     """
 
-    def __init__(self, url: str, token: str) -> None:
-        super().__init__(url, token)
+    def __init__(self, url: str, token: str, transport: Transport = None, cache: Cache = None, snapshots: SnapshotStore = None) -> None:
+        super().__init__(url, token, transport, cache, snapshots)
 
     """
     SIGNALEMENTS
     """
 
     def get_report(self, id: NSID) -> Report:
-        res = requests.get(
-            f"{self.url}/justice/reports/{id}",
-            headers = self.default_headers,
-        )
+        return self._load_report(self._request_json('GET', f"{self.url}/justice/reports/{id}"))
 
-        if res.status_code != 200:
-            res.raise_for_status()
-
-        report = Report(id)
-        report._load(res.json(), f"{self.url}/justice/reports/{id}", self.default_headers)
+    def _load_report(self, _data: dict) -> Report:
+        report = Report(NSID(_data['id']))
+        report._load(_data, self)
 
         return report
 
     def submit_report(self, target: NSID, reason: str = None, details: str = None) -> Report:
+        _data = self._request_json('PUT', f"{self.url}/justice/submit_report?target={target}", self._report_payload(reason, details))
+
+        return self._load_report(_data)
+
+    @staticmethod
+    def _report_payload(reason: str = None, details: str = None) -> dict:
         payload = {}
         if reason: payload['reason'] = reason
         if details: payload['details'] = details
 
-        res = requests.put(
-            f"{self.url}/justice/submit_report?target={target}",
-            headers = self.default_headers,
-            json = payload
-        )
-
-        if res.status_code != 200:
-            res.raise_for_status()
-
-        report = Report(NSID(res.json()['id']))
-        report._load(res.json(), f"{self.url}/justice/reports/{report.id}", self.default_headers)
-
-        return report
+        return payload
 
     """
     PROCÈS
     """
 
     def get_lawsuit(self, id: NSID) -> Lawsuit:
-        res = requests.get(
-            f"{self.url}/justice/lawsuits/{id}",
-            headers = self.default_headers,
-        )
-
-        if res.status_code != 200:
-            res.raise_for_status()
+        return self._load_lawsuit(self._request_json('GET', f"{self.url}/justice/lawsuits/{id}"))
 
-        lawsuit = Lawsuit(id)
-        lawsuit._load(res.json(), f"{self.url}/justice/lawsuits/{id}", self.default_headers)
+    def _load_lawsuit(self, _data: dict) -> Lawsuit:
+        lawsuit = Lawsuit(NSID(_data['id']))
+        lawsuit._load(_data, self)
 
         return lawsuit
 
     def open_lawsuit(self, target: NSID, title: str = None, report: Report = None) -> Lawsuit:
-        payload = {}
-        if title: payload['title'] = title
+        _data = self._request_json('PUT', self._lawsuit_url(target, report), self._title_payload(title))
 
-        res = requests.put(
-            f"{self.url}/justice/open_lawsuit?target={target}{('&report=' + report.id) if report else ''}",
-            headers = self.default_headers,
-            json = payload
-        )
+        return self._load_lawsuit(_data)
 
-        if res.status_code != 200:
-            res.raise_for_status()
+    def _lawsuit_url(self, target: NSID, report: Report = None) -> str:
+        return f"{self.url}/justice/open_lawsuit?target={target}{('&report=' + report.id) if report else ''}"
 
-        lawsuit = Lawsuit(NSID(res.json()['id']))
-        lawsuit._load(res.json(), f"{self.url}/justice/lawsuits/{report.id}", self.default_headers)
+    @staticmethod
+    def _title_payload(title: str = None) -> dict:
+        payload = {}
+        if title: payload['title'] = title
 
-        return lawsuit
+        return payload
 
     """
     SANCTIONS
     """
 
     def get_sanction(self, id: NSID) -> Sanction:
-        res = requests.get(
-            f"{self.url}/justice/sanctions/{id}",
-            headers = self.default_headers,
-        )
+        id = NSID(id)
 
-        if res.status_code != 200:
-            res.raise_for_status()
+        return self._load_sanction(self._get_cached('sanctions', id, f"{self.url}/justice/sanctions/{id}"))
 
-        sanction = Sanction(id)
-        sanction._load(res.json(), f"{self.url}/justice/sanctions/{id}", self.default_headers)
+    def _load_sanction(self, _data: dict) -> Sanction:
+        sanction = Sanction(NSID(_data['id']))
+        sanction._load(_data, self)
 
         return sanction
 
-    def add_sanction(self, target: NSID, _type: str, duration: int = None, title: str = None, lawsuit: Lawsuit = None) -> Sanction:
-        payload = {}
-        if title: payload['title'] = title
+    def get_sanctions(self, ids: list[NSID], max_workers: int = None) -> list[Sanction]:
+        """
+        Récupère plusieurs sanctions en parallèle.
+
+        ## Paramètres
+        ids: `list[NSID]`\n
+            IDs des sanctions à récupérer
+        max_workers: `int` (optionnel)\n
+            Nombre maximal de requêtes simultanées
 
-        res = requests.put(
-            f"{self.url}/justice/add_sanction?type={_type}&target={target}&date={str(round(time.time()))}{('&duration=' + str(duration)) if duration else ''}{('&case=' + lawsuit.id) if lawsuit else ''}",
-            headers = self.default_headers,
-            json = payload
-        )
+        ## Renvoie
+        - `list[.Sanction]` dans l'ordre des IDs, avec `None` pour les sanctions introuvables
+        """
 
-        if res.status_code != 200:
-            res.raise_for_status()
+        return self._get_many(self.get_sanction, ids, max_workers)
+
+    def add_sanction(self, target: NSID, _type: str, duration: int = None, title: str = None, lawsuit: Lawsuit = None) -> Sanction:
+        _data = self._request_json('PUT', self._sanction_url(target, _type, duration, lawsuit), self._title_payload(title))
 
-        sanction = Sanction(NSID(res.json()['id']))
-        sanction._load(res.json(), f"{self.url}/justice/sanctions/{sanction.id}", self.default_headers)
+        return self._load_sanction(_data)
 
-        return sanction
\ No newline at end of file
+    def _sanction_url(self, target: NSID, _type: str, duration: int = None, lawsuit: Lawsuit = None) -> str:
+        return f"{self.url}/justice/add_sanction?type={_type}&target={target}&date={str(round(time.time()))}{('&duration=' + str(duration)) if duration else ''}{('&case=' + lawsuit.id) if lawsuit else ''}"
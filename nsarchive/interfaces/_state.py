@@ -16,8 +16,8 @@ class StateInterface(Interface):
     - Résultats des votes: `.Vote`
     """
 
-    def __init__(self, url: str, token: str) -> None:
-        super().__init__(url, token)
+    def __init__(self, url: str, token: str, transport: Transport = None, cache: Cache = None, snapshots: SnapshotStore = None) -> None:
+        super().__init__(url, token, transport, cache, snapshots)
 
     """
     ---- VOTES ----
@@ -35,16 +35,13 @@ class StateInterface(Interface):
         - `.Vote`
         """
 
-        id = NSID(id)
-        res = requests.get(f"{self.url}/votes/{id}", headers = self.default_headers)
-
-        if not res:
-            return None
+        _data = self._get_optional(f"{self.url}/votes/{NSID(id)}")
 
-        _data = res.json()
+        return self._load_vote(_data) if _data else None
 
-        vote = Vote(id)
-        vote._load(_data, url = f"{self.url}/votes/{id}", headers = self.default_headers)
+    def _load_vote(self, _data: dict) -> Vote:
+        vote = Vote(_data['id'])
+        vote._load(_data, self)
 
         return vote
 
@@ -61,6 +58,10 @@ class StateInterface(Interface):
             Fin du vote (timestamp)
         """
 
+        return self._load_vote(self._request_json('PUT', f"{self.url}/open_vote", self._vote_payload(title, options, end)))
+
+    @staticmethod
+    def _vote_payload(title: str = None, options: list[dict] = [], end: int = 0) -> dict:
         payload = {
             "options": options,
             "end_date": end
@@ -69,17 +70,7 @@ class StateInterface(Interface):
         if title:
             payload['title'] = title
 
-        res = requests.put(f"{self.url}/open_vote", headers = self.default_headers, json = payload)
-
-        if res.status_code == 200:
-            _data = res.json()
-
-            vote = Vote(_data['id'])
-            vote._load(_data, url = f"{self.url}/votes/{_data['id']}", headers = self.default_headers)
-
-            return vote
-        else:
-            res.raise_for_status()
+        return payload
 
     # Aucune possibilité de supprimer un vote
 
@@ -95,16 +86,11 @@ class StateInterface(Interface):
         - `.Election`
         """
 
-        id = NSID(id)
-        res = requests.get(f"{self.url}/elections/{id}", headers = self.default_headers)
-
-        if res.status_code != 200:
-            res.raise_for_status()
+        return self._load_election(self._request_json('GET', f"{self.url}/elections/{NSID(id)}"))
 
-        _data = res.json()
-
-        election = Election(id)
-        election._load(_data, url = f"{self.url}/elections/{id}", headers = self.default_headers)
+    def _load_election(self, _data: dict) -> Election:
+        election = Election(_data['id'])
+        election._load(_data, self)
 
         return election
 
@@ -121,17 +107,7 @@ class StateInterface(Interface):
             Choix du type d'élections (True = présidentielles, False = législatives)
         """
 
-        res = requests.put(f"{self.url}/open_election?vote={vote.id}&type={'full' if full else 'partial'}{('&date=' + str(start)) if start else ''}", headers = self.default_headers, json = {})
-
-        if res.status_code == 200:
-            _data = res.json()
-
-            election = Election(_data['id'])
-            election._load(_data, url = f"{self.url}/elections/{_data['id']}", headers = self.default_headers)
-
-            return election
-        else:
-            res.raise_for_status()
+        return self._load_election(self._request_json('PUT', f"{self.url}/open_election?vote={vote.id}&type={'full' if full else 'partial'}{('&date=' + str(start)) if start else ''}", {}))
 
     """
     PARTIS
@@ -150,15 +126,12 @@ class StateInterface(Interface):
         """
 
         id = NSID(id)
-        res = requests.get(f"{self.url}/parties/{id}", headers = self.default_headers)
 
-        if res.status_code != 200:
-            res.raise_for_status()
+        return self._load_party(self._get_cached('parties', id, f"{self.url}/parties/{id}", conditional = True))
 
-        _data = res.json()
-
-        party = Party(id)
-        party._load(_data, url = f"{self.url}/parties/{id}", headers = self.default_headers)
+    def _load_party(self, _data: dict) -> Party:
+        party = Party(_data['org_id'])
+        party._load(_data, self)
 
         return party
 
@@ -183,14 +156,4 @@ class StateInterface(Interface):
             "scale": scale if isinstance(scale, dict) else scale._to_dict()
         }
 
-        res = requests.put(f"{self.url}/register_party?candidate={id}", headers = self.default_headers, json = payload)
-
-        if res.status_code == 200:
-            _data = res.json()
-
-            party = Party(_data['org_id'])
-            party._load(_data, url = f"{self.url}/parties/{_data['org_id']}", headers = self.default_headers)
-
-            return party
-        else:
-            res.raise_for_status()
\ No newline at end of file
+        return self._load_party(self._request_json('PUT', f"{self.url}/register_party?candidate={id}", payload))
\ No newline at end of file
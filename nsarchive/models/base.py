@@ -1,6 +1,26 @@
+import asyncio
+import bisect
+import collections
+import concurrent.futures
+import copy
+import functools
 import json
+import os
+import random
+import re
 import requests
+import requests.adapters
+import requests.structures
+import sqlite3
+import threading
+import time
 import typing
+import urllib.parse
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 from .. import utils
 
@@ -12,6 +32,9 @@ class NSID(str):
 
     ID unique et universel pour l'ensemble des entités et évènements. Il prend les `int`, les `str` et les autres instances `NSID` pour les convertir en un identifiant hexadécimal.
     """
+
+    __slots__ = ()
+
     unknown = "0"
     admin = "1"
     gov = "2"
@@ -28,28 +51,1314 @@ class NSID(str):
     egalitary_com = "105"
     antifraud_dept = "106"
 
+    INTERN_SIZE = 65536 # Nombre d'IDs conservés avant que la table ne soit vidée
+    _interned: dict[str | int, 'NSID'] = {} # Valeur d'origine (`str` ou `int`) -> instance partagée
+
     def __new__(cls, value):
-        if type(value) == int:
-            value = hex(value)
-        elif type(value) in (str, NSID):
-            value = hex(int(value, 16))
+        # Un NSID est immuable : inutile de le reconvertir
+        if type(value) is NSID:
+            return value
+
+        if type(value) is str or type(value) is int:
+            nsid = NSID._interned.get(value)
+
+            if nsid is not None:
+                return nsid
+
+            number = int(value, 16) if type(value) is str else value
         else:
             raise TypeError(f"<{value}> is not NSID serializable")
 
-        if value.startswith("0x"):
-            value = value[2:]
+        nsid = super(NSID, cls).__new__(cls, format(number, 'X') if number >= 0 else hex(number).upper())
 
-        interface = super(NSID, cls).__new__(cls, value.upper())
-        return interface
+        if len(NSID._interned) >= NSID.INTERN_SIZE:
+            NSID._interned.clear()
+
+        NSID._interned[value] = nsid
+
+        return nsid
+
+    @staticmethod
+    def many(values: typing.Iterable[str | int]) -> list['NSID']:
+        """
+        Convertit plusieurs valeurs en `NSID`, en réutilisant les instances déjà connues.
+        """
+
+        table = NSID._interned
+        res = []
+        append = res.append
+
+        for value in values:
+            if type(value) is NSID:
+                append(value)
+            else:
+                nsid = table.get(value) if type(value) is str or type(value) is int else None
+                append(nsid if nsid is not None else NSID(value))
+
+        return res
+
+class _Pending:
+    def __repr__(self) -> str:
+        return '<pending>'
+
+    def __copy__(self) -> typing.Self:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> typing.Self:
+        return self
+
+class lazy_field:
+    """
+    Attribut de modèle construit à sa première lecture à partir des données brutes (`_raw`) reçues par `_load(..., lazy = True)`.
+
+    S'utilise comme `property` : la fonction décorée reçoit le modèle et ses données brutes et renvoie la valeur de l'attribut, qui est ensuite conservée dans `_<nom>`.
+    """
+
+    PENDING = _Pending()
+
+    def __init__(self, build: typing.Callable[[typing.Any, dict], typing.Any]) -> None:
+        self.build = build
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.attr = '_' + name
+
+    def __get__(self, obj: typing.Any, owner: type = None) -> typing.Any:
+        if obj is None:
+            return self
+
+        value = getattr(obj, self.attr)
+
+        if value is lazy_field.PENDING:
+            value = self.build(obj, obj._raw)
+            setattr(obj, self.attr, value)
+
+        return value
+
+    def __set__(self, obj: typing.Any, value: typing.Any) -> None:
+        setattr(obj, self.attr, value)
+
+    @staticmethod
+    def fields(obj: typing.Any) -> list['lazy_field']:
+        return [ field for cls in type(obj).__mro__ for field in vars(cls).values() if isinstance(field, lazy_field) ]
+
+    @staticmethod
+    def reset(obj: typing.Any, _data: dict) -> None:
+        """
+        Associe de nouvelles données brutes au modèle : tous ses attributs paresseux seront reconstruits à leur prochaine lecture.
+        """
+
+        obj._raw = _data
+
+        for field in lazy_field.fields(obj):
+            setattr(obj, field.attr, lazy_field.PENDING)
+
+    @staticmethod
+    def hydrate(obj: typing.Any) -> None:
+        """
+        Construit tous les attributs paresseux du modèle, y compris ceux des modèles qu'il contient (propriétaire d'une organisation...), puis libère ses données brutes.
+        """
+
+        if getattr(obj, '_raw', None) is None:
+            return
+
+        for field in lazy_field.fields(obj):
+            value = getattr(obj, field.name)
+
+            if getattr(value, '_raw', None) is not None:
+                lazy_field.hydrate(value)
+
+        obj._raw = None
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Levée sans envoyer la requête lorsque le disjoncteur d'un hôte est ouvert.
+    """
+
+class RetryPolicy:
+    """
+    Politique de nouvelle tentative et de délais d'attente appliquée par le transport.
+
+    Seules les méthodes idempotentes sont rejouées : dans NationDB, `PUT` sert aussi à créer des objets (`open_vote`, `register_account`...), il n'en fait donc pas partie par défaut. Une requête portant un en-tête `Idempotency-Key` est rejouée quelle que soit sa méthode, le serveur n'appliquant qu'une fois une même clé.
+
+    ## Paramètres
+    retries: `int` (optionnel)\n
+        Nombre maximal de nouvelles tentatives après le premier essai
+    backoff: `float` (optionnel)\n
+        Délai de base (secondes), doublé à chaque tentative
+    max_backoff: `float` (optionnel)\n
+        Délai maximal entre deux tentatives
+    statuses: `tuple[int]` (optionnel)\n
+        Codes HTTP considérés comme temporaires
+    methods: `tuple[str]` (optionnel)\n
+        Méthodes pouvant être rejouées
+    timeout: `float` (optionnel)\n
+        Délai d'attente par défaut d'une requête
+    timeouts: `dict[str, float]` (optionnel)\n
+        Délais propres à certains endpoints (expression régulière appliquée au chemin de l'URL)
+    """
+
+    def __init__(self, retries: int = 2, backoff: float = 0.2, max_backoff: float = 5, statuses: tuple[int] = (429, 502, 503, 504), methods: tuple[str] = ('GET', 'HEAD', 'OPTIONS'), timeout: float = 5, timeouts: dict[str, float] = None) -> None:
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+        self.methods = methods
+        self.timeout = timeout
+        self.timeouts = timeouts if timeouts is not None else {
+            r"^/fetch/": 30,
+            r"^/upload_file/": 60,
+            r"^/drive/": 60
+        }
+
+    def timeout_for(self, url: str) -> float:
+        path = urllib.parse.urlparse(url).path
+
+        for pattern, timeout in self.timeouts.items():
+            if re.search(pattern, path):
+                return timeout
+
+        return self.timeout
+
+    def can_retry(self, method: str, attempt: int, idempotent: bool = False) -> bool:
+        return (idempotent or method.upper() in self.methods) and attempt < self.retries
+
+    @staticmethod
+    def is_idempotent(kwargs: dict) -> bool:
+        """
+        Indique si les arguments d'une requête portent un en-tête `Idempotency-Key`.
+        """
+
+        return any(key.lower() == 'idempotency-key' for key in (kwargs.get('headers') or {}))
+
+    def delay(self, attempt: int, res: requests.Response = None) -> float:
+        if res is not None and res.headers.get('Retry-After', '').isdigit():
+            return min(float(res.headers['Retry-After']), self.max_backoff)
+
+        # Full jitter : évite que tous les clients réessaient au même instant
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+class CircuitBreaker:
+    """
+    Disjoncteur par hôte. Après `threshold` échecs consécutifs (erreur réseau, délai dépassé ou code 5xx), les requêtes vers cet hôte échouent immédiatement pendant `recovery_time` secondes, puis une requête d'essai décide de sa réouverture.
+
+    ## Paramètres
+    threshold: `int` (optionnel)\n
+        Nombre d'échecs consécutifs avant ouverture
+    recovery_time: `float` (optionnel)\n
+        Durée (secondes) pendant laquelle le disjoncteur reste ouvert
+    """
+
+    def __init__(self, threshold: int = 5, recovery_time: float = 10) -> None:
+        self.threshold = threshold
+        self.recovery_time = recovery_time
+
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def check(self, url: str) -> None:
+        host = urllib.parse.urlparse(url).netloc
+
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+
+            if opened_at is None:
+                return
+
+            if time.monotonic() - opened_at < self.recovery_time:
+                raise CircuitOpenError(f"Circuit open for {host}, retrying in {self.recovery_time - (time.monotonic() - opened_at):.1f}s.")
+
+            # Semi-ouvert : une requête d'essai passe, les suivantes échouent jusqu'à son résultat
+            self._opened_at[host] = time.monotonic()
+
+    def record(self, url: str, success: bool) -> None:
+        host = urllib.parse.urlparse(url).netloc
+
+        with self._lock:
+            if success:
+                self._failures.pop(host, None)
+                self._opened_at.pop(host, None)
+            else:
+                self._failures[host] = self._failures.get(host, 0) + 1
+
+                if self._failures[host] >= self.threshold:
+                    self._opened_at[host] = time.monotonic()
+
+    def is_open(self, url: str) -> bool:
+        return urllib.parse.urlparse(url).netloc in self._opened_at
+
+class JSONCodec:
+    """
+    Encodage et décodage JSON des corps de requêtes et de réponses.
+
+    Par défaut, le premier backend installé parmi `orjson`, `msgspec` et le module `json` standard est utilisé.
+
+    ## Paramètres
+    backend: `str` (optionnel)\n
+        `'orjson'`, `'msgspec'` ou `'json'`
+    """
+
+    BACKENDS = ('orjson', 'msgspec', 'json')
+
+    def __init__(self, backend: str = None) -> None:
+        for name in (backend,) if backend else self.BACKENDS:
+            try:
+                self.loads, self.dumps, self._errors = getattr(self, f"_{name}")()
+            except ImportError:
+                if backend:
+                    raise
+
+                continue
+
+            self.backend = name
+            break
+
+    @staticmethod
+    def _orjson() -> tuple:
+        import orjson
+
+        return orjson.loads, lambda obj: orjson.dumps(obj, option = orjson.OPT_NON_STR_KEYS), (orjson.JSONDecodeError,)
+
+    @staticmethod
+    def _msgspec() -> tuple:
+        import msgspec
+
+        return msgspec.json.Decoder().decode, msgspec.json.Encoder().encode, (msgspec.DecodeError,)
+
+    @staticmethod
+    def _json() -> tuple:
+        return json.loads, lambda obj: json.dumps(obj, ensure_ascii = False, separators = (',', ':')).encode(), (ValueError,)
+
+    def decode(self, res: requests.Response) -> typing.Any:
+        """
+        Remplace `res.json()` : décode directement le corps brut de la réponse, sans le convertir en texte.
+        """
+
+        try:
+            return self.loads(res.content)
+        except self._errors as e:
+            raise requests.JSONDecodeError(str(e), res.text, 0) from e
+
+    def parser(self) -> utils.JSONArrayParser:
+        """
+        Décodeur incrémental d'un tableau JSON reçu en flux (`iter_fetch`), qui lit les éléments avec ce backend. Le module `json` standard garde son propre décodeur incrémental.
+        """
+
+        if self.backend == 'json':
+            return utils.JSONArrayParser()
+
+        return utils.JSONArrayParser(self.loads, self._errors)
+
+    def encode_body(self, kwargs: dict) -> dict:
+        """
+        Remplace l'argument `json` d'une requête par son corps encodé (`data`) et l'en-tête `Content-Type` correspondant.
+        """
+
+        if 'json' not in kwargs or 'files' in kwargs:
+            return kwargs
+
+        body = kwargs.pop('json')
+
+        if body is None:
+            return kwargs
+
+        kwargs['data'] = self.dumps(body)
+
+        headers = requests.structures.CaseInsensitiveDict(kwargs.get('headers') or {})
+        headers.setdefault('Content-Type', 'application/json')
+        kwargs['headers'] = headers
+
+        return kwargs
+
+class Metrics:
+    """
+    Mesures des requêtes envoyées par un transport, regroupées par endpoint (`GET /model/{class}/{id}`, `POST /bank/accounts/{id}/debit`...) : nombre de requêtes, durées, octets reçus, temps de décodage JSON et codes de réponse.
+
+    Attachée à un `.Transport`, elle couvre l'interface et tous les modèles qu'elle a chargés. Un transport sans `metrics` (par défaut) ne mesure rien.
+
+    ## Paramètres
+    samples: `int` (optionnel)\n
+        Nombre de durées conservées par endpoint pour le calcul des percentiles
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float('inf')) # Bornes (secondes) de l'histogramme des durées
+
+    _TEMPLATES = (
+        (re.compile(r"^.*?/model/[^/]+/[^/]+"), "/model/{class}/{id}"),
+        (re.compile(r"^.*?/(fetch|new_model)/[^/]+"), r"/\1/{class}"),
+        (re.compile(r"^.*?/delete_[^/]+"), "/delete_{class}"),
+        (re.compile(r"^.*?/(bank/accounts|bank/inventories|marketplace/items|marketplace/sales|justice/reports|justice/lawsuits|justice/sanctions|votes|elections|parties)/[^/]+"), r"/\1/{id}"),
+        (re.compile(r"^.*?/upload_file/[^/]+"), "/upload_file/{bucket}"),
+        (re.compile(r"^.*?/drive/.+"), "/drive/{bucket}/{path}")
+    )
+
+    def __init__(self, samples: int = 1024) -> None:
+        self.samples = samples
+
+        self._endpoints: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def template(cls, url: str) -> str:
+        """
+        Remplace les parties variables du chemin d'une URL par leur nom (`.../model/individuals/1A/rename?name=x` devient `/model/{class}/{id}/rename`).
+        """
+
+        path = urllib.parse.urlparse(url).path
+
+        for pattern, repl in cls._TEMPLATES:
+            path, n = pattern.subn(repl, path, count = 1)
+
+            if n:
+                break
+
+        return path
+
+    def _endpoint(self, method: str, url: str) -> dict:
+        key = f"{method.upper()} {self.template(url)}"
+        endpoint = self._endpoints.get(key)
+
+        if endpoint is None:
+            endpoint = self._endpoints.setdefault(key, {
+                "count": 0,
+                "errors": 0,
+                "statuses": collections.Counter(),
+                "latencies": collections.deque(maxlen = self.samples),
+                "histogram": [0] * len(self.BUCKETS),
+                "total_time": 0.0,
+                "max_time": 0.0,
+                "bytes": 0,
+                "decode_time": 0.0
+            })
+
+        return endpoint
+
+    def observe(self, method: str, url: str, status: int | str, elapsed: float, size: int = 0) -> None:
+        """
+        Enregistre une requête terminée.
+
+        ## Paramètres
+        status: `int | str`\n
+            Code HTTP, ou nom de l'exception levée si aucune réponse n'a été reçue
+        elapsed: `float`\n
+            Durée totale (secondes), nouvelles tentatives comprises
+        size: `int` (optionnel)\n
+            Taille du corps de la réponse (octets)
+        """
+
+        with self._lock:
+            endpoint = self._endpoint(method, url)
+
+            endpoint["count"] += 1
+            endpoint["statuses"][status] += 1
+            endpoint["latencies"].append(elapsed)
+            endpoint["histogram"][bisect.bisect_left(self.BUCKETS, elapsed)] += 1
+            endpoint["total_time"] += elapsed
+            endpoint["max_time"] = max(endpoint["max_time"], elapsed)
+            endpoint["bytes"] += size
+
+            if isinstance(status, str) or status >= 400:
+                endpoint["errors"] += 1
+
+    def record(self, method: str, url: str, res: requests.Response, elapsed: float, streamed: bool = False) -> None:
+        """
+        Enregistre une réponse et mesure le temps passé dans ses appels à `res.json()`.
+        """
+
+        if streamed: # Lire `res.content` consommerait le flux
+            size = int(res.headers.get('Content-Length') or 0)
+        else:
+            size = len(res.content or b'')
+
+        self.observe(method, url, res.status_code, elapsed, size)
+
+        decode = res.json
+
+        def _json(**kwargs):
+            start = time.perf_counter()
+
+            try:
+                return decode(**kwargs)
+            finally:
+                with self._lock:
+                    self._endpoint(method, url)["decode_time"] += time.perf_counter() - start
+
+        res.json = _json
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Renvoie les mesures par endpoint. Les durées sont en secondes, les percentiles sont calculés sur les `samples` dernières requêtes.
+        """
+
+        res = {}
+
+        with self._lock:
+            for key, endpoint in sorted(self._endpoints.items()):
+                latencies = sorted(endpoint["latencies"])
+                _rank = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else 0.0
+
+                res[key] = {
+                    "count": endpoint["count"],
+                    "errors": endpoint["errors"],
+                    "error_rate": endpoint["errors"] / endpoint["count"] if endpoint["count"] else 0.0,
+                    "statuses": dict(endpoint["statuses"]),
+                    "latency": {
+                        "mean": endpoint["total_time"] / endpoint["count"] if endpoint["count"] else 0.0,
+                        "p50": _rank(0.5),
+                        "p90": _rank(0.9),
+                        "p99": _rank(0.99),
+                        "max": endpoint["max_time"]
+                    },
+                    "histogram": dict(zip(self.BUCKETS, endpoint["histogram"])),
+                    "bytes": endpoint["bytes"],
+                    "decode_time": endpoint["decode_time"]
+                }
+
+        return res
+
+class Transport:
+    """
+    Pool de connexions HTTP partagé entre une interface et tous les modèles qu'elle charge.
+
+    ## Paramètres
+    pool_connections: `int` (optionnel)\n
+        Nombre d'hôtes dont les connexions sont conservées
+    pool_maxsize: `int` (optionnel)\n
+        Nombre maximal de connexions gardées ouvertes par hôte
+    pool_block: `bool` (optionnel)\n
+        Attendre qu'une connexion se libère plutôt que d'en ouvrir une au-delà de `pool_maxsize`
+    keep_alive: `bool` (optionnel)\n
+        Réutiliser ou non les connexions d'une requête à l'autre
+    retry: `.RetryPolicy` (optionnel)\n
+        Politique de nouvelles tentatives et de délais d'attente
+    breaker: `.CircuitBreaker` (optionnel)\n
+        Disjoncteur, `None` pour le désactiver
+    metrics: `.Metrics` (optionnel)\n
+        Mesures par endpoint, désactivées par défaut
+    codec: `.JSONCodec` (optionnel)\n
+        Encodage des corps de requêtes et décodage des réponses (`res.json()`)
+
+    Les méthodes préfixées par `a` (`arequest`, `aget`...) passent par une session `aiohttp` soumise aux mêmes limites. Elles renvoient elles aussi des `requests.Response` pour que le code de lecture des réponses soit commun aux deux modes.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True, retry: RetryPolicy = None, breaker: CircuitBreaker = ..., metrics: Metrics = None, codec: JSONCodec = None) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+
+        self.retry = retry if retry else RetryPolicy()
+        self.breaker = CircuitBreaker() if breaker is ... else breaker
+        self.metrics = metrics
+        self.codec = codec if codec else JSONCodec()
+
+        self.on_write: list[typing.Callable[[str], None]] = [] # Appelés avec l'URL de chaque écriture réussie
+
+        self.session = requests.Session()
+        self.async_session: 'aiohttp.ClientSession' = None
+        self._async_loop: asyncio.AbstractEventLoop = None
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections = pool_connections,
+            pool_maxsize = pool_maxsize,
+            pool_block = pool_block
+        )
+
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def request(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response:
+        if self.metrics is None:
+            return self._request(method, url, **kwargs)
+
+        start = time.perf_counter()
+
+        try:
+            res = self._request(method, url, **kwargs)
+        except requests.RequestException as e:
+            self.metrics.observe(method, url, type(e).__name__, time.perf_counter() - start)
+            raise
+
+        self.metrics.record(method, url, res, time.perf_counter() - start, kwargs.get('stream', False))
+
+        return res
+
+    @staticmethod
+    def encode_params(params: dict | None) -> list[tuple[str, str]] | None:
+        """
+        Paramètres d'URL sous une forme acceptée de la même façon par `requests` et `aiohttp` : booléens en `"true"` / `"false"`, valeurs `None` retirées, listes répétées (`ids=1&ids=2`).
+        """
+
+        if params is None or isinstance(params, (str, bytes)):
+            return params
+
+        res = []
+
+        for key, value in (params.items() if isinstance(params, dict) else params):
+            for item in (value if isinstance(value, (list, tuple, set)) else (value,)):
+                if item is None:
+                    continue
+
+                res.append((key, ('true' if item else 'false') if isinstance(item, bool) else str(item)))
+
+        return res
+
+    def _request(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response:
+        kwargs.setdefault('timeout', self.retry.timeout_for(url))
+        kwargs['params'] = self.encode_params(kwargs.get('params'))
+        self.codec.encode_body(kwargs)
+        idempotent = self.retry.is_idempotent(kwargs)
+        attempt = 0
+
+        while True:
+            if self.breaker:
+                self.breaker.check(url)
+
+            try:
+                res = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(url, False)
+
+                if not self.retry.can_retry(method, attempt, idempotent):
+                    raise
+
+                delay = self.retry.delay(attempt)
+            else:
+                self._record(url, res.status_code < 500)
+
+                if res.status_code not in self.retry.statuses or not self.retry.can_retry(method, attempt, idempotent):
+                    break
+
+                delay = self.retry.delay(attempt, res)
+                res.close() # Rend la connexion au pool avant d'attendre
+
+            attempt += 1
+            time.sleep(delay)
+
+        if not kwargs.get('stream'):
+            res.json = functools.partial(self.codec.decode, res)
+
+        self._notify(method, url, res)
+
+        return res
+
+    def _record(self, url: str, success: bool) -> None:
+        if self.breaker:
+            self.breaker.record(url, success)
+
+    def _notify(self, method: str, url: str, res: requests.Response) -> None:
+        if method != 'GET' and 200 <= res.status_code < 300:
+            for callback in self.on_write:
+                callback(url)
+
+    def get(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return self.request('PUT', url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _get_async_session(self) -> 'aiohttp.ClientSession':
+        if aiohttp is None:
+            raise ImportError("Async interfaces require aiohttp (pip install nsarchive[async]).")
+
+        loop = asyncio.get_running_loop()
+
+        # Une session aiohttp est liée à la boucle qui l'a créée
+        if self.async_session is None or self.async_session.closed or self._async_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit = self.pool_connections * self.pool_maxsize,
+                limit_per_host = self.pool_maxsize,
+                force_close = not self.keep_alive
+            )
+
+            self.async_session = aiohttp.ClientSession(connector = connector)
+            self._async_loop = loop
+
+        return self.async_session
+
+    async def arequest(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response:
+        if self.metrics is None:
+            return await self._arequest(method, url, **kwargs)
+
+        start = time.perf_counter()
+
+        try:
+            res = await self._arequest(method, url, **kwargs)
+        except requests.RequestException as e:
+            self.metrics.observe(method, url, type(e).__name__, time.perf_counter() - start)
+            raise
+
+        self.metrics.record(method, url, res, time.perf_counter() - start, kwargs.get('stream', False))
+
+        return res
+
+    async def _arequest(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response:
+        session = self._get_async_session()
+        send = self._aopen if kwargs.pop('stream', False) else self._asend
+
+        timeout = kwargs.pop('timeout', self.retry.timeout_for(url))
+        kwargs['params'] = self.encode_params(kwargs.get('params'))
+        self.codec.encode_body(kwargs)
+
+        if isinstance(timeout, tuple):
+            kwargs['timeout'] = aiohttp.ClientTimeout(sock_connect = timeout[0], sock_read = timeout[1])
+        elif timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total = timeout)
+
+        idempotent = self.retry.is_idempotent(kwargs)
+        attempt = 0
+
+        while True:
+            if self.breaker:
+                self.breaker.check(url)
+
+            try:
+                res = await send(session, method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(url, False)
+
+                if not self.retry.can_retry(method, attempt, idempotent):
+                    raise
+
+                delay = self.retry.delay(attempt)
+            else:
+                self._record(url, res.status_code < 500)
+
+                if res.status_code not in self.retry.statuses or not self.retry.can_retry(method, attempt, idempotent):
+                    break
+
+                delay = self.retry.delay(attempt, res)
+                res.close()
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+        self._notify(method, url, res)
+
+        return res
+
+    async def _asend(self, session: 'aiohttp.ClientSession', method: str, url: str, **kwargs: typing.Any) -> requests.Response:
+        try:
+            async with session.request(method, url, **kwargs) as _res:
+                res = requests.Response()
+
+                res.status_code = _res.status
+                res.reason = _res.reason
+                res.url = str(_res.url)
+                res.headers = requests.structures.CaseInsensitiveDict(_res.headers)
+                res._content = await _res.read()
+                res._content_consumed = True
+                res.json = functools.partial(self.codec.decode, res)
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(str(e)) from e
+        except aiohttp.ClientConnectionError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+        return res
+
+    async def _aopen(self, session: 'aiohttp.ClientSession', method: str, url: str, **kwargs: typing.Any) -> requests.Response:
+        """
+        Comme `_asend`, sans lire le corps : `res.raw` est la réponse aiohttp, lue par `aiter_content` et libérée par `res.close()`.
+        """
+
+        try:
+            _res = await session.request(method, url, **kwargs)
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(str(e)) from e
+        except aiohttp.ClientConnectionError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+        res = requests.Response()
+
+        res.status_code = _res.status
+        res.reason = _res.reason
+        res.url = str(_res.url)
+        res.headers = requests.structures.CaseInsensitiveDict(_res.headers)
+        res.raw = _res
+        res.close = _res.release
+
+        return res
+
+    @staticmethod
+    async def aiter_content(res: requests.Response, chunk_size: int = 65536) -> typing.AsyncIterator[bytes]:
+        """
+        Lit en flux le corps d'une réponse ouverte avec `stream = True`, en levant les exceptions de `requests` comme `_asend`.
+        """
+
+        try:
+            async for chunk in res.raw.content.iter_chunked(chunk_size):
+                yield chunk
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(str(e)) from e
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    async def aget(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return await self.arequest('GET', url, **kwargs)
+
+    async def apost(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return await self.arequest('POST', url, **kwargs)
+
+    async def aput(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return await self.arequest('PUT', url, **kwargs)
+
+    async def aclose(self) -> None:
+        if self.async_session is not None:
+            await self.async_session.close()
+
+default_transport = Transport() # Utilisé par les modèles créés hors d'une interface
+
+class Model:
+    """
+    Base des modèles renvoyés par les interfaces.
+
+    Les modèles n'ont pas de `__dict__` (`__slots__`) et ne conservent qu'une référence vers l'interface qui les a chargés et le chemin de leur ressource (`/bank/accounts/<id>`...). L'URL, les headers et le transport sont lus sur l'interface à chaque requête : un token renouvelé s'applique donc aussi aux modèles déjà chargés.
+    """
+
+    __slots__ = ('_interface', '_path')
+
+    def __init__(self) -> None:
+        self._interface = None # Interface propriétaire, `None` pour un modèle créé localement
+        self._path: str = "" # Chemin relatif à `_interface.url`, ou URL complète sans interface
+
+    def _bind(self, interface: typing.Any, path: str) -> None:
+        self._interface = interface
+        self._path = path
+
+    def _export(self) -> dict:
+        """
+        Attributs publics du modèle, dans l'ordre de ses `__slots__`.
+        """
+
+        return { name: getattr(self, name) for cls in reversed(type(self).__mro__) for name in getattr(cls, '__slots__', ()) if not name.startswith('_') }
+
+    @property
+    def _url(self) -> str:
+        if self._interface is None:
+            return self._path
+
+        return self._interface.url + self._path
+
+    @_url.setter
+    def _url(self, url: str) -> None:
+        if self._interface is not None and url.startswith(self._interface.url):
+            url = url[len(self._interface.url):]
+
+        self._path = url
+
+    @property
+    def _headers(self) -> dict:
+        if self._interface is None:
+            return {}
+
+        return self._interface.default_headers
+
+    @property
+    def _transport(self) -> Transport:
+        if self._interface is None:
+            return default_transport
+
+        return self._interface.transport
+
+    def _dispatch(self, request: tuple[str, str, dict, typing.Callable[[requests.Response], typing.Any] | None]) -> typing.Any:
+        """
+        Envoie une requête préparée par une méthode `_<op>_request` du modèle : méthode HTTP, URL, arguments du transport et fonction appliquée à une réponse `200`. Les méthodes synchrones et asynchrones (`a<op>`) partagent ainsi la même préparation.
+        """
+
+        method, url, kwargs, applied = request
+
+        return self._applied(self._transport.request(method, url, **kwargs), applied)
+
+    async def _adispatch(self, request: tuple[str, str, dict, typing.Callable[[requests.Response], typing.Any] | None]) -> typing.Any:
+        method, url, kwargs, applied = request
+
+        return self._applied(await self._transport.arequest(method, url, **kwargs), applied)
+
+    @staticmethod
+    def _applied(res: requests.Response, applied: typing.Callable[[requests.Response], typing.Any] | None) -> typing.Any:
+        if res.status_code == 200:
+            return applied(res) if applied is not None else None
+
+        res.raise_for_status()
+
+class Cache:
+    """
+    Cache LRU des données lues par les interfaces, avec une durée de vie par type de modèle.
+
+    Une entrée est supprimée dès qu'une écriture réussie vise l'objet correspondant (`set_name`, `freeze`, `rename`...), que ce soit depuis un modèle ou depuis une interface partageant le même transport.
+
+    ## Paramètres
+    maxsize: `int` (optionnel)\n
+        Nombre maximal d'objets gardés en mémoire
+    ttl: `float` (optionnel)\n
+        Durée de vie par défaut d'une entrée, en secondes
+    ttls: `dict[str, float]` (optionnel)\n
+        Durées de vie propres à certains types (`'individuals'`, `'positions'`, `'accounts'`...)
+    """
+
+    _URL_PATTERN = re.compile(r"/(model/[a-z_]+|bank/accounts|bank/inventories|marketplace/items|marketplace/sales|justice/[a-z]+|parties)/([^/?]+)")
+    _ENTITY_CLASSES = ('entities', 'individuals', 'organizations')
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60, ttls: dict[str, float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = ttls or {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: collections.OrderedDict[tuple[str, str], tuple[float, dict]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, _class: str, id: NSID) -> dict | None:
+        key = (_class, str(id))
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return copy.deepcopy(entry[1])
+
+    def set(self, _class: str, id: NSID, _data: dict) -> None:
+        key = (_class, str(id))
+        expires = time.monotonic() + self.ttls.get(_class, self.ttl)
+
+        with self._lock:
+            self._entries[key] = (expires, copy.deepcopy(_data))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+
+    def invalidate(self, _class: str, id: NSID) -> None:
+        # Une même entité peut être lue comme 'entities', 'individuals' ou 'organizations'
+        classes = self._ENTITY_CLASSES if _class in self._ENTITY_CLASSES else (_class,)
+
+        with self._lock:
+            for _cls in classes:
+                self._entries.pop((_cls, str(id)), None)
+
+    @staticmethod
+    def targets(url: str) -> list[tuple[str, str]]:
+        """
+        Objets `(classe, id)` modifiés par une URL d'écriture (`.../model/individuals/{id}/rename`, `.../bank/accounts/{id}/debit?target=...`).
+        """
+
+        parsed = urllib.parse.urlparse(url)
+        match = Cache._URL_PATTERN.search(parsed.path)
+
+        if not match:
+            return []
+
+        _class = match.group(1).split('/')[-1]
+        res = [ (_class, NSID(match.group(2)) if _class != 'positions' else match.group(2)) ]
+
+        if _class == 'accounts':
+            # Un virement modifie aussi le compte destinataire
+            for target in urllib.parse.parse_qs(parsed.query).get('target', []):
+                res.append(('accounts', NSID(target)))
+
+        return res
+
+    def invalidate_url(self, url: str) -> None:
+        """
+        Supprime les entrées visées par une URL d'écriture (voir `targets`).
+        """
+
+        for _class, id in Cache.targets(url):
+            self.invalidate(_class, id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+class SnapshotStore:
+    """
+    Copie locale persistante (SQLite) des objets lus par les interfaces, avec la date de leur lecture.
+
+    Au démarrage, la première lecture d'un objet (ou d'un `fetch`) présent dans la copie est servie depuis le disque sans attendre le réseau, puis l'objet est relu en arrière-plan et la copie mise à jour : c'est la réconciliation. Une fois réconcilié, un objet est lu normalement (réseau ou `.Cache`) jusqu'à la fin du processus. Les écritures réussies suppriment les copies des objets visés.
+
+    ## Paramètres
+    path: `str`\n
+        Fichier de la base SQLite (`":memory:"` pour une copie non persistante)
+    max_age: `float` (optionnel)\n
+        Âge maximal (secondes) d'une copie servie au démarrage
+    max_ages: `dict[str, float]` (optionnel)\n
+        Âges maximaux propres à certains types (`'positions'`, `'fetch/positions'`, `'accounts'`...)
+    workers: `int` (optionnel)\n
+        Nombre de threads de réconciliation des interfaces synchrones
+    """
+
+    def __init__(self, path: str, max_age: float = 86400, max_ages: dict[str, float] = None, workers: int = 2) -> None:
+        self.path = path
+        self.max_age = max_age
+        self.max_ages = max_ages or {}
+        self.workers = workers
+
+        self.served: int = 0
+        self.reconciled: int = 0
+        self.failures: int = 0
+
+        self._db = sqlite3.connect(path, check_same_thread = False, isolation_level = None)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS snapshots (kind TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, fetched_at REAL NOT NULL, PRIMARY KEY (kind, key)) WITHOUT ROWID")
+
+        self._lock = threading.Lock()
+        self._fresh: set[tuple[str, str]] = set() # Clés relues depuis le réseau par ce processus
+        self._pending: set[tuple[str, str]] = set()
+        self._tasks: set = set() # Réconciliations en cours (futures ou tâches asyncio)
+        self._executor: concurrent.futures.ThreadPoolExecutor = None
+
+    def get(self, kind: str, key: str) -> tuple[typing.Any, float] | None:
+        """
+        Renvoie la copie d'un objet et la date (timestamp) de sa lecture, quel que soit son âge.
+        """
+
+        with self._lock:
+            row = self._db.execute("SELECT data, fetched_at FROM snapshots WHERE kind = ? AND key = ?", (kind, str(key))).fetchone()
+
+        if row is None:
+            return None
+
+        return json.loads(row[0]), row[1]
+
+    def derive(self, name: str) -> 'SnapshotStore':
+        """
+        Nouvelle copie locale avec les mêmes réglages, dans un fichier voisin propre à `name` (`snapshots.db` -> `snapshots.<name>.db`).
+        """
+
+        if self.path == ":memory:":
+            path = self.path
+        else:
+            root, ext = os.path.splitext(self.path)
+            path = f"{root}.{name}{ext}"
+
+        return SnapshotStore(path, self.max_age, self.max_ages, self.workers)
+
+    def set(self, kind: str, key: str, _data: typing.Any, fetched_at: float = None) -> None:
+        fetched_at = time.time() if fetched_at is None else fetched_at
+
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO snapshots (kind, key, data, fetched_at) VALUES (?, ?, ?, ?)", (kind, str(key), json.dumps(_data), fetched_at))
+            self._fresh.add((kind, str(key)))
+
+    def serve(self, kind: str, key: str) -> typing.Any | None:
+        """
+        Renvoie la copie d'un objet qui n'a pas encore été relu par ce processus, si elle n'est pas trop ancienne.
+        """
+
+        if (kind, str(key)) in self._fresh:
+            return None
+
+        entry = self.get(kind, key)
+
+        if entry is None or time.time() - entry[1] > self.max_ages.get(kind, self.max_age):
+            return None
+
+        self.served += 1
+
+        return entry[0]
+
+    def claim(self, kind: str, key: str) -> bool:
+        """
+        Réserve la réconciliation d'un objet. Renvoie `False` si elle est déjà en cours ou faite.
+        """
+
+        key = (kind, str(key))
+
+        with self._lock:
+            if key in self._pending or key in self._fresh:
+                return False
+
+            self._pending.add(key)
+
+        return True
+
+    def release(self, kind: str, key: str, ok: bool = True) -> None:
+        with self._lock:
+            self._pending.discard((kind, str(key)))
+
+            if ok:
+                self.reconciled += 1
+            else:
+                self.failures += 1
+
+    def track(self, task: typing.Any) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def submit(self, kind: str, key: str, refresh: typing.Callable[[], None]) -> None:
+        """
+        Lance la réconciliation d'un objet dans un thread, sauf si elle est déjà en cours ou faite.
+        """
+
+        if not self.claim(kind, key):
+            return
+
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(max_workers = self.workers, thread_name_prefix = "nsarchive-snapshots")
+
+        def _run():
+            try:
+                refresh()
+            except Exception:
+                self.release(kind, key, False)
+            else:
+                self.release(kind, key)
+
+        self.track(self._executor.submit(_run))
+
+    def wait(self, timeout: float = None) -> None:
+        """
+        Attend la fin des réconciliations lancées dans des threads.
+        """
+
+        concurrent.futures.wait([ task for task in list(self._tasks) if isinstance(task, concurrent.futures.Future) ], timeout = timeout)
+
+    def invalidate(self, kind: str, key: str) -> None:
+        kinds = Cache._ENTITY_CLASSES if kind in Cache._ENTITY_CLASSES else (kind,)
+
+        with self._lock:
+            for _kind in kinds:
+                self._db.execute("DELETE FROM snapshots WHERE kind = ? AND key = ?", (_kind, str(key)))
+
+    def invalidate_url(self, url: str) -> None:
+        for _class, id in Cache.targets(url):
+            self.invalidate(_class, id)
+
+    def invalidate_fetches(self, _class: str) -> None:
+        """
+        Supprime les copies des `fetch` d'un type, dont les résultats ne tiennent pas compte des objets créés ou supprimés depuis.
+        """
+
+        classes = Cache._ENTITY_CLASSES if _class in Cache._ENTITY_CLASSES else (_class,)
+
+        with self._lock:
+            for _cls in classes:
+                self._db.execute("DELETE FROM snapshots WHERE kind = ?", ('fetch/' + _cls,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM snapshots")
+            self._fresh.clear()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait = True)
+
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = self._db.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+        return {
+            "size": size,
+            "served": self.served,
+            "reconciled": self.reconciled,
+            "failures": self.failures,
+            "pending": len(self._pending)
+        }
+
+class ValidatorStore:
+    """
+    Mémorise, pour chaque URL lue, les validateurs HTTP (`ETag`, `Last-Modified`) et le corps déjà décodé de la réponse, afin d'envoyer des requêtes conditionnelles et de réutiliser ce corps lorsque le serveur répond `304 Not Modified`.
+
+    Les corps stockés sont partagés entre les lectures : ils ne doivent pas être modifiés.
+
+    ## Paramètres
+    maxsize: `int` (optionnel)\n
+        Nombre maximal d'URLs mémorisées
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.revalidated: int = 0 # Nombre de réponses 304
+
+        self._entries: collections.OrderedDict[str, tuple[dict, typing.Any]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def conditions(self, url: str) -> tuple[dict, typing.Any]:
+        """
+        Renvoie les headers conditionnels à envoyer pour une URL et le corps associé (`{}` et `None` si l'URL est inconnue).
+        """
+
+        with self._lock:
+            entry = self._entries.get(url)
+
+            if entry is None:
+                return {}, None
+
+            self._entries.move_to_end(url)
+
+            return entry
+
+    def store(self, url: str, res: requests.Response, _data: typing.Any) -> None:
+        headers = {}
+
+        if res.headers.get('ETag'):
+            headers['If-None-Match'] = res.headers['ETag']
+
+        if res.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = res.headers['Last-Modified']
+
+        with self._lock:
+            if not headers:
+                self._entries.pop(url, None)
+                return
+
+            self._entries[url] = (headers, _data)
+            self._entries.move_to_end(url)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+class SingleFlight:
+    """
+    Regroupe les lectures identiques simultanées : le premier appelant envoie la requête, les suivants attendent sa réponse au lieu d'en envoyer une autre. Chacun d'eux reçoit une copie indépendante du résultat, ou la même exception.
+    """
+
+    def __init__(self) -> None:
+        self.shared: int = 0 # Nombre d'appels servis par une requête déjà en cours
+
+        self._calls: dict[typing.Hashable, list] = {} # clé -> [futur, nombre d'appelants en attente]
+        self._lock = threading.Lock()
+
+    def _join(self, key: typing.Hashable, future_class: type) -> tuple[list, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+
+            if call is not None:
+                call[1] += 1
+                self.shared += 1
+
+                return call, False
+
+            call = self._calls[key] = [ future_class(), 0 ]
+
+            return call, True
+
+    def _leave(self, key: typing.Hashable) -> None:
+        # Plus aucun appelant ne peut rejoindre l'appel : call[1] est définitif
+        with self._lock:
+            del self._calls[key]
+
+    def do(self, key: typing.Hashable, fn: typing.Callable[[], typing.Any]) -> typing.Any:
+        call, leader = self._join(key, concurrent.futures.Future)
+
+        if not leader:
+            return copy.deepcopy(call[0].result())
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._leave(key)
+            call[0].set_exception(e)
+            raise
+
+        self._leave(key)
+
+        # Copie figée avant que l'appelant principal ne puisse modifier son résultat
+        call[0].set_result(copy.deepcopy(result) if call[1] else result)
+
+        return result
+
+    async def ado(self, key: typing.Hashable, fn: typing.Callable[[], typing.Awaitable]) -> typing.Any:
+        call, leader = self._join(key, asyncio.get_running_loop().create_future)
+
+        if not leader:
+            return copy.deepcopy(await asyncio.shield(call[0]))
+
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._leave(key)
+            call[0].set_exception(e)
+
+            if call[1] == 0:
+                call[0].exception() # Évite l'avertissement "Future exception was never retrieved"
+
+            raise
+
+        self._leave(key)
+        call[0].set_result(copy.deepcopy(result) if call[1] else result)
+
+        return result
 
 class Interface:
     """
     Instance qui servira de base à toutes les interfaces.
     """
 
-    def __init__(self, url: str, token: str = None):
+    # Chemin des objets lus par `_from_cache` (`model/<classe>` par défaut)
+    _PATHS = {
+        'accounts': 'bank/accounts',
+        'inventories': 'bank/inventories',
+        'items': 'marketplace/items',
+        'sales': 'marketplace/sales',
+        'parties': 'parties',
+        'reports': 'justice/reports',
+        'lawsuits': 'justice/lawsuits',
+        'sanctions': 'justice/sanctions'
+    }
+
+    def __init__(self, url: str, token: str = None, transport: Transport = None, cache: Cache = None, snapshots: SnapshotStore = None):
         self.url = url
         self.token = token
+        self.transport = transport if transport else Transport()
+        self.cache = cache
+        self.snapshots = snapshots # Copie locale persistante servie au démarrage (voir `.SnapshotStore`)
+        self.validators = ValidatorStore() # Requêtes conditionnelles (ETag / Last-Modified)
+        self.flights = SingleFlight() # Lectures identiques simultanées, `None` pour désactiver
+        self.lazy = False # Modèles renvoyés par les fetch construits à la demande (voir `.lazy_field`)
+
+        if cache and cache.invalidate_url not in self.transport.on_write:
+            self.transport.on_write.append(cache.invalidate_url)
+
+        if snapshots and snapshots.invalidate_url not in self.transport.on_write:
+            self.transport.on_write.append(snapshots.invalidate_url)
+
         self.zone = 20 # 10 = Serveur test, 20 = Serveur principal, 30 = Serveur de patientage, 40 = Scratch World
 
         self.default_headers = {
@@ -62,7 +1371,7 @@ class Interface:
         # Vérification (ralentit considérablement les requêtes)*
 
         try:
-            test_res = requests.get(f'{self.url}/ping')
+            test_res = self.transport.get(f'{self.url}/ping')
 
             if test_res.status_code == 200:
                 ndb_ver = test_res.json()['_version']
@@ -79,6 +1388,8 @@ class Interface:
         """
         Duplique l'interface en se faisant passer pour une autre entité. Aucune erreur ne sera levée si l'entité n'existe pas (hormis les éventuels 401 ou 404 renvoyés par le serveur).
 
+        L'alias partage le transport de l'interface, mais pas ses données lues : il a son propre `.Cache` et sa propre copie locale (`SnapshotStore.derive`), pour qu'une réponse propre à une identité ne soit jamais servie à l'autre.
+
         ## Paramètres
         alias: `NSID`\n
             ID de l'entité à simuler
@@ -91,21 +1402,135 @@ class Interface:
 
         token = self.token + ':' + str(alias)
 
-        return self.__class__(self.url, token)
+        cache = Cache(self.cache.maxsize, self.cache.ttl, self.cache.ttls) if self.cache is not None else None
+        snapshots = self.snapshots.derive(str(alias)) if self.snapshots is not None else None
+
+        interface = self.__class__(self.url, token, transport = self.transport, cache = cache, snapshots = snapshots)
+        interface.lazy = self.lazy
+
+        return interface
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Mesures par endpoint des requêtes envoyées par l'interface et par les modèles qu'elle a chargés (voir `.Metrics`).
+
+        ## Renvoie
+        - `dict` vide si le transport n'a pas de `metrics`
+        """
+
+        if self.transport.metrics is None:
+            return {}
+
+        return self.transport.metrics.stats()
 
     def request_token(self, username: str, password: str) -> str | None:
-        res = requests.post(f"{self.url}/auth/login", json = {
+        res = self.transport.post(f"{self.url}/auth/login", json = {
             "username": username,
             "password": password
         })
 
-        if res.status_code == 200:
-            return res.json()["token"]
-        elif res.status_code in (401, 403):
+        return self._parse(res)["token"]
+
+    """
+    ---- REQUÊTES ----
+
+    Construction des requêtes et lecture des réponses, communes aux interfaces synchrones et asynchrones : `.AsyncInterface` ne redéfinit que les méthodes qui envoient une requête.
+    """
+
+    @staticmethod
+    def _parse(res: requests.Response, missing: bool = False) -> typing.Any:
+        """
+        Corps décodé d'une réponse réussie, ou l'exception correspondant à son code d'erreur.
+
+        ## Paramètres
+        res: `requests.Response`\n
+            Réponse du serveur
+        missing: `bool` (optionnel)\n
+            Renvoyer `None` plutôt que lever une erreur en cas de `404`
+        """
+
+        if 200 <= res.status_code < 300:
+            return res.json()
+        elif missing and res.status_code == 404:
+            return None
+        elif res.status_code in (403, 401):
             raise PermissionError(res.json()['message'])
+        elif res.status_code == 409:
+            raise FileExistsError(res.json()['message'])
         else:
             raise Exception(f"Error {res.status_code}: {res.json()['message']}")
 
+    @staticmethod
+    def _json_or_raise(res: requests.Response) -> typing.Any:
+        """
+        Corps décodé d'une réponse, `requests.HTTPError` pour un code d'erreur (lecture utilisée par les méthodes publiques des interfaces).
+        """
+
+        if res.status_code != 200:
+            res.raise_for_status()
+
+        return res.json()
+
+    @staticmethod
+    def _load_rows(rows: list[dict], loader: typing.Callable[[dict], typing.Any]) -> list:
+        return [ loader(_data) for _data in rows if _data ]
+
+    def _fetch_url(self, _class: str, query: dict) -> str:
+        return f"{self.url}/fetch/{_class}?{urllib.parse.urlencode(Transport.encode_params(query), quote_via = urllib.parse.quote)}"
+
+    def _request_json(self, method: str, url: str, body: dict = None) -> typing.Any:
+        """
+        Envoie une requête avec les en-têtes par défaut et renvoie son corps décodé (voir `_json_or_raise`).
+        """
+
+        return self._json_or_raise(self.transport.request(method, url, headers = self.default_headers, json = body))
+
+    def _get_optional(self, url: str) -> typing.Any:
+        """
+        Corps décodé d'une lecture, `None` si le serveur répond par une erreur.
+        """
+
+        res = self.transport.get(url, headers = self.default_headers)
+
+        return res.json() if res else None
+
+    def _get_cached(self, _class: str, id: NSID, url: str, conditional: bool = False) -> dict | None:
+        """
+        Données d'un objet, depuis le cache ou la copie locale si possible, sinon depuis `url`.
+
+        ## Paramètres
+        _class: `str`\n
+            Classe de l'objet (`accounts`, `parties`...)
+        id: `NSID`\n
+            ID de l'objet
+        url: `str`\n
+            URL de lecture
+        conditional: `bool` (optionnel)\n
+            Lire avec `_get_json`, en revalidant la réponse précédente (`304`)
+        """
+
+        _data = self._from_cache(_class, id)
+
+        if _data is None:
+            _data = self._validated(*self._get_json(url)) if conditional else self._request_json('GET', url)
+            self._to_cache(_class, id, _data)
+
+        return _data
+
+    @staticmethod
+    def _validated(res: requests.Response, _data: typing.Any) -> typing.Any:
+        if res.status_code not in (200, 304):
+            res.raise_for_status()
+
+        return _data
+
+    def _fetch_rows(self, _class: str, **query: typing.Any) -> list[dict]:
+        """
+        Résultats bruts d'une requête `fetch` envoyée avec les en-têtes par défaut (liste vide si le serveur ne renvoie rien).
+        """
+
+        return self._request_json('GET', self._fetch_url(_class, query)) or []
+
     def _get_item(self, endpoint: str, body: dict = None, headers: dict = None) -> dict:
         """
         Récupère des données JSON depuis l'API
@@ -123,25 +1548,115 @@ class Interface:
         - `None` si aucune donnée n'est trouvée
         """
 
-        if not headers:
-            headers = self.default_headers
+        if self.flights is None:
+            return self._send_item(endpoint, body, headers)
 
-        res = requests.get(f"{self.url}/{endpoint}", headers = headers, json = body, timeout = 5)
+        return self.flights.do(self._flight_key(endpoint, body, headers), lambda: self._send_item(endpoint, body, headers))
 
-        if 200 <= res.status_code < 300:
-            return res.json()
-        elif res.status_code == 404:
-            return
-        elif res.status_code in (403, 401):
-            raise PermissionError(res.json()['message'])
-        else:
-            raise Exception(f"Error {res.status_code}: {res.json()['message']}")
+    def _send_item(self, endpoint: str, body: dict = None, headers: dict = None) -> dict:
+        res, _data = self._get_json(f"{self.url}/{endpoint}", body, headers)
+
+        return self._received(res, _data)
+
+    def _received(self, res: requests.Response, _data: typing.Any) -> typing.Any:
+        if 200 <= res.status_code < 300 or res.status_code == 304:
+            return _data
+
+        return self._parse(res, missing = True)
+
+    def _get_json(self, url: str, body: dict = None, headers: dict = None) -> tuple[requests.Response, typing.Any]:
+        """
+        Envoie une requête GET conditionnelle si l'URL a déjà été lue.
+
+        ## Renvoie
+        - La réponse et son corps décodé (celui de la lecture précédente en cas de `304`, `None` en cas d'erreur)
+        """
+
+        headers, previous = self._conditional(url, headers)
+        res = self.transport.get(url, headers = headers, json = body)
+
+        return res, self._read_json(url, res, previous)
+
+    def _conditional(self, url: str, headers: dict = None) -> tuple[dict, typing.Any]:
+        """
+        En-têtes d'une lecture, complétés des conditions (`If-None-Match`, `If-Modified-Since`) d'une lecture précédente, et le corps de celle-ci.
+        """
+
+        headers = dict(headers or self.default_headers)
+        conditions, previous = self.validators.conditions(url) if self.validators else ({}, None)
+        headers.update(conditions)
+
+        return headers, previous
+
+    def _flight_key(self, endpoint: str, body: dict = None, headers: dict = None) -> tuple:
+        headers = headers or self.default_headers
+
+        return (endpoint, json.dumps(body, sort_keys = True) if body else None, tuple(sorted(headers.items())))
+
+    def _read_json(self, url: str, res: requests.Response, previous: typing.Any) -> typing.Any:
+        if res.status_code == 304:
+            self.validators.revalidated += 1
+            return previous
+
+        if not 200 <= res.status_code < 300:
+            return None
+
+        _data = res.json()
+
+        if self.validators:
+            self.validators.store(url, res, _data)
+
+        return _data
 
     def _get_by_ID(self, _class: str, id: NSID) -> dict:
-        _data = self._get_item(f"/model/{_class}/{id}")
+        _data = self._from_cache(_class, id)
+
+        if _data is None:
+            _data = self._get_item(f"/model/{_class}/{id}")
+            self._to_cache(_class, id, _data)
 
         return _data
 
+    def _from_cache(self, _class: str, id: NSID) -> dict | None:
+        if self.cache is not None:
+            _data = self.cache.get(_class, id)
+
+            if _data is not None:
+                return _data
+
+        if self.snapshots is not None:
+            _data = self.snapshots.serve(_class, id)
+
+            if _data is not None:
+                self._reconcile(_class, id, lambda: self._refresh(_class, id))
+
+            return _data
+
+    def _to_cache(self, _class: str, id: NSID, _data: dict) -> None:
+        if _data is None:
+            return
+
+        if self.cache is not None:
+            self.cache.set(_class, id, _data)
+
+        if self.snapshots is not None:
+            self.snapshots.set(_class, id, _data)
+
+    def _reconcile(self, kind: str, key: str, refresh: typing.Callable) -> None:
+        self.snapshots.submit(kind, key, refresh)
+
+    def _refresh(self, _class: str, id: NSID) -> None:
+        """
+        Relit un objet servi depuis la copie locale et met celle-ci à jour.
+        """
+
+        _data = self._send_item(f"{self._PATHS.get(_class, 'model/' + _class)}/{id}")
+
+        if _data is None:
+            self.snapshots.invalidate(_class, id)
+        else:
+            self._to_cache(_class, id, _data)
+
     def _put_in_db(self, endpoint: str, body: dict = {}, headers: dict = None, use_PUT: bool = False) -> None:
         """
         Publie des données JSON dans une table nation-db.
@@ -155,18 +1670,16 @@ class Interface:
             Headers à envoyer
         """
 
-        if not headers:
-            headers = headers
+        res = self.transport.request('PUT' if use_PUT else 'POST', f"{self.url}/{endpoint}", headers = headers, json = body)
 
-        if use_PUT:
-            res = requests.put(f"{self.url}/{endpoint}", headers = headers, json = body)
-        else:
-            res = requests.post(f"{self.url}/{endpoint}", headers = headers, json = body)
+        return self._written(res)
 
+    @staticmethod
+    def _written(res: requests.Response) -> typing.Any:
         if 200 <= res.status_code < 300:
             return res.json()
-        else:
-            res.raise_for_status()
+
+        res.raise_for_status()
 
     def _delete(self, _class: str, ids: list[NSID]) -> None:
         """
@@ -179,31 +1692,135 @@ class Interface:
             ID des entités à supprimer
         """
 
-        res = requests.post(f"{self.url}/delete_{_class}", json = { "ids": ids })
+        res = self.transport.post(f"{self.url}/delete_{_class}", json = { "ids": ids })
 
-        if 200 <= res.status_code < 300:
-            return res.json()
-        elif res.status_code in (403, 401):
-            raise PermissionError(res.json()['message'])
-        else:
-            raise Exception(f"Error {res.status_code}: {res.json()['message']}")
+        return self._deleted(_class, ids, res)
+
+    def _deleted(self, _class: str, ids: list[NSID], res: requests.Response) -> typing.Any:
+        _data = self._parse(res)
+
+        for id in ids:
+            if self.cache is not None:
+                self.cache.invalidate(_class, id)
+
+            if self.snapshots is not None:
+                self.snapshots.invalidate(_class, id)
+
+        if self.snapshots is not None:
+            self.snapshots.invalidate_fetches(_class)
+
+        return _data
 
     def _delete_by_ID(self, _class: str, id: NSID):
         utils.warn("Method '_delete_by_id' is deprecated. Use '_delete' instead.")
-        self._delete(_class, id)
+        return self._delete(_class, [ id ])
 
     def fetch(self, _class: str, **query: typing.Any) -> list:
-        res = requests.get(f"{self.url}/fetch/{_class}", params = query)
+        matches = self._serve_fetch(_class, query)
+
+        if matches is not None:
+            return matches
+
+        return self._fetch(_class, **query)
+
+    def _serve_fetch(self, _class: str, query: dict) -> list | None:
+        """
+        Résultats d'un `fetch` servis depuis la copie locale (et relus en arrière-plan), `None` s'ils n'y sont pas.
+        """
+
+        if self.snapshots is None:
+            return None
+
+        key = urllib.parse.urlencode(sorted(query.items()))
+        matches = self.snapshots.serve('fetch/' + _class, key)
+
+        if matches is not None:
+            self._reconcile('fetch/' + _class, key, lambda: self._fetch(_class, **query))
+
+        return matches
+
+    def _fetch(self, _class: str, **query: typing.Any) -> list:
+        res = self.transport.get(f"{self.url}/fetch/{_class}", params = query)
+
+        return self._fetched(_class, query, res)
 
+    def _fetched(self, _class: str, query: dict, res: requests.Response) -> list:
         if res.status_code == 200:
             matches = res.json()
         elif res.status_code in (401, 403):
-            matches = []
+            return []
         else:
             res.raise_for_status()
 
+        if self.snapshots is not None:
+            self.snapshots.set('fetch/' + _class, urllib.parse.urlencode(sorted(query.items())), matches)
+
         return matches
 
+    def iter_fetch(self, _class: str, chunk_size: int = 65536, **query: typing.Any) -> typing.Iterator[dict]:
+        """
+        Équivalent de `fetch` qui lit la réponse en flux et renvoie les résultats un par un, sans charger la liste complète en mémoire.
+
+        ## Paramètres
+        _class: `str`\n
+            Classe des éléments à récupérer
+        chunk_size: `int` (optionnel)\n
+            Taille (en octets) des blocs lus sur la connexion
+        query: `**dict`\n
+            La requête pour filtrer les éléments
+
+        ## Renvoie
+        - `Iterator[dict]`
+        """
+
+        res = self.transport.get(f"{self.url}/fetch/{_class}", headers = self.default_headers, params = query, stream = True)
+
+        with res:
+            if res.status_code in (401, 403):
+                return
+            elif res.status_code != 200:
+                res.raise_for_status()
+
+            for _data in utils.iter_json_array(res.iter_content(chunk_size), self.transport.codec.parser()):
+                if _data is None: continue
+
+                yield _data
+
+    def _get_many(self, getter: typing.Callable[[NSID], typing.Any], ids: list[NSID], max_workers: int = None) -> list:
+        """
+        Applique `getter` à plusieurs IDs en parallèle.
+
+        ## Paramètres
+        getter: `Callable`\n
+            Méthode renvoyant l'objet correspondant à un ID (`get_entity`, `get_account`...)
+        ids: `list[NSID]`\n
+            IDs à récupérer, éventuellement en double
+        max_workers: `int` (optionnel)\n
+            Nombre maximal de requêtes simultanées (par défaut la taille du pool de connexions)
+
+        ## Renvoie
+        - `list` des objets dans l'ordre des IDs, avec `None` pour les IDs introuvables. Un ID présent plusieurs fois n'est demandé qu'une fois et renvoie le même objet.
+        """
+
+        ids = NSID.many(ids)
+        unique = list(dict.fromkeys(ids))
+
+        if not unique:
+            return []
+
+        def _get(id: NSID):
+            try:
+                return getter(id)
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code == 404:
+                    return None
+
+                raise
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers = min(max_workers or self.transport.pool_maxsize, len(unique))) as executor:
+            results = dict(zip(unique, executor.map(_get, unique)))
+
+        return [ results[id] for id in ids ]
 
     def _upload_file(self, bucket: str, name: str, data: bytes, overwrite: bool = False, headers: dict = None) -> dict:
         """
@@ -226,27 +1843,24 @@ class Interface:
         - `None` en cas d'échec
         """
 
-        if not headers:
-            headers = self.default_headers
-            headers['Content-Type'] = 'image/png'
+        url, headers, fields, file = self._upload_request(bucket, name, data, overwrite, headers)
+        res = self.transport.put(url, headers = headers, data = fields, files = { "file": file })
+
+        return self._parse(res)
+
+    def _upload_request(self, bucket: str, name: str, data: bytes, overwrite: bool = False, headers: dict = None) -> tuple[str, dict, dict, tuple]:
+        """
+        URL, en-têtes, champs et fichier (nom, contenu, type) d'un envoi multipart. Le `Content-Type` est laissé à la bibliothèque HTTP, qui y ajoute la délimitation des parties.
+        """
 
-        body = {
+        headers = { key: value for key, value in (headers or self.default_headers).items() if key.lower() != 'content-type' }
+
+        fields = {
             "name": name,
             "overwrite": json.dumps(overwrite)
         }
 
-        file = ("file", "image/png", data)
-
-        res = requests.put(f"{self.url}/upload_file/{bucket}", headers = headers, json = body, files = [ file ])
-
-        if res.status_code == 200:
-            return res.json()
-        elif res.status_code in (403, 401):
-            raise PermissionError(res.json()['message'])
-        elif res.status_code == 409:
-            raise FileExistsError(res.json()['message'])
-        else:
-            raise Exception(f"Error {res.status_code}: {res.json()['message']}") 
+        return f"{self.url}/upload_file/{bucket}", headers, fields, (name, data, "image/png")
 
     def _download_from_storage(self, bucket: str, path: str, headers: dict = None) -> bytes:
         """
@@ -265,11 +1879,178 @@ class Interface:
         if not headers:
             headers = self.default_headers
 
-        res = requests.get(f"{self.url}/drive/{bucket}/{path}", headers = headers)
+        res = self.transport.get(f"{self.url}/drive/{bucket}/{path}", headers = headers)
 
-        if res.status_code == 200:
-            return res.json()
-        elif res.status_code in (403, 401):
-            raise PermissionError(res.json()['message'])
+        return self._parse(res)
+
+
+class AsyncInterface(Interface):
+    """
+    Équivalent asynchrone de `.Interface`. Les requêtes passent par la session `aiohttp` du transport et doivent être attendues (`await`).
+    """
+
+    async def request_token(self, username: str, password: str) -> str | None:
+        res = await self.transport.apost(f"{self.url}/auth/login", json = {
+            "username": username,
+            "password": password
+        })
+
+        return self._parse(res)["token"]
+
+    async def _request_json(self, method: str, url: str, body: dict = None) -> typing.Any:
+        return self._json_or_raise(await self.transport.arequest(method, url, headers = self.default_headers, json = body))
+
+    async def _get_optional(self, url: str) -> typing.Any:
+        res = await self.transport.aget(url, headers = self.default_headers)
+
+        return res.json() if res else None
+
+    async def _get_cached(self, _class: str, id: NSID, url: str, conditional: bool = False) -> dict | None:
+        _data = self._from_cache(_class, id)
+
+        if _data is None:
+            _data = self._validated(*await self._get_json(url)) if conditional else await self._request_json('GET', url)
+            self._to_cache(_class, id, _data)
+
+        return _data
+
+    async def _fetch_rows(self, _class: str, **query: typing.Any) -> list[dict]:
+        return await self._request_json('GET', self._fetch_url(_class, query)) or []
+
+    async def _get_item(self, endpoint: str, body: dict = None, headers: dict = None) -> dict:
+        if self.flights is None:
+            return await self._send_item(endpoint, body, headers)
+
+        return await self.flights.ado(self._flight_key(endpoint, body, headers), lambda: self._send_item(endpoint, body, headers))
+
+    async def _send_item(self, endpoint: str, body: dict = None, headers: dict = None) -> dict:
+        res, _data = await self._get_json(f"{self.url}/{endpoint}", body, headers)
+
+        return self._received(res, _data)
+
+    async def _get_json(self, url: str, body: dict = None, headers: dict = None) -> tuple[requests.Response, typing.Any]:
+        headers, previous = self._conditional(url, headers)
+        res = await self.transport.aget(url, headers = headers, json = body)
+
+        return res, self._read_json(url, res, previous)
+
+    async def _get_by_ID(self, _class: str, id: NSID) -> dict:
+        _data = self._from_cache(_class, id)
+
+        if _data is None:
+            _data = await self._get_item(f"/model/{_class}/{id}")
+            self._to_cache(_class, id, _data)
+
+        return _data
+
+    async def _put_in_db(self, endpoint: str, body: dict = {}, headers: dict = None, use_PUT: bool = False) -> None:
+        res = await self.transport.arequest('PUT' if use_PUT else 'POST', f"{self.url}/{endpoint}", headers = headers, json = body)
+
+        return self._written(res)
+
+    async def _delete(self, _class: str, ids: list[NSID]) -> None:
+        res = await self.transport.apost(f"{self.url}/delete_{_class}", json = { "ids": ids })
+
+        return self._deleted(_class, ids, res)
+
+    async def _delete_by_ID(self, _class: str, id: NSID):
+        utils.warn("Method '_delete_by_id' is deprecated. Use '_delete' instead.")
+        return await self._delete(_class, [ id ])
+
+    async def fetch(self, _class: str, **query: typing.Any) -> list:
+        matches = self._serve_fetch(_class, query)
+
+        if matches is not None:
+            return matches
+
+        return await self._fetch(_class, **query)
+
+    async def _fetch(self, _class: str, **query: typing.Any) -> list:
+        res = await self.transport.aget(f"{self.url}/fetch/{_class}", params = query)
+
+        return self._fetched(_class, query, res)
+
+    def _reconcile(self, kind: str, key: str, refresh: typing.Callable[[], typing.Awaitable]) -> None:
+        # Relu sur la boucle de l'interface : la session aiohttp lui est liée
+        if not self.snapshots.claim(kind, key):
+            return
+
+        async def _run():
+            try:
+                await refresh()
+            except Exception:
+                self.snapshots.release(kind, key, False)
+            else:
+                self.snapshots.release(kind, key)
+
+        self.snapshots.track(asyncio.get_running_loop().create_task(_run()))
+
+    async def _refresh(self, _class: str, id: NSID) -> None:
+        _data = await self._send_item(f"{self._PATHS.get(_class, 'model/' + _class)}/{id}")
+
+        if _data is None:
+            self.snapshots.invalidate(_class, id)
         else:
-            raise Exception(f"Error {res.status_code}: {res.json()['message']}") 
+            self._to_cache(_class, id, _data)
+
+    async def iter_fetch(self, _class: str, chunk_size: int = 65536, **query: typing.Any) -> typing.AsyncIterator[dict]:
+        res = await self.transport.aget(f"{self.url}/fetch/{_class}", headers = self.default_headers, params = query, stream = True)
+
+        try:
+            if res.status_code in (401, 403):
+                return
+            elif res.status_code != 200:
+                res.raise_for_status()
+
+            parser = self.transport.codec.parser()
+
+            async for chunk in self.transport.aiter_content(res, chunk_size):
+                for _data in parser.feed(chunk):
+                    if _data is None: continue
+
+                    yield _data
+
+            for _data in parser.feed(b'', final = True):
+                if _data is None: continue
+
+                yield _data
+        finally:
+            res.close()
+
+    async def _get_many(self, getter: typing.Callable[[NSID], typing.Awaitable], ids: list[NSID], max_workers: int = None) -> list:
+        ids = NSID.many(ids)
+        unique = list(dict.fromkeys(ids))
+
+        semaphore = asyncio.Semaphore(max_workers or self.transport.pool_maxsize)
+
+        async def _get(id: NSID):
+            async with semaphore:
+                try:
+                    return await getter(id)
+                except requests.HTTPError as e:
+                    if e.response is not None and e.response.status_code == 404:
+                        return None
+
+                    raise
+
+        results = dict(zip(unique, await asyncio.gather(*( _get(id) for id in unique ))))
+
+        return [ results[id] for id in ids ]
+
+    async def _download_from_storage(self, bucket: str, path: str, headers: dict = None) -> bytes:
+        if not headers:
+            headers = self.default_headers
+
+        res = await self.transport.aget(f"{self.url}/drive/{bucket}/{path}", headers = headers)
+
+        return self._parse(res)
+
+    async def _upload_file(self, bucket: str, name: str, data: bytes, overwrite: bool = False, headers: dict = None) -> dict:
+        url, headers, fields, (filename, content, content_type) = self._upload_request(bucket, name, data, overwrite, headers)
+
+        form = aiohttp.FormData(fields)
+        form.add_field("file", content, filename = filename, content_type = content_type)
+
+        res = await self.transport.aput(url, headers = headers, data = form)
+
+        return self._parse(res)
@@ -1,11 +1,24 @@
-import requests
+import bisect
+import hashlib
+import json
+import os
+import re
+import threading
 import time
-import urllib
+import typing
+import urllib.parse
+import uuid
 
-from .base import NSID
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
+from .base import NSID, Interface, Model
+from .. import mandate
 
-class BankAccount:
+
+class BankAccount(Model):
     """
     Compte en banque d'une entité, individuelle ou collective.
 
@@ -24,9 +37,10 @@ class BankAccount:
         Somme entrante sur le compte depuis la dernière réinitialisation (tous les ~ 28 jours)
     """
 
+    __slots__ = ('id', 'owner_id', 'register_date', 'tag', 'bank', 'amount', 'income', 'frozen', 'flagged')
+
     def __init__(self, owner_id: NSID) -> None:
-        self._url: str = ""
-        self._headers: dict = {}
+        super().__init__()
 
         self.id: NSID = NSID(owner_id)
         self.owner_id: NSID = NSID(owner_id)
@@ -40,9 +54,8 @@ class BankAccount:
         self.frozen: bool = False
         self.flagged: bool = False
 
-    def _load(self, _data: dict, url: str, headers: dict) -> None:
-        self._url = url + '/bank/accounts/' + _data['id']
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/bank/accounts/' + _data['id'])
 
         self.id = NSID(_data['id'])
 
@@ -57,51 +70,731 @@ class BankAccount:
         self.frozen = _data['frozen']
         self.flagged = _data['flagged']
 
+    def _freeze_request(self, frozen: bool, reason: str) -> tuple:
+        return 'POST', f"{self._url}/freeze?frozen={str(frozen).lower()}", { 'headers': self._headers, 'json': { "reason": reason } }, lambda res: setattr(self, 'frozen', frozen)
+
     def freeze(self, frozen: bool = True, reason: str = None) -> None:
-        res = requests.post(f"{self._url}/freeze?frozen={str(frozen).lower()}", headers = self._headers, json = {
-            "reason": reason
-        })
+        self._dispatch(self._freeze_request(frozen, reason))
 
-        if res.status_code == 200:
-            self.frozen = frozen
-        else:
-            res.raise_for_status()
+    async def afreeze(self, frozen: bool = True, reason: str = None) -> None:
+        await self._adispatch(self._freeze_request(frozen, reason))
+
+    def _flag_request(self, flagged: bool, reason: str) -> tuple:
+        return 'POST', f"{self._url}/flag?flagged={str(flagged).lower()}", { 'headers': self._headers, 'json': { "reason": reason } }, lambda res: setattr(self, 'flagged', flagged)
 
     def flag(self, flagged: bool = True, reason: str = None) -> None:
-        res = requests.post(f"{self._url}/flag?flagged={str(flagged).lower()}", headers = self._headers, json = {
-            "reason": reason
-        })
+        self._dispatch(self._flag_request(flagged, reason))
 
-        if res.status_code == 200:
-            self.flagged = flagged
-        else:
-            res.raise_for_status()
+    async def aflag(self, flagged: bool = True, reason: str = None) -> None:
+        await self._adispatch(self._flag_request(flagged, reason))
 
-    def debit(self, amount: int, reason: str = None, target: NSID = None, loan: NSID = None, digicode: str = None) -> None:
+    def _debit_request(self, amount: int, reason: str, target: NSID, loan: NSID, digicode: str, idempotency_key: str) -> tuple:
         _target_query = f"&target={target}"
         _loan_query = f"&loan_id={loan}"
+        _headers = { **self._headers, 'Idempotency-Key': idempotency_key } if idempotency_key else self._headers
+
+        def _debited(res):
+            self.amount -= amount
 
-        res = requests.post(f"{self._url}/debit?amount={amount}{_target_query if target else ''}{_loan_query if loan else ''}", headers = self._headers, json = {
+        return 'POST', f"{self._url}/debit?amount={amount}{_target_query if target else ''}{_loan_query if loan else ''}", { 'headers': _headers, 'json': {
             "reason": reason,
             "digicode": digicode
-        })
+        } }, _debited
 
-        if res.status_code == 200:
-            self.amount -= amount
-        else:
-            res.raise_for_status()
+    def debit(self, amount: int, reason: str = None, target: NSID = None, loan: NSID = None, digicode: str = None, idempotency_key: str = None) -> None:
+        self._dispatch(self._debit_request(amount, reason, target, loan, digicode, idempotency_key))
+
+    async def adebit(self, amount: int, reason: str = None, target: NSID = None, loan: NSID = None, digicode: str = None, idempotency_key: str = None) -> None:
+        await self._adispatch(self._debit_request(amount, reason, target, loan, digicode, idempotency_key))
+
+    def _deposit_request(self, amount: int, reason: str) -> tuple:
+        def _deposited(res):
+            self.amount += amount
+
+        return 'POST', f"{self._url}/deposit?amount={amount}", { 'headers': self._headers, 'json': { "reason": reason } }, _deposited
 
     def deposit(self, amount: int, reason: str = None) -> None:
-        res = requests.post(f"{self._url}/deposit?amount={amount}", headers = self._headers, json = {
-            "reason": reason,
-        })
+        self._dispatch(self._deposit_request(amount, reason))
 
-        if res.status_code == 200:
-            self.amount -= amount
+    async def adeposit(self, amount: int, reason: str = None) -> None:
+        await self._adispatch(self._deposit_request(amount, reason))
+
+class Transfer:
+    """
+    Virement d'un lot envoyé par `EconomyInterface.transfer_many`, et son résultat.
+
+    ## Attributs
+    - source: `NSID`\n
+        Compte débité
+    - target: `NSID`\n
+        Compte crédité
+    - amount: `int`\n
+        Somme virée
+    - reason: `str`\n
+        Motif du virement
+    - key: `str`\n
+        Clé d'idempotence envoyée avec le virement : renvoyer le même `Transfer` ne le fait pas appliquer deux fois
+    - status: `int`\n
+        Code HTTP de la réponse, `None` si aucune réponse n'a été reçue
+    - error: `Exception`\n
+        Erreur rencontrée, `None` si le virement a réussi
+    """
+
+    __slots__ = ('source', 'target', 'amount', 'reason', 'key', 'status', 'error')
+
+    def __init__(self, source: NSID, target: NSID, amount: int, reason: str = None, key: str = None) -> None:
+        self.source: NSID = NSID(source)
+        self.target: NSID = NSID(target)
+        self.amount: int = amount
+        self.reason: str = reason
+        self.key: str = key or uuid.uuid4().hex
+
+        self.status: int = None
+        self.error: Exception = None
+
+    def __repr__(self) -> str:
+        return f"<Transfer {self.source} -> {self.target} ({self.amount}) {'ok' if self.ok else self.error!r}>"
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200 and self.error is None
+
+class AccountFrame:
+    """
+    Ensemble de comptes en banque stocké par colonnes (tableaux NumPy), sans objet `.BankAccount` par ligne. Renvoyé par `fetch_accounts(columnar = True)`.
+
+    ## Attributs
+    - id: `numpy.ndarray[str]`\n
+        Identifiants des comptes
+    - owner_id: `numpy.ndarray[str]`\n
+        Identifiants des titulaires
+    - amount: `numpy.ndarray[int64]`\n
+        Soldes
+    - income: `numpy.ndarray[int64]`\n
+        Sommes entrantes depuis la dernière réinitialisation
+    - frozen: `numpy.ndarray[bool]`\n
+        Comptes gelés
+    - flagged: `numpy.ndarray[bool]`\n
+        Comptes signalés
+    - register_date: `numpy.ndarray[int64]`\n
+        Dates d'ouverture
+    - bank: `numpy.ndarray[str]`\n
+        Banques détenant les comptes
+    """
+
+    COLUMNS = {
+        'id': str,
+        'owner_id': str,
+        'amount': 'int64',
+        'income': 'int64',
+        'frozen': bool,
+        'flagged': bool,
+        'register_date': 'int64',
+        'bank': str
+    }
+
+    def __init__(self, **columns: typing.Any) -> None:
+        if numpy is None:
+            raise ImportError("AccountFrame requires numpy (pip install nsarchive[analytics]).")
+
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, numpy.asarray(columns.get(name, ()), dtype = dtype))
+
+    @classmethod
+    def from_rows(cls, rows: typing.Iterable[dict]) -> typing.Self:
+        """
+        Construit le tableau à partir des comptes bruts renvoyés par le serveur (liste décodée ou `iter_fetch('accounts')`).
+        """
+
+        add, build = cls.builder()
+
+        for _acc in rows:
+            add(_acc)
+
+        return build()
+
+    @classmethod
+    def builder(cls) -> tuple[typing.Callable[[dict], None], typing.Callable[[], typing.Self]]:
+        """
+        Remplit les colonnes compte par compte, pour les sources qui ne sont pas de simples itérables (`async for`).
+
+        ## Renvoie
+        - `add(row)` : ajoute un compte brut aux colonnes
+        - `build()` : construit le tableau
+        """
+
+        columns = { name: [] for name in cls.COLUMNS }
+        appends = [ (name, columns[name].append) for name in cls.COLUMNS ]
+
+        def add(_acc: dict) -> None:
+            if not _acc: return
+
+            for name, append in appends:
+                append(_acc[name])
+
+        return add, lambda: cls(**columns)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __repr__(self) -> str:
+        return f"<AccountFrame: {len(self)} comptes>"
+
+    def filter(self, mask: typing.Any) -> typing.Self:
+        """
+        Sous-ensemble des comptes sélectionnés par un masque booléen (`frame.filter(frame.bank == "HexaBank")`).
+        """
+
+        return AccountFrame(**{ name: getattr(self, name)[mask] for name in self.COLUMNS })
+
+    def total_supply(self) -> int:
+        """
+        Masse monétaire : somme des soldes.
+        """
+
+        return int(self.amount.sum())
+
+    def total_income(self) -> int:
+        return int(self.income.sum())
+
+    def by_bank(self, column: str = 'amount') -> dict[str, int]:
+        """
+        Somme d'une colonne numérique (`amount`, `income`) pour chaque banque.
+        """
+
+        banks, index = numpy.unique(self.bank, return_inverse = True)
+        totals = numpy.zeros(len(banks), dtype = 'int64')
+        numpy.add.at(totals, index, getattr(self, column))
+
+        return dict(zip(banks.tolist(), totals.tolist()))
+
+    def top_holders(self, k: int = 10, column: str = 'amount') -> list[tuple[NSID, int]]:
+        """
+        Les `k` comptes ayant les plus grandes valeurs de `column`, par ordre décroissant.
+
+        ## Renvoie
+        - `list[tuple[NSID, int]]` : ID du compte et valeur
+        """
+
+        values = getattr(self, column)
+        k = min(k, len(values))
+
+        if k <= 0:
+            return []
+
+        top = numpy.argpartition(values, -k)[-k:]
+        top = top[numpy.argsort(values[top])[::-1]]
+
+        return [ (NSID(id), value) for id, value in zip(self.id[top].tolist(), values[top].tolist()) ]
+
+    def _share(self, mask: typing.Any, weighted: bool) -> float:
+        if weighted:
+            total = self.amount.sum()
+            return float(self.amount[mask].sum() / total) if total else 0.0
+
+        return float(mask.mean()) if len(mask) else 0.0
+
+    def frozen_share(self, weighted: bool = True) -> float:
+        """
+        Part de la masse monétaire détenue sur des comptes gelés, ou part des comptes gelés si `weighted` est faux.
+        """
+
+        return self._share(self.frozen, weighted)
+
+    def flagged_share(self, weighted: bool = True) -> float:
+        """
+        Part de la masse monétaire détenue sur des comptes signalés, ou part des comptes signalés si `weighted` est faux.
+        """
+
+        return self._share(self.flagged, weighted)
+
+class CycleJob:
+    """
+    Traitement de fin de cycle (paie, impôts...) appliqué à tous les comptes, reprenable après une interruption.
+
+    Les comptes sont parcourus en flux (`iter_accounts`) et regroupés en lots. Pour chaque compte, `rule` renvoie les virements à effectuer, envoyés lot par lot avec `transfer_many`. Chaque lot terminé est inscrit dans un journal local (un objet JSON par ligne) : relancer le job avec le même journal saute les comptes déjà traités.
+
+    Les clés d'idempotence sont dérivées du nom du job, du cycle, du compte et du rang du virement : un lot interrompu puis rejoué n'applique pas deux fois les virements déjà reçus par le serveur.
+
+    ## Paramètres
+    interface: `.EconomyInterface`\n
+        Interface utilisée pour parcourir les comptes et effectuer les virements
+    name: `str`\n
+        Nom du job (`"impots"`, `"paie"`...)
+    rule: `Callable[[.BankAccount], Iterable[tuple] | tuple | None]`\n
+        Virements `(source, target, amount, reason)` à effectuer pour un compte, comme pour `transfer_many`, ou un seul virement
+    journal: `str`\n
+        Chemin du journal de reprise
+    cycle: `int` (optionnel)\n
+        Cycle traité (par défaut le cycle en cours, voir `mandate.get_cycle`)
+    batch_size: `int` (optionnel)\n
+        Nombre de comptes par lot
+    max_workers: `int` (optionnel)\n
+        Nombre maximal de virements simultanés dans un lot
+    digicode: `str` (optionnel)\n
+        Digicode des comptes débités
+    query: `dict` (optionnel)\n
+        La requête pour filtrer les comptes (voir `fetch_accounts`)
+    """
+
+    def __init__(self, interface: Interface, name: str, rule: typing.Callable[['BankAccount'], typing.Iterable[tuple] | None], journal: str, cycle: int = None, batch_size: int = 500, max_workers: int = None, digicode: str = None, query: dict = None) -> None:
+        self.interface = interface
+        self.name = name
+        self.rule = rule
+        self.journal = journal
+        self.cycle = cycle if cycle is not None else mandate.get_cycle(round(time.time()))
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.digicode = digicode
+        self.query = query or {}
+
+    def key(self, account: NSID, index: int) -> str:
+        """
+        Clé d'idempotence du `index`-ième virement calculé pour un compte.
+        """
+
+        return uuid.uuid5(uuid.NAMESPACE_URL, f"nsarchive:{self.name}:{self.cycle}:{account}:{index}").hex
+
+    def progress(self) -> dict:
+        """
+        État du job d'après son journal.
+
+        ## Renvoie
+        - `dict` : nombre de lots terminés (`batches`), IDs des comptes traités (`done`) et des comptes dont un virement a échoué (`failed`)
+        """
+
+        done, failed, batches = set(), set(), 0 # `done` ne contient que les comptes dont tous les virements ont réussi
+
+        if not os.path.exists(self.journal):
+            return { "batches": 0, "done": done, "failed": failed }
+
+        with open(self.journal, encoding = 'utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError: # Dernière ligne tronquée par l'interruption
+                    continue
+
+                if 'job' in entry:
+                    if (entry['job'], entry['cycle']) != (self.name, self.cycle):
+                        raise ValueError(f"Journal {self.journal} belongs to job {entry['job']!r} (cycle {entry['cycle']}), not {self.name!r} (cycle {self.cycle}).")
+
+                    continue
+
+                batches = max(batches, entry['batch'] + 1)
+                done.update(entry['done'])
+                failed.difference_update(entry['done'])
+                failed.update(entry['failed'])
+
+        return { "batches": batches, "done": done, "failed": failed }
+
+    def _operations(self, account: 'BankAccount') -> list[tuple]:
+        operations = list(self.rule(account) or [])
+
+        # Un seul virement `(source, target, amount, reason)` plutôt qu'une liste de virements
+        if operations and not isinstance(operations[0], (tuple, list)):
+            operations = [ tuple(operations) ]
+
+        res = []
+
+        for i, (source, target, amount, reason) in enumerate(operations):
+            res.append((source, target, amount, reason, self.key(account.id, i)))
+
+        return res
+
+    def _run_batch(self, accounts: list['BankAccount']) -> tuple[list[NSID], list[NSID], list[Transfer]]:
+        operations, owners = [], []
+
+        for account in accounts:
+            ops = self._operations(account)
+            operations.extend(ops)
+            owners.extend([ account.id ] * len(ops))
+
+        report = self.interface.transfer_many(operations, self.max_workers, self.digicode) if operations else []
+        failed = list(dict.fromkeys( owner for owner, transfer in zip(owners, report) if not transfer.ok ))
+        done = [ account.id for account in accounts if account.id not in failed ]
+
+        return done, failed, report
+
+    def run(self, on_batch: typing.Callable[[dict], None] = None) -> list[dict]:
+        """
+        Exécute le job, ou le reprend là où son journal s'est arrêté. Les comptes dont un virement a échoué sont repris au lancement suivant.
+
+        ## Paramètres
+        on_batch: `Callable[[dict], None]` (optionnel)\n
+            Appelée avec le bilan de chaque lot terminé
+
+        ## Renvoie
+        - `list[dict]` : bilan de chaque lot (`batch`, `accounts`, `operations`, `ok`, `failed`, `elapsed` en secondes, `rate` en virements par seconde, `errors`)
+        """
+
+        state = self.progress()
+        skip = state['done']
+        batch = state['batches']
+        reports = []
+
+        with open(self.journal, 'a', encoding = 'utf-8') as file:
+            if batch == 0 and file.tell() == 0:
+                self._write(file, { "job": self.name, "cycle": self.cycle, "started": round(time.time()) })
+
+            pending = []
+
+            def _flush():
+                nonlocal batch
+
+                start = time.perf_counter()
+                done, failed, transfers = self._run_batch(pending)
+                elapsed = time.perf_counter() - start
+
+                self._write(file, { "batch": batch, "done": done, "failed": failed, "elapsed": round(elapsed, 3) })
+
+                report = {
+                    "batch": batch,
+                    "accounts": len(pending),
+                    "operations": len(transfers),
+                    "ok": sum(transfer.ok for transfer in transfers),
+                    "failed": len(failed),
+                    "elapsed": elapsed,
+                    "rate": len(transfers) / elapsed if elapsed else 0.0,
+                    "errors": [ transfer for transfer in transfers if not transfer.ok ]
+                }
+
+                reports.append(report)
+                pending.clear()
+                batch += 1
+
+                if on_batch:
+                    on_batch(report)
+
+            for account in self.interface.iter_accounts(**self.query):
+                if account.id in skip:
+                    continue
+
+                pending.append(account)
+
+                if len(pending) >= self.batch_size:
+                    _flush()
+
+            if pending:
+                _flush()
+
+        return reports
+
+    @staticmethod
+    def _write(file: typing.TextIO, entry: dict) -> None:
+        file.write(json.dumps(entry) + '\n')
+        file.flush()
+        os.fsync(file.fileno())
+
+class LedgerMirror:
+    """
+    Miroir local des comptes en banque, tenu à jour par les écritures envoyées par le client, pour détecter les écarts avec NationDB (voir `EconomyInterface.reconcile_accounts`).
+
+    Associé à une interface (`attach`), le miroir applique chaque débit, virement, dépôt, gel ou signalement réussi d'après l'URL de la requête, indépendamment des modèles `.BankAccount` locaux.
+
+    ## Paramètres
+    rows: `Iterable[dict | .BankAccount]` (optionnel)\n
+        État initial des comptes
+    fields: `tuple[str]` (optionnel)\n
+        Champs comparés avec NationDB
+    """
+
+    FIELDS = ('amount', 'frozen', 'flagged')
+    CANONICAL: dict[str, typing.Callable] = { 'amount': int, 'frozen': bool, 'flagged': bool } # Types comparés, quel que soit celui reçu (`100.0` et `100`, `1` et `True`)
+
+    _ACTION_PATTERN = re.compile(r"/bank/accounts/([^/?]+)/(debit|deposit|freeze|flag)$")
+
+    def __init__(self, rows: typing.Iterable[dict | BankAccount] = (), fields: tuple[str] = FIELDS) -> None:
+        self.fields = tuple(fields)
+
+        self._rows: dict[NSID, list] = {}
+        self._hashes: dict[NSID, bytes] = {} # Empreintes des lignes, calculées à la demande
+        self._pages: dict[int, tuple] = {} # Empreinte, IDs, écarts et totaux de chaque page au dernier examen
+        self._dirty: set[NSID] = set() # Comptes modifiés localement depuis l'examen de leur page
+        self._lock = threading.RLock()
+
+        for row in rows:
+            self.set(row)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, id: NSID) -> bool:
+        return NSID(id) in self._rows
+
+    def get(self, id: NSID) -> dict | None:
+        values = self._rows.get(NSID(id))
+
+        return dict(zip(self.fields, values)) if values is not None else None
+
+    def set(self, row: dict | BankAccount) -> None:
+        """
+        Ajoute ou remplace un compte, depuis ses données brutes ou un `.BankAccount`.
+        """
+
+        if isinstance(row, dict):
+            id, values = NSID(row['id']), [ row[field] for field in self.fields ]
         else:
-            res.raise_for_status()
+            id, values = NSID(row.id), [ getattr(row, field) for field in self.fields ]
+
+        with self._lock:
+            self._rows[id] = values
+            self._touch(id)
+
+    def remove(self, id: NSID) -> None:
+        id = NSID(id)
+
+        with self._lock:
+            if self._rows.pop(id, None) is not None:
+                self._touch(id)
+
+    def _touch(self, id: NSID) -> None:
+        self._hashes.pop(id, None)
+        self._dirty.add(id)
+
+    def _add(self, id: NSID, field: str, value: typing.Any, delta: bool = False) -> None:
+        values = self._rows.get(id)
+
+        if values is None or field not in self.fields:
+            return
+
+        i = self.fields.index(field)
+        values[i] = values[i] + value if delta else value
+        self._touch(id)
+
+    def apply_url(self, url: str) -> None:
+        """
+        Applique au miroir une écriture réussie (`.../bank/accounts/{id}/debit?amount=...&target=...`, `deposit`, `freeze`, `flag`).
+        """
+
+        parsed = urllib.parse.urlparse(url)
+        match = self._ACTION_PATTERN.search(parsed.path)
+
+        if not match:
+            return
+
+        id, action = NSID(match.group(1)), match.group(2)
+        query = { key: values[-1] for key, values in urllib.parse.parse_qs(parsed.query).items() }
+
+        with self._lock:
+            match action:
+                case 'debit':
+                    amount = self._amount(query['amount'])
+                    self._add(id, 'amount', -amount, True)
+
+                    if 'target' in query:
+                        self._add(NSID(query['target']), 'amount', amount, True)
+                case 'deposit':
+                    self._add(id, 'amount', self._amount(query['amount']), True)
+                case 'freeze':
+                    self._add(id, 'frozen', query.get('frozen') == 'true')
+                case 'flag':
+                    self._add(id, 'flagged', query.get('flagged') == 'true')
+
+    @staticmethod
+    def _amount(value: str) -> int | float:
+        amount = float(value)
+
+        return int(amount) if amount.is_integer() else amount
 
-class Item:
+    def attach(self, interface: Interface) -> None:
+        """
+        Abonne le miroir aux écritures envoyées par le transport d'une interface.
+        """
+
+        if self.apply_url not in interface.transport.on_write:
+            interface.transport.on_write.append(self.apply_url)
+
+    def canonical(self, values: typing.Iterable) -> tuple:
+        """
+        Valeurs des champs comparés converties dans leur type de référence (`CANONICAL`).
+        """
+
+        return tuple(
+            value if value is None or field not in self.CANONICAL else self.CANONICAL[field](value)
+            for field, value in zip(self.fields, values)
+        )
+
+    def row_hash(self, id: NSID, values: typing.Iterable) -> bytes:
+        """
+        Empreinte d'une ligne (ID et valeurs canoniques des champs comparés), identique pour une ligne locale et distante de même contenu.
+        """
+
+        return hashlib.blake2b(repr((str(id), *self.canonical(values))).encode(), digest_size = 8).digest()
+
+    def local_hash(self, id: NSID) -> bytes | None:
+        digest = self._hashes.get(id)
+
+        if digest is None:
+            values = self._rows.get(id)
+
+            if values is None:
+                return None
+
+            digest = self._hashes[id] = self.row_hash(id, values)
+
+        return digest
+
+    def total(self, field: str = 'amount') -> int:
+        i = self.fields.index(field)
+
+        return sum(values[i] for values in self._rows.values())
+
+class Reconciliation:
+    """
+    Comparaison en flux des comptes de NationDB avec un `.LedgerMirror`, renvoyée par `EconomyInterface.reconcile_accounts`.
+
+    Les comptes sont lus par pages de `page_size` lignes ; seule une page est gardée en mémoire. Une page identique (même empreinte) à celle du dernier examen, dont aucun compte n'a changé dans le miroir entre-temps, n'est pas réexaminée ligne par ligne : ses écarts précédents sont repris.
+
+    Itérer sur l'objet (`for page in reconciliation`, ou `async for` avec une interface asynchrone) renvoie le bilan de chaque page au fil de la lecture, tandis que les totaux (`rows`, `mismatches`, `remote_total`, `local_total`...) sont mis à jour. `run` parcourt tout d'un coup.
+
+    ## Attributs
+    - pages: `int`\n
+        Pages lues
+    - examined: `int`\n
+        Pages réexaminées ligne par ligne
+    - rows: `int`\n
+        Comptes lus
+    - mismatches: `int`\n
+        Comptes différents du miroir (ou absents du miroir)
+    - remote_total: `int`\n
+        Somme des soldes lus
+    - local_total: `int`\n
+        Somme des soldes du miroir pour les mêmes comptes
+    - orphans: `list[NSID]`\n
+        Comptes du miroir absents de NationDB, connus une fois la lecture terminée
+    """
+
+    def __init__(self, mirror: LedgerMirror, rows: typing.Iterable[dict] | typing.AsyncIterable[dict], page_size: int = 1000) -> None:
+        self.mirror = mirror
+        self.page_size = page_size
+        self._source = rows
+        self._seen: set[NSID] = set()
+
+        self.pages = 0
+        self.examined = 0
+        self.rows = 0
+        self.mismatches = 0
+        self.remote_total = 0
+        self.local_total = 0
+        self.orphans: list[NSID] = []
+        self.finished = False
+
+    def __iter__(self) -> typing.Iterator[dict]:
+        page = []
+
+        for _data in self._source:
+            page.append(_data)
+
+            if len(page) >= self.page_size:
+                yield self._check(page)
+                page = []
+
+        if page:
+            yield self._check(page)
+
+        self._finish()
+
+    async def __aiter__(self) -> typing.AsyncIterator[dict]:
+        page = []
+
+        async for _data in self._source:
+            page.append(_data)
+
+            if len(page) >= self.page_size:
+                yield self._check(page)
+                page = []
+
+        if page:
+            yield self._check(page)
+
+        self._finish()
+
+    def run(self) -> 'Reconciliation':
+        for _ in self:
+            pass
+
+        return self
+
+    async def arun(self) -> 'Reconciliation':
+        async for _ in self:
+            pass
+
+        return self
+
+    def _check(self, page: list[dict]) -> dict:
+        mirror = self.mirror
+        index = self.pages
+
+        rows = [ (_data['id'], *mirror.canonical(_data[field] for field in mirror.fields)) for _data in page ]
+        digest = hashlib.blake2b(repr(rows).encode(), digest_size = 16).digest()
+
+        with mirror._lock:
+            previous = mirror._pages.get(index)
+            examined = previous is None or previous[0] != digest or not mirror._dirty.isdisjoint(previous[1])
+
+            if examined:
+                ids = NSID.many([ row[0] for row in rows ])
+                mismatches = []
+
+                for id, row in zip(ids, rows):
+                    if mirror.local_hash(id) != mirror.row_hash(id, row[1:]):
+                        mismatches.append({ "id": id, "local": mirror.get(id), "remote": dict(zip(mirror.fields, row[1:])) })
+
+                if 'amount' in mirror.fields:
+                    i = mirror.fields.index('amount')
+                    remote_total = sum(row[i + 1] for row in rows)
+                    local_total = sum(mirror._rows[id][i] for id in ids if id in mirror._rows)
+                else:
+                    remote_total = local_total = 0
+
+                mirror._pages[index] = (digest, ids, mismatches, remote_total, local_total)
+                mirror._dirty.difference_update(ids)
+            else:
+                # Même contenu distant, aucun compte modifié localement : le dernier examen reste valable
+                _, ids, mismatches, remote_total, local_total = previous
+
+        self._seen.update(ids)
+
+        self.pages += 1
+        self.examined += examined
+        self.rows += len(page)
+        self.mismatches += len(mismatches)
+        self.remote_total += remote_total
+        self.local_total += local_total
+
+        return {
+            "page": index,
+            "rows": len(page),
+            "examined": examined,
+            "mismatches": mismatches,
+            "remote_total": remote_total,
+            "local_total": local_total
+        }
+
+    def _finish(self) -> None:
+        with self.mirror._lock:
+            for index in [ index for index in self.mirror._pages if index >= self.pages ]:
+                del self.mirror._pages[index]
+
+            self.orphans = [ id for id in self.mirror._rows if id not in self._seen ]
+
+        self._seen.clear()
+        self.finished = True
+
+    def summary(self) -> dict:
+        return {
+            "pages": self.pages,
+            "examined": self.examined,
+            "rows": self.rows,
+            "mismatches": self.mismatches,
+            "orphans": len(self.orphans),
+            "remote_total": self.remote_total,
+            "local_total": self.local_total,
+            "drift": self.remote_total - self.local_total
+        }
+
+class Item(Model):
     """
     Article d'inventaire qui peut circuler sur le serveur
 
@@ -114,9 +807,10 @@ class Item:
         Emoji lié à l'objet
     """
 
+    __slots__ = ('id', 'name', 'emoji', 'category', 'craft')
+
     def __init__(self) -> None:
-        self._url: str = ""
-        self._headers: dict = {}
+        super().__init__()
 
         self.id: NSID = NSID(round(time.time()))
         self.name: str = "Unknown Object"
@@ -124,26 +818,26 @@ class Item:
         self.category: str = "common"
         self.craft: dict = {}
 
-    def _load(self, _data: dict, url: str, headers: dict) -> None:
-        self._url = url + '/marketplace/items/' + _data['id']
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/marketplace/items/' + _data['id'])
 
         self.id = NSID(_data['id'])
 
         self.name = _data['name']
         self.emoji = _data['emoji']
         self.category = _data['category']
-        self.craft = _data['craft']
+        self.craft = dict(_data['craft'])
+
+    def _rename_request(self, new_name: str) -> tuple:
+        return 'POST', f"{self._url}/rename?name={new_name}", { 'headers': self._headers }, lambda res: setattr(self, 'name', new_name)
 
     def rename(self, new_name: str):
-        res = requests.post(f"{self._url}/rename?name={new_name}", headers = self._headers)
+        self._dispatch(self._rename_request(new_name))
 
-        if res.status_code == 200:
-            self.name = new_name
-        else:
-            res.raise_for_status()
+    async def arename(self, new_name: str):
+        await self._adispatch(self._rename_request(new_name))
 
-class Sale:
+class Sale(Model):
     """
     Vente mettant en jeu un objet
 
@@ -160,21 +854,21 @@ class Sale:
         Identifiant du vendeur
     """
 
-    def __init__(self, item: Item) -> None:
-        self._url: str = ""
-        self._headers: dict = {}
+    __slots__ = ('id', 'open', 'seller_id', 'item_id', 'quantity', 'price')
+
+    def __init__(self, item: Item = None) -> None:
+        super().__init__()
 
         self.id: NSID = NSID(round(time.time()))
         self.open: bool = True
         self.seller_id: NSID = NSID('0')
 
-        self.item_id: NSID = NSID(item.id)
+        self.item_id: NSID = NSID(item.id) if item else NSID('0')
         self.quantity: int = 1
         self.price: int = 0
 
-    def _load(self, _data: dict, url: str, headers: dict) -> None:
-        self._url = url + '/marketplace/sales/' + _data['id']
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/marketplace/sales/' + _data['id'])
 
         self.id = _data['id']
         self.open = _data['open']
@@ -184,7 +878,7 @@ class Sale:
         self.quantity = _data['quantity']
         self.price = _data['price']
 
-class Inventory:
+class Inventory(Model):
     """
     Inventaire d'un membre
 
@@ -201,9 +895,10 @@ class Inventory:
         Collection d'objets et leur quantité
     """
 
+    __slots__ = ('id', 'owner_id', 'tag', 'register_date', 'items')
+
     def __init__(self, owner_id: NSID) -> None:
-        self._url: str = ""
-        self._headers: dict = {}
+        super().__init__()
 
         self.id: NSID = NSID(owner_id)
         self.owner_id: NSID = NSID(owner_id)
@@ -213,9 +908,8 @@ class Inventory:
 
         self.items: dict[NSID, int] = {}
 
-    def _load(self, _data: dict, url: str, headers: dict):
-        self._url = url + '/bank/inventories/' + _data['id']
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/bank/inventories/' + _data['id'])
 
         self.id = NSID(_data['id'])
         self.owner_id = NSID(_data['owner_id'])
@@ -223,28 +917,265 @@ class Inventory:
         self.tag = _data['tag']
         self.register_date = _data['register_date']
 
-        self.items = _data['items']
+        self.items = dict(_data['items'])
 
-    def deposit_item(self, item: Item, giver: NSID = None, quantity: int = 1, digicode: str = None):
-        res = requests.post(f"{self._url}/deposit?item={item.id}&amount={quantity}", headers = self._headers, json = {
-            "giver": giver,
-            "digicode": digicode
-        })
-
-        if res.status_code == 200:
+    def _deposit_item_request(self, item: Item, giver: NSID, quantity: int, digicode: str) -> tuple:
+        def _deposited(res):
             if self.objects[item.id] > quantity:
                 self.objects[item.id] -= quantity
             else:
                 self.objects[item.id] = 0
-        else:
-            res.raise_for_status()
 
-    def sell_item(self, item: Item, price: int, quantity: int = 1, digicode: str = None) -> NSID:
-        res = requests.post(f"{self._url}/sell_item?item={item.id}&quantity={quantity}&price={price}", headers = self._headers, json = {
+        return 'POST', f"{self._url}/deposit?item={item.id}&amount={quantity}", { 'headers': self._headers, 'json': {
+            "giver": giver,
             "digicode": digicode
-        })
+        } }, _deposited
 
-        if res.status_code == 200:
-            return NSID(res.json()['sale_id'])
-        else:
-            res.raise_for_status()
\ No newline at end of file
+    def deposit_item(self, item: Item, giver: NSID = None, quantity: int = 1, digicode: str = None):
+        self._dispatch(self._deposit_item_request(item, giver, quantity, digicode))
+
+    async def adeposit_item(self, item: Item, giver: NSID = None, quantity: int = 1, digicode: str = None):
+        await self._adispatch(self._deposit_item_request(item, giver, quantity, digicode))
+
+    def _sell_item_request(self, item: Item, price: int, quantity: int, digicode: str) -> tuple:
+        return 'POST', f"{self._url}/sell_item?item={item.id}&quantity={quantity}&price={price}", { 'headers': self._headers, 'json': {
+            "digicode": digicode
+        } }, lambda res: NSID(res.json()['sale_id'])
+
+    def sell_item(self, item: Item, price: int, quantity: int = 1, digicode: str = None) -> NSID:
+        return self._dispatch(self._sell_item_request(item, price, quantity, digicode))
+
+    async def asell_item(self, item: Item, price: int, quantity: int = 1, digicode: str = None) -> NSID:
+        return await self._adispatch(self._sell_item_request(item, price, quantity, digicode))
+
+class PriceIndex:
+    """
+    Prix unitaires de chaque objet d'après les ventes ouvertes du marché, pour évaluer des inventaires sans parcourir les annonces à chaque fois. Nécessite numpy.
+
+    Pour chaque objet : prix unitaire minimal, médian (des annonces) et moyen pondéré par les quantités, volume en vente et nombre d'annonces. `refresh` applique une nouvelle liste d'annonces en ne recalculant que les objets dont les annonces ont changé.
+
+    ## Paramètres
+    sales: `Iterable[dict | .Sale]` (optionnel)\n
+        Annonces initiales (les ventes fermées sont ignorées)
+    """
+
+    KINDS = ('min', 'median', 'vwap')
+
+    def __init__(self, sales: typing.Iterable[dict | Sale] = ()) -> None:
+        if numpy is None:
+            raise ImportError("PriceIndex requires numpy (pip install nsarchive[analytics]).")
+
+        self._sales: dict[NSID, tuple[NSID, float, int, int]] = {} # Objet, prix unitaire, quantité et prix du lot de chaque annonce
+        self._prices: dict[NSID, list[float]] = {} # Prix unitaires triés des annonces de chaque objet
+        self._volume: dict[NSID, int] = {}
+        self._turnover: dict[NSID, int] = {}
+
+        self._columns: dict[NSID, int] = {} # Colonne de chaque objet dans les tableaux de prix
+        self._arrays: dict[str, numpy.ndarray] = { kind: numpy.empty(0) for kind in self.KINDS }
+        self._dirty: set[NSID] = set()
+        self._lock = threading.RLock()
+
+        for sale in sales:
+            self.add(sale)
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def __contains__(self, item: NSID) -> bool:
+        return NSID(item) in self._prices
+
+    def __repr__(self) -> str:
+        return f"<PriceIndex: {len(self)} objets, {len(self._sales)} annonces>"
+
+    @staticmethod
+    def _row(sale: dict | Sale) -> tuple[NSID, bool, NSID, int, int]:
+        if isinstance(sale, dict):
+            return NSID(sale['id']), sale['open'], NSID(sale['item_id']), sale['quantity'], sale['price']
+
+        return NSID(sale.id), sale.open, sale.item_id, sale.quantity, sale.price
+
+    def add(self, sale: dict | Sale) -> None:
+        """
+        Ajoute une annonce ou la met à jour. Une annonce fermée (ou sans quantité) est retirée.
+        """
+
+        id, is_open, item, quantity, price = self._row(sale)
+
+        with self._lock:
+            previous = self._sales.get(id)
+
+            if previous is not None:
+                if is_open and (previous[0], previous[2], previous[3]) == (item, quantity, price):
+                    return
+
+                self.remove(id)
+
+            if not is_open or quantity <= 0:
+                return
+
+            unit = price / quantity
+            self._sales[id] = (item, unit, quantity, price)
+
+            bisect.insort(self._prices.setdefault(item, []), unit)
+            self._volume[item] = self._volume.get(item, 0) + quantity
+            self._turnover[item] = self._turnover.get(item, 0) + price
+            self._dirty.add(item)
+
+    update = add
+
+    def remove(self, id: NSID) -> None:
+        """
+        Retire une annonce (vendue ou fermée).
+        """
+
+        with self._lock:
+            entry = self._sales.pop(NSID(id), None)
+
+            if entry is None:
+                return
+
+            item, unit, quantity, price = entry
+            prices = self._prices[item]
+            del prices[bisect.bisect_left(prices, unit)]
+
+            if prices:
+                self._volume[item] -= quantity
+                self._turnover[item] -= price
+            else:
+                del self._prices[item], self._volume[item], self._turnover[item]
+
+            self._dirty.add(item)
+
+    def refresh(self, sales: typing.Iterable[dict | Sale]) -> int:
+        """
+        Met l'index à jour d'après la liste complète des annonces actuelles : les nouvelles sont ajoutées, les modifiées remplacées et celles qui ont disparu ou sont fermées retirées.
+
+        ## Renvoie
+        - `int` : nombre d'objets dont les prix ont changé
+        """
+
+        with self._lock:
+            seen = set()
+
+            for sale in sales:
+                if not sale: continue
+
+                self.add(sale)
+                seen.add(self._row(sale)[0])
+
+            for id in [ id for id in self._sales if id not in seen ]:
+                self.remove(id)
+
+            changed = len(self._dirty)
+            self._sync()
+
+        return changed
+
+    def _sync(self) -> None:
+        if not self._dirty:
+            return
+
+        with self._lock:
+            new = [ item for item in self._dirty if item not in self._columns ]
+
+            if new:
+                size = len(self._columns)
+                self._columns.update((item, size + i) for i, item in enumerate(new))
+
+                for kind in self.KINDS:
+                    self._arrays[kind] = numpy.concatenate((self._arrays[kind], numpy.full(len(new), numpy.nan)))
+
+            for item in self._dirty:
+                col = self._columns[item]
+                prices = self._prices.get(item)
+
+                if not prices:
+                    for kind in self.KINDS:
+                        self._arrays[kind][col] = numpy.nan
+                    continue
+
+                n = len(prices)
+
+                self._arrays['min'][col] = prices[0]
+                self._arrays['median'][col] = prices[n // 2] if n % 2 else (prices[n // 2 - 1] + prices[n // 2]) / 2
+                self._arrays['vwap'][col] = self._turnover[item] / self._volume[item]
+
+            self._dirty.clear()
+
+    def price(self, item: NSID, kind: str = 'vwap') -> float | None:
+        """
+        Prix unitaire d'un objet (`'min'`, `'median'` ou `'vwap'`), `None` s'il n'est pas en vente.
+        """
+
+        self._sync()
+        item = NSID(item)
+
+        if item not in self._prices:
+            return None
+
+        col = self._columns[item]
+
+        return float(self._arrays[kind][col])
+
+    def stats(self, item: NSID) -> dict | None:
+        """
+        Prix unitaires (`min`, `median`, `vwap`), volume en vente (`volume`) et nombre d'annonces (`sales`) d'un objet.
+        """
+
+        item = NSID(item)
+
+        if item not in self._prices:
+            return None
+
+        return {
+            **{ kind: self.price(item, kind) for kind in self.KINDS },
+            "volume": self._volume[item],
+            "sales": len(self._prices[item])
+        }
+
+    def value(self, inventory: Inventory | dict[NSID, int], kind: str = 'vwap', default: float = 0.0) -> float:
+        """
+        Valeur d'un inventaire (voir `values`).
+        """
+
+        return float(self.values([ inventory ], kind, default)[0])
+
+    def values(self, inventories: typing.Iterable[Inventory | dict[NSID, int]], kind: str = 'vwap', default: float = 0.0) -> 'numpy.ndarray':
+        """
+        Valeur de plusieurs inventaires en une passe.
+
+        ## Paramètres
+        inventories: `Iterable[.Inventory | dict[NSID, int]]`\n
+            Inventaires, ou leurs objets et quantités
+        kind: `str` (optionnel)\n
+            Prix unitaire utilisé : `'min'`, `'median'` ou `'vwap'`
+        default: `float` (optionnel)\n
+            Prix unitaire des objets qui ne sont pas en vente
+
+        ## Renvoie
+        - `numpy.ndarray[float64]` dans l'ordre des inventaires
+        """
+
+        self._sync()
+
+        columns = self._columns
+        owners, cols, quantities = [], [], []
+        count = 0
+
+        for i, inventory in enumerate(inventories):
+            count += 1
+
+            for item, quantity in (inventory.items if isinstance(inventory, Inventory) else inventory).items():
+                col = columns.get(item)
+
+                if col is None:
+                    col = columns.get(NSID(item), -1) # -1 : colonne du prix par défaut
+
+                owners.append(i)
+                cols.append(col)
+                quantities.append(quantity)
+
+        prices = numpy.append(self._arrays[kind], numpy.nan)
+        prices[numpy.isnan(prices)] = default
+
+        return numpy.bincount(numpy.asarray(owners, dtype = 'int64'), weights = numpy.asarray(quantities, dtype = 'float64') * prices[numpy.asarray(cols, dtype = 'int64')], minlength = count)
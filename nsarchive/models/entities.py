@@ -1,64 +1,272 @@
+import bisect
+import functools
 import requests
+import threading
 import time
 import typing
 import urllib
 import warnings
 
-from .base import NSID
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .base import NSID, Cache, Interface, Model, lazy_field
 
 from .. import utils
 
+_FLAGS = {
+    'append': 0b0001, 'a': 0b0001,
+    'manage': 0b0010, 'm': 0b0010,
+    'edit': 0b0100, 'e': 0b0100,
+    'read': 0b1000, 'r': 0b1000
+}
+
+@functools.lru_cache(maxsize = 256)
+def _parse_permission(val: str) -> int:
+    """
+    `"a-er"` -> `0b1101`. L'ordre des lettres n'a pas d'importance, les autres caractères sont ignorés.
+    """
+
+    return (_FLAGS['a'] if 'a' in val else 0) | (_FLAGS['m'] if 'm' in val else 0) | (_FLAGS['e'] if 'e' in val else 0) | (_FLAGS['r'] if 'r' in val else 0)
+
 class Permission:
-    def __init__(self, initial: str = "----"):
-        self.append: bool = False
-        self.manage: bool = False
-        self.edit: bool = False
-        self.read: bool = False
+    """
+    Droits `append`, `manage`, `edit` et `read` sur un domaine, stockés sur 4 bits.
+
+    Une permission lue depuis `.PositionPermissions` (`permissions.sales`) en est une vue : la modifier modifie la position.
+    """
+
+    __slots__ = ('_bits', '_parent', '_shift')
+
+    def __init__(self, initial: str = "----", _parent: 'PositionPermissions' = None, _shift: int = 0):
+        self._bits: int = 0
+        self._parent = _parent
+        self._shift = _shift
+
+        if _parent is None:
+            self.load(initial)
+
+    @property
+    def bits(self) -> int:
+        if self._parent is None:
+            return self._bits
+
+        return self._parent.bits >> self._shift & 0xF
+
+    @bits.setter
+    def bits(self, bits: int) -> None:
+        if self._parent is None:
+            self._bits = bits
+        else:
+            self._parent.bits = self._parent.bits & ~(0xF << self._shift) | bits << self._shift
+
+    def _flag(flag: int) -> property:
+        def _get(self) -> bool:
+            return bool(self.bits & flag)
+
+        def _set(self, value: bool) -> None:
+            self.bits = self.bits | flag if value else self.bits & ~flag
+
+        return property(_get, _set)
+
+    append = _flag(_FLAGS['append'])
+    manage = _flag(_FLAGS['manage'])
+    edit = _flag(_FLAGS['edit'])
+    read = _flag(_FLAGS['read'])
 
-        self.load(initial)
+    del _flag
 
     def load(self, val: str) -> None:
-        if 'a' in val: self.append = True
-        if 'm' in val: self.manage = True
-        if 'e' in val: self.edit = True
-        if 'r' in val: self.read = True
+        self.bits |= _parse_permission(val)
+
+    def __str__(self) -> str:
+        return ''.join(char if self.bits & _FLAGS[char] else '-' for char in 'amer')
+
+    def __repr__(self) -> str:
+        return f"<Permission {self}>"
 
 class PositionPermissions:
     """
     Permissions d'une position à l'échelle du serveur. Certaines sont attribuées selon l'appartenance à divers groupes ayant une position précise
+
+    Les 19 domaines sont rangés dans un seul entier (`bits`), 4 bits par domaine dans l'ordre de `DOMAINS` : `has()` et la fusion de permissions (OU bit à bit) ne dépendent pas du nombre de domaines.
+
+    Les permissions d'une position partagée (voir `.PositionCatalog`) sont en lecture seule : les modifier, directement ou par une vue `.Permission`, lève une `AttributeError`. `copy()` en renvoie une version modifiable.
     """
 
-    def __init__(self) -> None:
-        self.aliases = Permission() # APPEND = faire une requête au nom d'une autre entité, MANAGE = /, EDIT = /, READ = /
-        self.bots = Permission() # APPEND = /, MANAGE = proposer d'héberger un bot, EDIT = changer les paramètres d'un bot, READ = /
-        self.candidacies = Permission() # APPEND = se présenter à une élection, MANAGE = gérer les candidatures d'une élection, EDIT = modifier une candidature, READ = /
-        self.constitution = Permission() # APPEND = /, MANAGE = /, EDIT = modifier la constitution, READ = /
-        self.database = Permission() # APPEND = créer des sous-bases de données, MANAGE = gérer la base de données, EDIT = modifier les éléments, READ = avoir accès à toutes les données sans exception
-        self.inventories = Permission("a---") # APPEND = ouvrir un ou plusieurs comptes/inventaires, MANAGE = voir les infos globales concernant les comptes en banque ou inventaires, EDIT = gérer des comptes en banque (ou inventaires), READ = voir les infos d'un compte en banque ou inventaire
-        self.items = Permission("---r") # APPEND = créer un item, MANAGE = gérer les items, EDIT = modifier des items, READ = voir tous les items
-        self.laws = Permission() # APPEND = proposer un texte de loi, MANAGE = accepter ou refuser une proposition, EDIT = modifier un texte, READ = /
-        self.loans = Permission() # APPEND = prélever de l'argent sur un compte, MANAGE = gérer les prêts/prélèvements, EDIT = modifier les prêts, READ = voir tous les prêts
-        self.members = Permission("---r") # APPEND = créer des entités, MANAGE = modérer des entités (hors Discord), EDIT = modifier des entités, READ = voir le profil des entités
-        self.mines = Permission("----") # APPEND = générer des matières premières, MANAGE = gérer les accès aux réservoirs, EDIT = créer un nouveau réservoir, READ = récupérer des matières premières
-        self.money = Permission("----") # APPEND = générer ou supprimer de la monnaie, MANAGE = /, EDIT = /, READ = /
-        self.national_channel = Permission() # APPEND = prendre la parole sur la chaîne nationale, MANAGE = voir qui peut prendre la parole, EDIT = modifier le planning de la chaîne nationale, READ = /
-        self.organizations = Permission("---r") # APPEND = créer une nouvelle organisation, MANAGE = exécuter des actions administratives sur les organisations, EDIT = modifier des organisations, READ = voir le profil de n'importe quelle organisation
-        self.reports = Permission() # APPEND = déposer plainte, MANAGE = accépter ou refuser une plainte, EDIT = /, READ = accéder à des infos supplémentaires pour une plainte
-        self.sales = Permission("---r") # APPEND = vendre, MANAGE = gérer les ventes, EDIT = modifier des ventes, READ = accéder au marketplace
-        self.sanctions = Permission() # APPEND = sanctionner un membre, MANAGE = gérer les sanctions d'un membre, EDIT = modifier une sanction, READ = accéder au casier d'un membre
-        self.state_budgets = Permission() # APPEND = débloquer un nouveau budget, MANAGE = gérer les budjets, EDIT = gérer les sommes pour chaque budjet, READ = accéder aux infos concernant les budgets
-        self.votes = Permission() # APPEND = déclencher un vote, MANAGE = fermer un vote, EDIT = /, READ = lire les propriétés d'un vote avant sa fermeture
-
-    def merge(self, permissions: dict[str, str] | typing.Self):
+    __slots__ = ('bits', '_frozen')
+
+    DOMAINS = (
+        'aliases', # APPEND = faire une requête au nom d'une autre entité, MANAGE = /, EDIT = /, READ = /
+        'bots', # APPEND = /, MANAGE = proposer d'héberger un bot, EDIT = changer les paramètres d'un bot, READ = /
+        'candidacies', # APPEND = se présenter à une élection, MANAGE = gérer les candidatures d'une élection, EDIT = modifier une candidature, READ = /
+        'constitution', # APPEND = /, MANAGE = /, EDIT = modifier la constitution, READ = /
+        'database', # APPEND = créer des sous-bases de données, MANAGE = gérer la base de données, EDIT = modifier les éléments, READ = avoir accès à toutes les données sans exception
+        'inventories', # APPEND = ouvrir un ou plusieurs comptes/inventaires, MANAGE = voir les infos globales concernant les comptes en banque ou inventaires, EDIT = gérer des comptes en banque (ou inventaires), READ = voir les infos d'un compte en banque ou inventaire
+        'items', # APPEND = créer un item, MANAGE = gérer les items, EDIT = modifier des items, READ = voir tous les items
+        'laws', # APPEND = proposer un texte de loi, MANAGE = accepter ou refuser une proposition, EDIT = modifier un texte, READ = /
+        'loans', # APPEND = prélever de l'argent sur un compte, MANAGE = gérer les prêts/prélèvements, EDIT = modifier les prêts, READ = voir tous les prêts
+        'members', # APPEND = créer des entités, MANAGE = modérer des entités (hors Discord), EDIT = modifier des entités, READ = voir le profil des entités
+        'mines', # APPEND = générer des matières premières, MANAGE = gérer les accès aux réservoirs, EDIT = créer un nouveau réservoir, READ = récupérer des matières premières
+        'money', # APPEND = générer ou supprimer de la monnaie, MANAGE = /, EDIT = /, READ = /
+        'national_channel', # APPEND = prendre la parole sur la chaîne nationale, MANAGE = voir qui peut prendre la parole, EDIT = modifier le planning de la chaîne nationale, READ = /
+        'organizations', # APPEND = créer une nouvelle organisation, MANAGE = exécuter des actions administratives sur les organisations, EDIT = modifier des organisations, READ = voir le profil de n'importe quelle organisation
+        'reports', # APPEND = déposer plainte, MANAGE = accépter ou refuser une plainte, EDIT = /, READ = accéder à des infos supplémentaires pour une plainte
+        'sales', # APPEND = vendre, MANAGE = gérer les ventes, EDIT = modifier des ventes, READ = accéder au marketplace
+        'sanctions', # APPEND = sanctionner un membre, MANAGE = gérer les sanctions d'un membre, EDIT = modifier une sanction, READ = accéder au casier d'un membre
+        'state_budgets', # APPEND = débloquer un nouveau budget, MANAGE = gérer les budjets, EDIT = gérer les sommes pour chaque budjet, READ = accéder aux infos concernant les budgets
+        'votes' # APPEND = déclencher un vote, MANAGE = fermer un vote, EDIT = /, READ = lire les propriétés d'un vote avant sa fermeture
+    )
+
+    SHIFTS = { domain: 4 * i for i, domain in enumerate(DOMAINS) }
+
+    def __init__(self, bits: int = None) -> None:
+        self.bits: int = PositionPermissions.DEFAULT if bits is None else bits
+        self._frozen: bool = False
+
+    @staticmethod
+    def mask(domain: str, flag: str) -> int:
+        """
+        Bit correspondant à un droit (`mask('sales', 'append')`). `flag` accepte le nom complet ou sa lettre (`'a'`, `'m'`, `'e'`, `'r'`).
+        """
+
+        try:
+            return _FLAGS[flag] << PositionPermissions.SHIFTS[domain]
+        except KeyError:
+            raise AttributeError(f"Unknown permission: {domain}.{flag}") from None
+
+    def has(self, domain: str, flag: str) -> bool:
+        return bool(self.bits & PositionPermissions.mask(domain, flag))
+
+    def merge(self, permissions: dict[str, str] | typing.Self | int):
+        """
+        Ajoute des droits (OU bit à bit) depuis un autre `.PositionPermissions`, son encodage entier ou le format du serveur (`{"sales": "a--r"}`).
+        """
+
         if isinstance(permissions, PositionPermissions):
-            permissions = permissions.__dict__
+            self.bits |= permissions.bits
+        elif isinstance(permissions, int):
+            self.bits |= permissions
+        else:
+            self.bits |= PositionPermissions.parse(permissions)
+
+    @staticmethod
+    def parse(permissions: dict[str, str]) -> int:
+        bits = 0
 
         for key, val in permissions.items():
-            perm: Permission = self.__getattribute__(key)
-            perm.load(val)
+            if key not in PositionPermissions.SHIFTS:
+                raise AttributeError(f"Unknown permission domain: {key}")
+
+            bits |= _parse_permission(val) << PositionPermissions.SHIFTS[key]
+
+        return bits
+
+    def encode(self) -> str:
+        """
+        Encodage compact : `bits` en hexadécimal sur 19 chiffres, un par domaine (le dernier chiffre correspond au premier domaine de `DOMAINS`).
+        """
+
+        return format(self.bits, 'x').zfill(len(PositionPermissions.DOMAINS))
+
+    @classmethod
+    def decode(cls, value: str) -> typing.Self:
+        return cls(int(value, 16))
+
+    def copy(self) -> typing.Self:
+        return PositionPermissions(self.bits)
+
+    def freeze(self) -> typing.Self:
+        """
+        Passe les permissions en lecture seule.
+        """
+
+        self._frozen = True
+
+        return self
+
+    def to_dict(self) -> dict[str, str]:
+        """
+        Permissions au format du serveur (`{"sales": "a--r", ...}`).
+        """
+
+        return { domain: str(getattr(self, domain)) for domain in PositionPermissions.DOMAINS }
+
+    def __getattr__(self, domain: str) -> Permission:
+        if domain not in PositionPermissions.SHIFTS:
+            raise AttributeError(f"'PositionPermissions' object has no attribute '{domain}'")
 
+        return Permission(_parent = self, _shift = PositionPermissions.SHIFTS[domain])
 
-class Position:
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if getattr(self, '_frozen', False):
+            raise AttributeError("Permissions of a shared position are read-only, edit a copy() instead")
+
+        if name in PositionPermissions.SHIFTS:
+            shift = PositionPermissions.SHIFTS[name]
+            self.bits = self.bits & ~(0xF << shift) | value.bits << shift
+        else:
+            super().__setattr__(name, value)
+
+    def __or__(self, other: typing.Self) -> typing.Self:
+        return PositionPermissions(self.bits | other.bits)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, PositionPermissions) and self.bits == other.bits
+
+    def __hash__(self) -> int:
+        # Seules les permissions en lecture seule ont un hash stable
+        if not self._frozen:
+            raise TypeError("unhashable type: 'PositionPermissions' (only frozen permissions are hashable)")
+
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        return f"<PositionPermissions {self.encode()}>"
+
+    @staticmethod
+    def allowed(entities: typing.Iterable['Entity'], domain: str, flag: str) -> list[bool]:
+        """
+        Indique pour chaque entité si sa position lui accorde un droit (`allowed(members, 'sales', 'append')`).
+
+        Les entités d'une même interface partagent leurs positions (voir `.PositionCatalog`) : le masque n'est appliqué qu'une fois par position, en une seule passe Python sur les entités (les 76 bits ne tiennent pas dans un mot NumPy).
+        """
+
+        return [ ok for _, ok in PositionPermissions._granted(entities, domain, flag) ]
+
+    @staticmethod
+    def having(entities: typing.Iterable['Entity'], domain: str, flag: str) -> list['Entity']:
+        """
+        Entités dont la position accorde un droit (`having(members, 'sales', 'append')`).
+        """
+
+        return [ entity for entity, ok in PositionPermissions._granted(entities, domain, flag) if ok ]
+
+    @staticmethod
+    def _granted(entities: typing.Iterable['Entity'], domain: str, flag: str) -> typing.Iterator[tuple['Entity', bool]]:
+        mask = PositionPermissions.mask(domain, flag)
+        answers: dict[int, bool] = {}
+
+        for entity in entities:
+            position = entity.position
+            answer = answers.get(id(position))
+
+            if answer is None:
+                answer = answers[id(position)] = bool(position.permissions.bits & mask)
+
+            yield entity, answer
+
+PositionPermissions.DEFAULT = PositionPermissions.parse({
+    'inventories': "a---",
+    'items': "---r",
+    'members': "---r",
+    'organizations': "---r",
+    'sales': "---r"
+})
+
+class Position(Model):
     """
     Position légale d'une entité
 
@@ -73,12 +281,16 @@ class Position:
         Permissions accordées à l'utilisateur
     - manager_permissions: `.PositionPermissions`\n
         Permissions nécessaires pour gérer la position
+
+    Une position partagée par les entités d'une interface (voir `.PositionCatalog`) est en lecture seule : `copy()` en renvoie une version modifiable propre à une entité.
     """
 
+    __slots__ = ('_frozen', 'id', 'name', 'is_global_scope', 'permissions', 'manager_permissions')
+
     def __init__(self, id: str = 'member') -> None:
-        self._url: str = ""
-        self._headers: dict = {}
+        super().__init__()
 
+        self._frozen: bool = False
         self.id = id
         self.name: str = "Membre"
         self.is_global_scope: bool = True
@@ -89,27 +301,127 @@ class Position:
     def __repr__(self):
         return self.id
 
-    def update_permisions(self, **permissions: str):
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"Position '{self.id}' is shared by the entities of its interface and is read-only, edit a copy() instead")
+
+        super().__setattr__(name, value)
+
+    def copy(self) -> 'Position':
+        """
+        Copie modifiable de la position, qui n'est partagée avec aucune autre entité.
+        """
+
+        position = Position(self.id)
+        position._bind(self._interface, self._path)
+
+        position.name = self.name
+        position.is_global_scope = self.is_global_scope
+        position.permissions = self.permissions.copy()
+        position.manager_permissions = self.manager_permissions.copy()
+
+        return position
+
+    def _freeze(self) -> None:
+        self.permissions.freeze()
+        self.manager_permissions.freeze()
+        self._frozen = True
+
+    def _merge_permissions(self, permissions: dict[str, str]) -> None:
+        # Les permissions partagées ne sont pas modifiées en place : elles sont remplacées par une copie complétée
+        merged = self.permissions.copy()
+        merged.merge(permissions)
+
+        object.__setattr__(self, 'permissions', merged.freeze() if self._frozen else merged)
+
+    def _update_permissions_request(self, permissions: dict[str, str]) -> tuple:
         query = "&".join(f"{k}={ urllib.parse.quote(v) }" for k, v in permissions.items())
 
-        res = requests.post(f"{self._url}/update_permissions?{query}", headers = self._headers)
+        return 'POST', f"{self._url}/update_permissions?{query}", { 'headers': self._headers }, lambda res: self._merge_permissions(permissions)
 
-        if res.status_code == 200:
-            self.permissions.merge(permissions)
-        else:
-            res.raise_for_status()
+    def update_permisions(self, **permissions: str):
+        self._dispatch(self._update_permissions_request(permissions))
+
+    async def aupdate_permisions(self, **permissions: str):
+        await self._adispatch(self._update_permissions_request(permissions))
 
-    def _load(self, _data: dict, url: str, headers: dict) -> None:
-        self._url = url + '/model/positions/' + _data['id']
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        frozen = self._frozen
+        object.__setattr__(self, '_frozen', False) # Rechargement en place par `.PositionCatalog`
+
+        self._bind(interface, '/model/positions/' + _data['id'])
 
         self.id = _data['id']
         self.name = _data['name']
         self.is_global_scope = _data['is_global_scope']
+
+        # Repartir des permissions par défaut : une position rechargée peut en avoir perdu
+        self.permissions = PositionPermissions()
         self.permissions.merge(_data['permissions'])
+        self.manager_permissions = PositionPermissions()
         self.manager_permissions.merge(_data['manager_permissions'])
 
-class Entity:
+        if frozen:
+            self._freeze()
+
+class PositionCatalog:
+    """
+    Positions connues d'une interface. Le serveur n'en compte qu'une poignée : toutes les entités chargées par l'interface partagent la même instance de `.Position` pour un même ID au lieu d'en construire une chacune. Ces instances sont en lecture seule, pour qu'une modification locale de la position d'une entité ne s'applique pas aux autres (voir `Position.copy`).
+
+    Rempli au fil des chargements d'entités, ou en une fois par `EntityInterface.fetch_positions()` qui met aussi à jour les positions déjà connues.
+    """
+
+    def __init__(self, interface: Interface = None) -> None:
+        self.interface = interface
+        self._positions: dict[str, Position] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._positions
+
+    def __iter__(self) -> typing.Iterator[Position]:
+        return iter(list(self._positions.values()))
+
+    def get(self, id: str) -> Position | None:
+        return self._positions.get(id)
+
+    def resolve(self, _data: dict) -> Position:
+        """
+        Renvoie la position partagée correspondant aux données brutes, en la créant si elle est inconnue. Une position déjà connue n'est pas rechargée.
+        """
+
+        position = self._positions.get(_data['id'])
+
+        if position is None:
+            position = Position(_data['id'])
+            position._load(_data, self.interface)
+            position._freeze()
+
+            # Deux threads peuvent découvrir la même position : une seule instance est conservée
+            position = self._positions.setdefault(_data['id'], position)
+
+        return position
+
+    def update(self, _data: dict) -> Position:
+        """
+        Ajoute une position ou recharge en place celle déjà connue, pour que les entités qui la référencent voient ses nouvelles permissions.
+        """
+
+        position = self._positions.get(_data['id'])
+
+        if position is None:
+            return self.resolve(_data)
+
+        position._load(_data, self.interface)
+
+        return position
+
+    def clear(self) -> None:
+        self._positions.clear()
+
+class Entity(Model):
     """
     Classe de référence pour les entités
 
@@ -128,53 +440,85 @@ class Entity:
         Infos supplémentaires exploitables par différents services
     """
 
+    __slots__ = ('_raw', '_position', '_additional', 'id', 'name', 'register_date', 'zone')
+
     def __init__(self, id: NSID) -> None:
-        self._url: str = "" # URL de l'entité pour une requête
-        self._headers: dict = {}
+        super().__init__()
+        self._raw: dict = None # Données dont les attributs paresseux n'ont pas encore été construits
 
         self.id: NSID = NSID(id) # ID hexadécimal de l'entité
         self.name: str = "Entité Inconnue"
         self.register_date: int = 0
         self.zone: int = 20 # 10 = Serveur test, 20 = Serveur principal, 30 = Serveur de patientage
-        self.position: Position = Position()
+        self._position: Position = lazy_field.PENDING # Position par défaut, construite à la première lecture
         self.additional: dict = {}
 
-    def _load(self, _data: dict, url: str, headers: dict):
-        self._url = url + '/model/' + _data['_class'] + '/' + _data['id']
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None, lazy: bool = False):
+        """
+        Charge les données d'une entité. Avec `lazy`, `position`, `additional` (et `votes`, `owner`, `members` pour les sous-classes) ne sont construits qu'à leur première lecture.
+        """
+
+        self._bind(interface, '/model/' + _data['_class'] + '/' + _data['id'])
 
         self.id = NSID(_data['id'])
         self.name = _data['name']
         self.register_date = _data['register_date']
         self.zone = _data['zone']
-        self.position._load(_data['position'], url, headers)
+
+        lazy_field.reset(self, _data)
+
+        if not lazy:
+            lazy_field.hydrate(self)
+
+    @lazy_field
+    def position(self, _data: dict) -> Position:
+        if _data is None: # Entité créée localement
+            return Position()
+
+        catalog = getattr(self._interface, 'positions', None)
+
+        if catalog is not None:
+            return catalog.resolve(_data['position'])
+
+        position = Position(_data['position']['id'])
+        position._load(_data['position'], self._interface)
+
+        return position
+
+    @lazy_field
+    def additional(self, _data: dict) -> dict:
+        additional = {}
 
         for  key, value in _data.get('additional', {}).items():
             if isinstance(value, str) and value.startswith('\n'):
-                self.additional[key] = int(value[1:])
+                additional[key] = int(value[1:])
             else:
-                self.additional[key] = value
+                additional[key] = value
 
-    def set_name(self, new_name: str) -> None:
+        return additional
+
+    def _set_name_request(self, new_name: str) -> tuple:
         if len(new_name) > 32:
             raise ValueError(f"Name length mustn't exceed 32 characters.")
 
-        res = requests.post(f"{self._url}/rename?name={new_name}", headers = self._headers)
+        return 'POST', f"{self._url}/rename?name={new_name}", { 'headers': self._headers }, lambda res: setattr(self, 'name', new_name)
 
-        if res.status_code == 200:
-            self.name = new_name
-        else:
-            res.raise_for_status()
+    def set_name(self, new_name: str) -> None:
+        self._dispatch(self._set_name_request(new_name))
+
+    async def aset_name(self, new_name: str) -> None:
+        await self._adispatch(self._set_name_request(new_name))
+
+    def _set_position_request(self, position: Position) -> tuple:
+        return 'POST', f"{self._url}/change_position?position={position.id}", { 'headers': self._headers }, lambda res: setattr(self, 'position', position)
 
     def set_position(self, position: Position) -> None:
-        res = requests.post(f"{self._url}/change_position?position={position.id}", headers = self._headers)
+        self._dispatch(self._set_position_request(position))
 
-        if res.status_code == 200:
-            self.position = position
-        else:
-            res.raise_for_status()
+    async def aset_position(self, position: Position) -> None:
+        await self._adispatch(self._set_position_request(position))
 
-    def add_link(self, key: str, value: str | int) -> None:
+    def _add_link_request(self, key: str, value: str | int) -> tuple:
         if isinstance(value, str):
             _class = "string"
         elif isinstance(value, int):
@@ -190,20 +534,84 @@ class Entity:
 
         query = "&".join(f"{k}={ urllib.parse.quote(v) }" for k, v in params.items())
 
-        res = requests.post(f"{self._url}/add_link?{query}", headers = self._headers)
-
-        if res.status_code == 200:
+        def _linked(res):
             self.additional[key] = value
-        else:
-            res.raise_for_status()
 
-    def unlink(self, key: str) -> None:
-        res = requests.post(f"{self._url}/remove_link?link={urllib.parse.quote(key)}", headers = self._headers)
+        return 'POST', f"{self._url}/add_link?{query}", { 'headers': self._headers }, _linked
+
+    def add_link(self, key: str, value: str | int) -> None:
+        self._dispatch(self._add_link_request(key, value))
+
+    async def aadd_link(self, key: str, value: str | int) -> None:
+        await self._adispatch(self._add_link_request(key, value))
 
-        if res.status_code == 200:
+    def _unlink_request(self, key: str) -> tuple:
+        def _unlinked(res):
             del self.additional[key]
-        else:
-            res.raise_for_status()
+
+        return 'POST', f"{self._url}/remove_link?link={urllib.parse.quote(key)}", { 'headers': self._headers }, _unlinked
+
+    def unlink(self, key: str) -> None:
+        self._dispatch(self._unlink_request(key))
+
+    async def aunlink(self, key: str) -> None:
+        await self._adispatch(self._unlink_request(key))
+
+# Niveaux d'XP
+
+_LEVELS: list[int] = [] # Seuil d'XP de chaque niveau : un membre est au niveau `i` dès que son XP ne dépasse pas `_LEVELS[i]`
+_LEVELS_LOCK = threading.Lock()
+
+def level_threshold(level: int) -> int:
+    """
+    XP maximale du niveau `level`.
+    """
+
+    return int(round(25 * (level * 2.5) ** 2, -2))
+
+def _extend_levels(xp: int) -> list[int]:
+    if not _LEVELS or _LEVELS[-1] < xp:
+        with _LEVELS_LOCK:
+            while not _LEVELS or _LEVELS[-1] < xp:
+                _LEVELS.append(level_threshold(len(_LEVELS)))
+
+    return _LEVELS
+
+def level_for_xp(xp: int) -> int:
+    """
+    Niveau correspondant à une quantité d'XP (recherche dichotomique dans la table des seuils, étendue au besoin).
+    """
+
+    return bisect.bisect_left(_extend_levels(xp), xp)
+
+def xp_to_next_level(xp: int) -> int:
+    """
+    XP à gagner pour passer au niveau suivant.
+    """
+
+    level = level_for_xp(xp)
+
+    return _extend_levels(level_threshold(level + 1))[level] + 1 - xp
+
+def levels_for_xp(values: typing.Iterable[int]) -> 'numpy.ndarray':
+    """
+    Version vectorisée de `level_for_xp` pour un ensemble de valeurs (liste, tableau NumPy, colonne...).
+
+    ## Renvoie
+    - `numpy.ndarray[int64]` des niveaux, dans l'ordre des valeurs
+    """
+
+    if numpy is None:
+        raise ImportError("levels_for_xp requires numpy (pip install nsarchive[analytics]).")
+
+    values = numpy.asarray(values, dtype = 'int64')
+
+    if not len(values):
+        return numpy.zeros(0, dtype = 'int64')
+
+    table = numpy.asarray(_extend_levels(int(values.max())), dtype = 'int64')
+
+    return numpy.searchsorted(table, values, side = 'left')
 
 class User(Entity):
     """
@@ -219,6 +627,8 @@ class User(Entity):
         Liste des votes auxquels a participé l'entité
     """
 
+    __slots__ = ('_votes', 'xp', 'boosts')
+
     def __init__(self, id: NSID) -> None:
         super().__init__(NSID(id))
 
@@ -226,72 +636,82 @@ class User(Entity):
         self.boosts: dict[str, int] = {}
         self.votes: list[NSID] = []
 
-    def _load(self, _data: dict, url: str, headers: dict):
-        self._url = url + '/model/individuals/' + _data['id']
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None, lazy: bool = False):
+        self._bind(interface, '/model/individuals/' + _data['id'])
 
         self.id = NSID(_data['id'])
         self.name = _data['name']
         self.register_date = _data['register_date']
         self.zone = _data['zone']
-        self.position._load(_data['position'], url, headers)
-
-        for  key, value in _data.get('additional', {}).items():
-            if isinstance(value, str) and value.startswith('\n'):
-                self.additional[key] = int(value[1:])
-            else:
-                self.additional[key] = value
 
         self.xp = _data['xp']
-        self.boosts = _data['boosts']
+        self.boosts = dict(_data['boosts'])
 
-        self.votes = [ NSID(vote) for vote in _data['votes'] ]
+        lazy_field.reset(self, _data)
 
-    def get_level(self) -> None:
-        i = 0
-        while self.xp > int(round(25 * (i * 2.5) ** 2, -2)):
-            i += 1
+        if not lazy:
+            lazy_field.hydrate(self)
 
-        return i
+    @lazy_field
+    def votes(self, _data: dict) -> list[NSID]:
+        return NSID.many(_data['votes'])
 
-    def add_xp(self, amount: int) -> None:
+    def get_level(self) -> int:
+        return level_for_xp(self.xp)
+
+    def get_xp_to_next_level(self) -> int:
+        return xp_to_next_level(self.xp)
+
+    def _add_xp_request(self, amount: int) -> tuple:
         boost = 0 if 0 in self.boosts.values() or amount <= 0 else max(list(self.boosts.values()) + [ 1 ])
-        res = requests.post(f"{self._url}/add_xp?amount={amount * boost}", headers = self._headers)
 
-        if res.status_code == 200:
+        def _added(res):
             self.xp += amount * boost
-        else:
-            res.raise_for_status()
 
-    def edit_boost(self, name: str, multiplier: int = -1) -> None:
-        res = requests.post(f"{self._url}/edit_boost?boost={name}&multiplier={multiplier}", headers = self._headers)
+        return 'POST', f"{self._url}/add_xp?amount={amount * boost}", { 'headers': self._headers }, _added
+
+    def add_xp(self, amount: int) -> None:
+        self._dispatch(self._add_xp_request(amount))
+
+    async def aadd_xp(self, amount: int) -> None:
+        await self._adispatch(self._add_xp_request(amount))
 
-        if res.status_code == 200:
+    def _edit_boost_request(self, name: str, multiplier: int) -> tuple:
+        def _edited(res):
             if multiplier >= 0:
                 self.boosts[name] = multiplier
             else:
                 del self.boosts[name]
-        else:
-            res.raise_for_status()
 
-    def get_groups(self) -> list[Entity]:
-        res = requests.get(f"{self._url}/groups", headers = self._headers)
+        return 'POST', f"{self._url}/edit_boost?boost={name}&multiplier={multiplier}", { 'headers': self._headers }, _edited
 
-        if res.status_code == 200:
-            data = res.json()
-            groups = []
+    def edit_boost(self, name: str, multiplier: int = -1) -> None:
+        self._dispatch(self._edit_boost_request(name, multiplier))
 
-            for grp in data:
-                if grp is None: continue
+    async def aedit_boost(self, name: str, multiplier: int = -1) -> None:
+        await self._adispatch(self._edit_boost_request(name, multiplier))
 
-                group = Organization(grp["id"])
-                group._load(grp, self.url, self._headers)
+    def _groups(self, res: requests.Response) -> list[Entity]:
+        if res.status_code != 200:
+            return []
 
-                groups.append(group)
+        groups = []
 
-            return groups
-        else:
-            return []
+        for grp in res.json():
+            if grp is None: continue
+
+            group = Organization(grp["id"])
+            group._load(grp, self._interface)
+
+            groups.append(group)
+
+        return groups
+
+    def get_groups(self) -> list[Entity]:
+        return self._groups(self._transport.get(f"{self._url}/groups", headers = self._headers))
+
+    async def aget_groups(self) -> list[Entity]:
+        return self._groups(await self._transport.aget(f"{self._url}/groups", headers = self._headers))
 
 class GroupPermissions:
     """
@@ -338,6 +758,8 @@ class Organization(Entity):
         Liste des actions émises par l'entreprise
     """
 
+    __slots__ = ('_owner', '_members', 'avatar_url', 'certifications')
+
     def __init__(self, id: NSID) -> None:
         super().__init__(NSID(id))
 
@@ -347,83 +769,110 @@ class Organization(Entity):
         self.certifications: dict = {}
         self.members: list[GroupMember] = []
 
-    def _load(self, _data: dict, url: str, headers: dict):
-        self._url = url + '/model/organizations/' + _data['id']
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None, lazy: bool = False):
+        self._bind(interface, '/model/organizations/' + _data['id'])
 
         self.id = NSID(_data['id'])
         self.name = _data['name']
         self.register_date = _data['register_date']
         self.zone = _data['zone']
-        self.position._load(_data['position'], url, headers)
 
-        for  key, value in _data.get('additional', {}).items():
-            if isinstance(value, str) and value.startswith('\n'):
-                self.additional[key] = int(value[1:])
-            else:
-                self.additional[key] = value
+        self.certifications = dict(_data['certifications'])
+
+        lazy_field.reset(self, _data)
+
+        if not lazy:
+            lazy_field.hydrate(self)
 
+    @lazy_field
+    def owner(self, _data: dict) -> Entity:
         _owner = _data['owner']
 
         if _owner['_class'] == 'individuals':
-            self.owner = User(_owner['id'])
+            owner = User(_owner['id'])
         elif _owner['_class'] == 'organizations':
-            self.owner = Organization(_owner['id'])
+            owner = Organization(_owner['id'])
         else:
-            self.owner = Entity(_owner['id'])
+            owner = Entity(_owner['id'])
+
+        # Hydraté en même temps que l'organisation si celle-ci ne l'est pas à la demande
+        owner._load(_owner, self._interface, lazy = True)
+
+        return owner
 
-        self.owner._load(_owner, url, headers)
+    @lazy_field
+    def members(self, _data: dict) -> list[GroupMember]:
+        members = []
 
         for _member in _data['members']:
             member = GroupMember(_member['id'])
             member.permission_level = _member['level']
 
-            self.members.append(member)
+            members.append(member)
 
-        self.certifications = _data['certifications']
+        return members
+
+    def _add_certification_request(self, certification: str, expires: int) -> tuple:
+        def _certified(res):
+            self.certifications[certification] = int(round(time.time()) + expires)
+
+        return 'POST', f"{self._url}/add_certification?name={certification}&duration={expires}", { 'headers': self._headers }, _certified
 
     def add_certification(self, certification: str, __expires: int = 2419200) -> None:
-        res = requests.post(f"{self._url}/add_certification?name={certification}&duration={__expires}", headers = self._headers)
+        self._dispatch(self._add_certification_request(certification, __expires))
 
-        if res.status_code == 200:
-            self.certifications[certification] = int(round(time.time()) + __expires)
-        else:
-            res.raise_for_status()
+    async def aadd_certification(self, certification: str, __expires: int = 2419200) -> None:
+        await self._adispatch(self._add_certification_request(certification, __expires))
 
     def has_certification(self, certification: str) -> bool:
         return certification in self.certifications.keys()
 
+    def _remove_certification_request(self, certification: str) -> tuple:
+        def _removed(res):
+            del self.certifications[certification]
+
+        return 'POST', f"{self._url}/remove_certification?name={certification}", { 'headers': self._headers }, _removed
+
     def remove_certification(self, certification: str) -> None:
-        res = requests.post(f"{self._url}/remove_certification?name={certification}", headers = self._headers)
+        self._dispatch(self._remove_certification_request(certification))
 
-        if res.status_code == 200:
-            del self.certifications[certification]
-        else:
-            res.raise_for_status()
+    async def aremove_certification(self, certification: str) -> None:
+        await self._adispatch(self._remove_certification_request(certification))
 
-    def add_member(self, member: NSID, permissions: GroupPermissions = GroupPermissions()) -> None:
+    def _add_member_request(self, member: NSID, permissions: GroupPermissions) -> tuple:
         if not isinstance(member, NSID):
             raise TypeError("L'entrée membre doit être de type NSID")
 
-        res = requests.post(f"{self._url}/add_member?id={member}", headers = self._headers, json = {
-            "permissions": permissions.__dict__
-        })
+        def _added(res):
+            _member = GroupMember(member)
+            _member.permissions = permissions
 
-        if res.status_code == 200:
-            member = GroupMember(member)
-            member.permissions = permissions
+            self.members.append(_member)
 
-            self.members.append(member)
-        else:
-            res.raise_for_status()
+        return 'POST', f"{self._url}/add_member?id={member}", { 'headers': self._headers, 'json': {
+            "permissions": permissions.__dict__
+        } }, _added
 
-    def remove_member(self, member: GroupMember) -> None:
-        requests.post(f"{self._url}/remove_member?id={member.id}", headers = self._headers)
+    def add_member(self, member: NSID, permissions: GroupPermissions = GroupPermissions()) -> None:
+        self._dispatch(self._add_member_request(member, permissions))
+
+    async def aadd_member(self, member: NSID, permissions: GroupPermissions = GroupPermissions()) -> None:
+        await self._adispatch(self._add_member_request(member, permissions))
 
+    def _forget_member(self, member: GroupMember) -> None:
+        # La réponse du serveur n'est pas vérifiée : le membre est retiré localement dans tous les cas
         for _member in self.members:
             if _member.id == member.id:
                 self.members.remove(_member)
 
+    def remove_member(self, member: GroupMember) -> None:
+        self._transport.post(f"{self._url}/remove_member?id={member.id}", headers = self._headers)
+        self._forget_member(member)
+
+    async def aremove_member(self, member: GroupMember) -> None:
+        await self._transport.apost(f"{self._url}/remove_member?id={member.id}", headers = self._headers)
+        self._forget_member(member)
+
     def set_owner(self, member: User) -> None:
         self.owner = member
 
@@ -438,4 +887,422 @@ class Organization(Entity):
         return [ member.__getattribute__(attribute) for member in self.members ]
 
     def save_avatar(self, data: bytes = None):
-        pass
\ No newline at end of file
+        pass
+
+def _entity_class(entity: Entity) -> str:
+    if isinstance(entity, User):
+        return 'individuals'
+    elif isinstance(entity, Organization):
+        return 'organizations'
+    else:
+        return 'entities'
+
+def _matches(entity: Entity, query: dict) -> bool:
+    """
+    Indique si une entité répond à une requête `fetch_entities` (égalité des valeurs, sans tenir compte de la casse, comme NationDB).
+    """
+
+    for key, value in query.items():
+        if key == '_class':
+            actual = _entity_class(entity)
+        else:
+            actual = getattr(entity, key, None)
+
+            if isinstance(actual, Position):
+                actual = actual.id
+
+        if str(actual).lower() != str(value).lower():
+            return False
+
+    return True
+
+class EntityIndex:
+    """
+    Index en mémoire d'une population d'entités, pour filtrer localement sans refaire de `fetch_entities`.
+
+    Index par hachage sur `zone`, `position` (ID), `_class`, les noms de certifications et les clés des infos supplémentaires (`additional`), et index triés sur `register_date` et `xp` pour les intervalles.
+
+    Une entité ajoutée de nouveau (relue, par exemple) remplace la précédente. Associé à une interface (`EntityInterface.build_index`), l'index reçoit les entités qu'elle charge qui répondent à la requête de construction (ou qui y sont déjà), et réindexe, à la requête suivante, celles visées par une écriture réussie (`add_xp`, `set_position`, `add_certification`...).
+
+    ## Paramètres
+    entities: `Iterable[.Entity]` (optionnel)\n
+        Entités à indexer
+    query: `dict` (optionnel)\n
+        Requête dont l'index reflète les résultats (voir `receive`)
+    """
+
+    HASHED = ('zone', 'position', '_class', 'certifications', 'additional')
+    SORTED = ('register_date', 'xp')
+
+    def __init__(self, entities: typing.Iterable[Entity] = (), query: dict = None) -> None:
+        self.scope: dict = dict(query or {})
+        self._entities: dict[NSID, Entity] = {}
+        self._hashed: dict[str, dict[typing.Any, set[NSID]]] = { name: {} for name in self.HASHED }
+        self._sorted: dict[str, tuple[list, list[NSID]]] = { name: ([], []) for name in self.SORTED }
+        self._keys: dict[NSID, dict[str, tuple]] = {} # Valeurs sous lesquelles chaque entité est indexée
+        self._dirty: set[NSID] = set()
+        self._lock = threading.RLock()
+
+        for entity in entities:
+            self.add(entity)
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, id: NSID) -> bool:
+        return NSID(id) in self._entities
+
+    def __iter__(self) -> typing.Iterator[Entity]:
+        return iter(list(self._entities.values()))
+
+    def get(self, id: NSID) -> Entity | None:
+        return self._entities.get(NSID(id))
+
+    @staticmethod
+    def _values(entity: Entity) -> dict[str, tuple]:
+        return {
+            'zone': (entity.zone,),
+            'position': (entity.position.id,),
+            '_class': (_entity_class(entity),),
+            'certifications': tuple(getattr(entity, 'certifications', ())),
+            'additional': tuple(entity.additional),
+            'register_date': (entity.register_date,),
+            'xp': (entity.xp,) if isinstance(entity, User) else ()
+        }
+
+    def add(self, entity: Entity) -> None:
+        """
+        Ajoute une entité ou met à jour son indexation.
+        """
+
+        with self._lock:
+            self.remove(entity.id)
+
+            keys = self._keys[entity.id] = self._values(entity)
+            self._entities[entity.id] = entity
+
+            for name in self.HASHED:
+                for value in keys[name]:
+                    self._hashed[name].setdefault(value, set()).add(entity.id)
+
+            for name in self.SORTED:
+                values, ids = self._sorted[name]
+
+                for value in keys[name]:
+                    i = bisect.bisect_right(values, value)
+                    values.insert(i, value)
+                    ids.insert(i, entity.id)
+
+    update = add
+
+    def receive(self, entity: Entity) -> None:
+        """
+        Ajoute une entité chargée par l'interface si elle répond à la requête de construction, ou la remplace si elle est déjà indexée.
+        """
+
+        if entity.id in self._entities or _matches(entity, self.scope):
+            self.add(entity)
+
+    def remove(self, id: NSID) -> None:
+        id = NSID(id)
+
+        with self._lock:
+            keys = self._keys.pop(id, None)
+            self._dirty.discard(id)
+
+            if keys is None:
+                return
+
+            del self._entities[id]
+
+            for name in self.HASHED:
+                for value in keys[name]:
+                    bucket = self._hashed[name][value]
+                    bucket.discard(id)
+
+                    if not bucket:
+                        del self._hashed[name][value]
+
+            for name in self.SORTED:
+                values, ids = self._sorted[name]
+
+                for value in keys[name]:
+                    i = bisect.bisect_left(values, value)
+
+                    while ids[i] != id:
+                        i += 1
+
+                    del values[i]
+                    del ids[i]
+
+    def invalidate_url(self, url: str) -> None:
+        """
+        Marque les entités visées par une URL d'écriture : elles seront réindexées, depuis leur état local, avant la prochaine requête.
+        """
+
+        for _class, id in Cache.targets(url):
+            if _class in Cache._ENTITY_CLASSES and id in self._entities:
+                self._dirty.add(id)
+
+    def _refresh(self) -> None:
+        if not self._dirty:
+            return
+
+        with self._lock:
+            for id in list(self._dirty):
+                entity = self._entities.get(id)
+
+                if entity is not None:
+                    self.add(entity)
+
+            self._dirty.clear()
+
+    def _range(self, name: str, bounds: tuple) -> set[NSID]:
+        values, ids = self._sorted[name]
+        low, high = bounds
+
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        end = len(values) if high is None else bisect.bisect_right(values, high)
+
+        return set(ids[start:end])
+
+    def query(self, zone: int = None, position: str = None, _class: str = None, certification: str = None, link: str = None, register_date: tuple[int, int] = None, xp: tuple[int, int] = None, order_by: str = None, reverse: bool = False, limit: int = None) -> list[Entity]:
+        """
+        Entités répondant à tous les critères donnés.
+
+        ## Paramètres
+        zone, position, _class: (optionnel)\n
+            Valeur exacte (`position` est l'ID de la position)
+        certification: `str` (optionnel)\n
+            Nom d'une certification détenue
+        link: `str` (optionnel)\n
+            Clé présente dans les infos supplémentaires
+        register_date, xp: `tuple[int, int]` (optionnel)\n
+            Intervalle inclusif, `None` pour une borne ouverte (`xp = (1000, None)`)
+        order_by: `str` (optionnel)\n
+            `'register_date'` ou `'xp'` (les entités sans ce champ, comme les organisations pour `xp`, sont alors exclues)
+        reverse: `bool` (optionnel)\n
+            Ordre décroissant
+        limit: `int` (optionnel)\n
+            Nombre maximal de résultats
+
+        ## Renvoie
+        - `list[.Entity | .User | .Organization]`
+        """
+
+        self._refresh()
+
+        with self._lock:
+            sets = []
+
+            for name, value in (('zone', zone), ('position', position), ('_class', _class), ('certifications', certification), ('additional', link)):
+                if value is not None:
+                    sets.append(self._hashed[name].get(value, set()))
+
+            for name, bounds in (('register_date', register_date), ('xp', xp)):
+                if bounds is not None:
+                    sets.append(self._range(name, bounds))
+
+            if sets:
+                sets.sort(key = len)
+                ids = sets[0].intersection(*sets[1:]) if len(sets) > 1 else sets[0]
+            else:
+                ids = set(self._entities)
+
+            if order_by is None:
+                res = [ self._entities[id] for id in ids ]
+            else:
+                # Parcours de l'index trié, plutôt qu'un tri des résultats
+                _, ordered = self._sorted[order_by]
+                res = [ self._entities[id] for id in (reversed(ordered) if reverse else ordered) if id in ids ]
+
+        return res[:limit] if limit is not None else res
+
+    def count(self, **criteria: typing.Any) -> int:
+        return len(self.query(**criteria))
+
+class Leaderboard:
+    """
+    Classement des membres par XP, tenu à jour localement plutôt que recalculé (`fetch_entities` puis tri) à chaque consultation.
+
+    Chaque classement (global, et un par zone) est une liste triée de clés `(-xp, id)` : le rang d'un membre et une page du classement s'obtiennent par dichotomie, en temps logarithmique. Les membres ex æquo partagent le même rang.
+
+    Associé à une interface (`EntityInterface.build_leaderboard`), le classement reçoit les membres qu'elle charge qui répondent à la requête de construction (ou qui y sont déjà classés), et replace, à la requête suivante, ceux dont l'XP a changé (`add_xp` réussi).
+
+    ## Paramètres
+    users: `Iterable[.User]` (optionnel)\n
+        Membres à classer
+    query: `dict` (optionnel)\n
+        Requête dont le classement reflète les résultats (voir `receive`)
+    """
+
+    def __init__(self, users: typing.Iterable[User] = (), query: dict = None) -> None:
+        self.scope: dict = dict(query or {})
+        self._users: dict[NSID, User] = {}
+        self._keys: dict[NSID, tuple[tuple[int, NSID], int]] = {} # Clé et zone sous lesquelles chaque membre est classé
+        self._boards: dict[int, list[tuple[int, NSID]]] = { None: [] } # `None` : classement global
+        self._dirty: set[NSID] = set()
+        self._lock = threading.RLock()
+
+        for user in users:
+            self.add(user)
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, id: NSID) -> bool:
+        return NSID(id) in self._users
+
+    def get(self, id: NSID) -> User | None:
+        return self._users.get(NSID(id))
+
+    def zones(self) -> list[int]:
+        """
+        Zones ayant au moins un membre classé.
+        """
+
+        return [ zone for zone in self._boards if zone is not None ]
+
+    def add(self, user: User) -> None:
+        """
+        Ajoute un membre au classement ou le replace selon son XP actuelle. Les entités qui ne sont pas des membres sont ignorées.
+        """
+
+        if not isinstance(user, User):
+            return
+
+        with self._lock:
+            self.remove(user.id)
+
+            key = (-user.xp, user.id)
+            self._keys[user.id] = (key, user.zone)
+            self._users[user.id] = user
+
+            bisect.insort(self._boards[None], key)
+            bisect.insort(self._boards.setdefault(user.zone, []), key)
+
+    update = add
+
+    def receive(self, user: User) -> None:
+        """
+        Ajoute un membre chargé par l'interface s'il répond à la requête de construction, ou le replace s'il est déjà classé.
+        """
+
+        if isinstance(user, User) and (user.id in self._users or _matches(user, self.scope)):
+            self.add(user)
+
+    def remove(self, id: NSID) -> None:
+        id = NSID(id)
+
+        with self._lock:
+            entry = self._keys.pop(id, None)
+            self._dirty.discard(id)
+
+            if entry is None:
+                return
+
+            del self._users[id]
+            key, zone = entry
+
+            for scope in (None, zone):
+                board = self._boards[scope]
+                del board[bisect.bisect_left(board, key)]
+
+                if scope is not None and not board:
+                    del self._boards[scope]
+
+    def invalidate_url(self, url: str) -> None:
+        """
+        Marque les membres visés par une URL d'écriture : ils seront replacés, depuis leur état local, avant la prochaine requête.
+        """
+
+        for _class, id in Cache.targets(url):
+            if _class in Cache._ENTITY_CLASSES and id in self._users:
+                self._dirty.add(id)
+
+    def _refresh(self) -> None:
+        if not self._dirty:
+            return
+
+        with self._lock:
+            for id in list(self._dirty):
+                user = self._users.get(id)
+
+                if user is not None:
+                    self.add(user)
+
+            self._dirty.clear()
+
+    def rank(self, user: User | NSID, zone: int = None) -> int | None:
+        """
+        Rang d'un membre (à partir de 1).
+
+        ## Paramètres
+        user: `.User | NSID`\n
+            Membre ou son ID
+        zone: `int` (optionnel)\n
+            Zone du classement, global par défaut
+
+        ## Renvoie
+        - `int`, ou `None` si le membre n'est pas classé (dans cette zone)
+        """
+
+        self._refresh()
+        id = user.id if isinstance(user, Entity) else NSID(user)
+
+        with self._lock:
+            entry = self._keys.get(id)
+
+            if entry is None or (zone is not None and entry[1] != zone):
+                return None
+
+            return bisect.bisect_left(self._boards[zone], (entry[0][0],)) + 1
+
+    def top(self, count: int = 10, zone: int = None) -> list[User]:
+        """
+        Membres les mieux classés, du premier au `count`-ième.
+        """
+
+        return self.page(0, count, zone)
+
+    def page(self, page: int = 0, size: int = 10, zone: int = None) -> list[User]:
+        """
+        Page du classement.
+
+        ## Paramètres
+        page: `int`\n
+            Numéro de la page, à partir de 0
+        size: `int`\n
+            Nombre de membres par page
+        zone: `int` (optionnel)\n
+            Zone du classement, global par défaut
+
+        ## Renvoie
+        - `list[.User]` dans l'ordre du classement
+        """
+
+        self._refresh()
+
+        with self._lock:
+            board = self._boards.get(zone, [])
+
+            return [ self._users[id] for _, id in board[page * size:(page + 1) * size] ]
+
+    def around(self, user: User | NSID, count: int = 5, zone: int = None) -> list[User]:
+        """
+        Membres classés autour d'un membre (jusqu'à `count` de chaque côté), lui compris.
+        """
+
+        self._refresh()
+        id = user.id if isinstance(user, Entity) else NSID(user)
+
+        with self._lock:
+            entry = self._keys.get(id)
+
+            if entry is None or (zone is not None and entry[1] != zone):
+                return []
+
+            board = self._boards[zone]
+            i = bisect.bisect_left(board, entry[0])
+
+            return [ self._users[id] for _, id in board[max(i - count, 0):i + count + 1] ]
@@ -1,12 +1,12 @@
-import requests
 import time
 
-from .base import NSID
+from .base import NSID, Interface, Model
+
+class Report(Model):
+    __slots__ = ('id', 'author', 'target', 'date', 'status', 'reason', 'details')
 
-class Report:
     def __init__(self, id: NSID):
-        self._url: str = ""
-        self._headers: dict = {}
+        super().__init__()
 
         self.id: NSID = id
         self.author: NSID = NSID('0')
@@ -16,9 +16,8 @@ class Report:
         self.reason: str = None # Raison proposée par le bot
         self.details:str = None # Description des faits
 
-    def _load(self, _data: dict, url: str, headers: str) -> None:
-        self._url = url
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/justice/reports/' + _data['id'])
 
         self.id = NSID(_data['id'])
         self.author = NSID(_data['author'])
@@ -28,7 +27,7 @@ class Report:
         self.reason = _data.get('reason', None)
         self.details = _data.get('details', None)
 
-    def update(self, status: str | int):
+    def _update_request(self, status: str | int) -> tuple:
         __statuses = [
             'pending',
             'accepted',
@@ -42,17 +41,19 @@ class Report:
             else:
                 raise ValueError(f"Invalid status: {status}. Must be one of {__statuses} or an integer between 0 and 2.")
 
-        res = requests.post(f"{self._url}/update?status={status}", headers = self._headers)
+        return 'POST', f"{self._url}/update?status={status}", { 'headers': self._headers }, lambda res: setattr(self, 'status', status)
+
+    def update(self, status: str | int):
+        self._dispatch(self._update_request(status))
 
-        if res.status_code == 200:
-            self.status = status
-        else:
-            res.raise_for_status()
+    async def aupdate(self, status: str | int):
+        await self._adispatch(self._update_request(status))
+
+class Sanction(Model):
+    __slots__ = ('id', 'target', 'type', 'date', 'duration', 'title', 'lawsuit')
 
-class Sanction:
     def __init__(self, id: NSID):
-        self._url: str = ""
-        self._headers: dict = {}
+        super().__init__()
 
         self.id: NSID = id
         self.target: NSID = NSID('0')
@@ -62,9 +63,8 @@ class Sanction:
         self.title: str = None
         self.lawsuit: NSID = NSID('0')
 
-    def _load(self, _data: dict, url: str, headers: dict) -> None:
-        self._url = url
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/justice/sanctions/' + _data['id'])
 
         self.id = NSID(_data['id'])
         self.target = NSID(_data['target'])
@@ -74,10 +74,11 @@ class Sanction:
         self.title = _data['title']
         self.lawsuit = NSID(_data['lawsuit'])
 
-class Lawsuit:
+class Lawsuit(Model):
+    __slots__ = ('id', 'target', 'judge', 'title', 'date', 'report', 'is_private', 'is_open')
+
     def __init__(self, id: NSID):
-        self._url: str = ""
-        self._headers: dict = {}
+        super().__init__()
 
         self.id: NSID = id
         self.target: NSID = NSID('0')
@@ -88,12 +89,8 @@ class Lawsuit:
         self.is_private: bool = False
         self.is_open: bool = False
 
-    def _load(self, _data: dict, url: str, headers: dict) -> None:
-        self._url = url
-        self._headers = headers
-
-        self._url = url
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/justice/lawsuits/' + _data['id'])
 
         self.id = NSID(_data['id'])
         self.target = NSID(_data['target'])
@@ -105,4 +102,4 @@ class Lawsuit:
         self.report = NSID(report) if report else NSID('0')
 
         self.is_private = bool(_data.get('private', 0))
-        self.is_open = _data.get('status', 0) == 0
\ No newline at end of file
+        self.is_open = _data.get('status', 0) == 0
@@ -1,8 +1,7 @@
 import json
-import requests
 import time
 
-from .base import NSID
+from .base import NSID, Interface, Model
 
 # Votes
 
@@ -33,7 +32,7 @@ class VoteOption:
         self.title = str(_data['title'])
         self.count = int(_data['count'])
 
-class Vote:
+class Vote(Model):
     """
     Classe de référence pour les différents votes du serveur
 
@@ -52,9 +51,10 @@ class Vote:
         Date limite pour voter
     """
 
+    __slots__ = ('id', 'title', 'author', 'startDate', 'endDate', 'options')
+
     def __init__(self, id: NSID = None) -> None:
-        self._url: str
-        self._headers: dict
+        super().__init__()
 
         self.id: NSID = id if id else NSID(0)
         self.title: str = ''
@@ -65,9 +65,8 @@ class Vote:
 
         self.options: dict[str, VoteOption] = {}
 
-    def _load(self, _data: dict, url: str, headers: dict) -> None:
-        self._url = url
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/votes/' + _data['id'])
 
         self.id = NSID(_data['id'])
         self.title = _data['title']
@@ -89,29 +88,42 @@ class Vote:
         else:
             raise ValueError(f"Option {id} not found in vote {self.id}")
 
+    def _add_vote_request(self, id: str) -> tuple:
+        def _voted(res):
+            self.get(id).count += 1
+
+        return 'POST', f"{self._url}/vote?option={id}", { 'headers': self._headers }, _voted
+
     def add_vote(self, id: str):
         """
         Ajoute un vote à l'option spécifiée
         """
 
-        res = requests.post(f"{self._url}/vote?option={id}", headers = self._headers)
+        self._dispatch(self._add_vote_request(id))
 
-        if res.status_code == 200:
-            self.get(id).count += 1
-        else:
-            res.raise_for_status()
+    async def aadd_vote(self, id: str):
+        """
+        Ajoute un vote à l'option spécifiée
+        """
+
+        await self._adispatch(self._add_vote_request(id))
+
+    def _close_request(self) -> tuple:
+        return 'POST', f"{self._url}/close", { 'headers': self._headers }, lambda res: setattr(self, 'endDate', round(time.time()))
 
     def close(self):
         """
         Ferme le vote
         """
 
-        res = requests.post(f"{self._url}/close", headers = self._headers)
+        self._dispatch(self._close_request())
 
-        if res.status_code == 200:
-            self.endDate = round(time.time())
-        else:
-            res.raise_for_status()
+    async def aclose(self):
+        """
+        Ferme le vote
+        """
+
+        await self._adispatch(self._close_request())
 
 class LawsuitVote(Vote):
     """
@@ -125,4 +137,4 @@ class LawsuitVote(Vote):
             VoteOption('guilty', 'Coupable'),
             VoteOption('innocent', 'Innocent'),
             VoteOption('blank', 'Pas d\'avis'),
-        ]
\ No newline at end of file
+        ]
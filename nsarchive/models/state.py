@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-import requests
-
-from .base import NSID
+from .base import NSID, Interface, Model
 from .republic import Vote
 
-class Party:
+class Party(Model):
+    __slots__ = ('org_id', 'color', 'motto', 'scale', 'last_election')
+
     def __init__(self, org_id: NSID):
-        self._url: str = ''
-        self._headers: dict = {}
+        super().__init__()
 
         self.org_id = org_id
 
@@ -17,38 +16,41 @@ class Party:
         self.scale: dict = {}
         self.last_election: int = None
 
-    def _load(self, _data: dict, url: str = None, headers: dict = None):
-        self._url = url
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/parties/' + _data['org_id'])
 
         self.org_id = _data['org_id']
 
         self.color = _data['color']
         self.motto = _data['motto']
-        self.scale = _data['politiscales']
+        self.scale = dict(_data['politiscales'])
         self.last_election = _data['last_election']
 
     def cancel_candidacy(self, election: Election):
         election.cancel_candidacy()
 
-class Election:
+    async def acancel_candidacy(self, election: Election):
+        await election.acancel_candidacy()
+
+class Election(Model):
+    __slots__ = ('id', 'type', 'vote')
+
     def __init__(self, id: NSID):
-        self._url: str = ''
-        self._headers: dict = {}
+        super().__init__()
 
         self.id = id
         self.type: str = 'full' # Partial = législatives, full = totales
         self.vote: Vote = None
 
-    def _load(self, _data: dict, url: str = None, headers: str = None):
-        self._url = url
-        self._headers = headers
+    def _load(self, _data: dict, interface: Interface = None) -> None:
+        self._bind(interface, '/elections/' + _data['id'])
 
         self.id = _data['id']
         self.type = _data['type']
 
         self.vote = Vote(_data['vote']['id'])
-        self.vote._load(_data['vote'], url, headers)
+        self.vote._load(_data['vote'], interface)
+        self.vote._bind(interface, self._path) # Le vote d'une élection passe par les routes de l'élection
 
     def close(self):
         if self.vote:
@@ -56,20 +58,38 @@ class Election:
         else:
             return
 
+    async def aclose(self):
+        if self.vote:
+            await self.vote.aclose()
+        else:
+            return
+
     def add_vote(self, id: str):
         if self.vote:
             self.vote.add_vote(id)
         else:
             return
 
+    async def aadd_vote(self, id: str):
+        if self.vote:
+            await self.vote.aadd_vote(id)
+        else:
+            return
+
+    def _submit_request(self) -> tuple:
+        return 'PUT', f"{self._url}/submit", {}, None
+
     def submit_candidacy(self):
-        res = requests.put(f"{self._url}/submit")
+        self._dispatch(self._submit_request())
+
+    async def asubmit_candidacy(self):
+        await self._adispatch(self._submit_request())
 
-        if res.status_code != 200:
-            res.raise_for_status()
+    def _cancel_candidacy_request(self) -> tuple:
+        return 'PUT', f"{self._url}/cancel_candidacy", {}, None
 
     def cancel_candidacy(self):
-        res = requests.put(f"{self._url}/cancel_candidacy")
+        self._dispatch(self._cancel_candidacy_request())
 
-        if res.status_code != 200:
-            res.raise_for_status()
\ No newline at end of file
+    async def acancel_candidacy(self):
+        await self._adispatch(self._cancel_candidacy_request())
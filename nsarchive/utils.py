@@ -1,6 +1,11 @@
+import codecs
 import io
+import json
 import math
 import os
+import re
+import typing
+
 from PIL import Image
 
 def open_asset(path: str) -> bytes:
@@ -26,4 +31,162 @@ def compress_image(data: bytes, _max: int = 1000 ** 2) -> bytes:
     return val.getvalue()
 
 def warn(prompt: str):
-    print("\033[1;33mWarning:\033[0m", prompt)
\ No newline at end of file
+    print("\033[1;33mWarning:\033[0m", prompt)
+
+_SPACES = re.compile(rb'\s*')
+_ELEMENT_ENDS = {
+    # Fin possible d'un élément selon son premier caractère, suivie du délimiteur (un octet littéral se cherche plus vite qu'une classe)
+    ord('{'): re.compile(rb'\}\s*([,\]])'),
+    ord('['): re.compile(rb'\]\s*([,\]])')
+}
+_SCALAR_END = re.compile(rb'\s*([,\]])')
+
+class JSONArrayParser:
+    """
+    Décodeur incrémental d'un tableau JSON : chaque bloc reçu est passé à `feed`, qui renvoie les éléments complets qu'il a permis de lire. Seul l'élément en cours de réception est gardé en mémoire.
+
+    Sans `loads`, les éléments sont lus par le module `json` standard. Avec `loads` (`JSONCodec.loads`), chaque fin possible d'élément (`}` ou `]` suivi d'une virgule ou du crochet final) est essayée jusqu'à ce que `loads` accepte l'élément.
+
+    ## Paramètres
+    loads: `Callable[[bytes], Any]` (optionnel)\n
+        Décodeur des éléments
+    errors: `tuple[type]` (optionnel)\n
+        Exceptions levées par `loads` sur un élément incomplet
+    """
+
+    def __init__(self, loads: typing.Callable[[bytes], typing.Any] = None, errors: tuple[type] = (ValueError,)) -> None:
+        self.loads = loads
+        self.errors = errors
+
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+
+        self._buffer = "" if loads is None else b""
+        self._scan = 0 # Position à partir de laquelle chercher la fin de l'élément en cours
+        self._started = False
+        self.done = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> list[typing.Any]:
+        if self.loads is not None:
+            return self._feed_bytes(chunk, final)
+
+        self._buffer += self._utf8.decode(chunk, final = final)
+
+        buffer = self._buffer
+        length = len(buffer)
+        items = []
+        pos = 0
+
+        while not self.done:
+            while pos < length and buffer[pos] in " \t\r\n,":
+                pos += 1
+
+            if pos == length:
+                break
+
+            if not self._started:
+                if buffer[pos] != '[':
+                    raise ValueError("Expected a JSON array")
+
+                self._started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == ']':
+                self.done = True
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+
+                break
+
+            # Un nombre en fin de tampon (ou coupé avant sa partie décimale) peut encore être tronqué
+            if not final and (end == length or buffer[end] in ".eE+-"):
+                break
+
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+
+        if final and not self.done:
+            raise ValueError("Unexpected end of JSON array")
+
+        return items
+
+    def _feed_bytes(self, chunk: bytes, final: bool) -> list[typing.Any]:
+        buffer = self._buffer + chunk
+        length = len(buffer)
+        items = []
+        pos = 0
+        scan = self._scan
+
+        while not self.done:
+            if pos < length and buffer[pos] in b" \t\r\n":
+                pos = _SPACES.match(buffer, pos).end()
+
+            if pos == length:
+                break
+
+            if not self._started:
+                if buffer[pos] != 0x5B: # '['
+                    raise ValueError("Expected a JSON array")
+
+                self._started = True
+                pos = scan = pos + 1
+                continue
+
+            if buffer[pos] == 0x5D: # ']' d'un tableau vide
+                self.done = True
+                break
+
+            search = _ELEMENT_ENDS.get(buffer[pos], _SCALAR_END).search
+            match = search(buffer, max(scan, pos))
+
+            while match is not None:
+                try:
+                    item = self.loads(buffer[pos:match.start(1)])
+                except self.errors:
+                    match = search(buffer, match.start() + 1) # Fin située dans une chaîne ou un sous-objet
+                    continue
+
+                break
+
+            if match is None:
+                # Le dernier `}` ou `]` attend peut-être encore le délimiteur qui le suit
+                scan = max(pos, len(buffer.rstrip()) - 1)
+                break
+
+            items.append(item)
+
+            if buffer[match.start(1)] == 0x5D: # ']'
+                self.done = True
+
+            pos = scan = match.end()
+
+        self._buffer = buffer[pos:]
+        self._scan = max(scan - pos, 0)
+
+        if final and not self.done:
+            raise ValueError("Unexpected end of JSON array")
+
+        return items
+
+def iter_json_array(chunks: typing.Iterable[bytes], parser: JSONArrayParser = None) -> typing.Iterator[typing.Any]:
+    """
+    Décode un tableau JSON au fur et à mesure de sa réception et renvoie ses éléments un par un.
+    """
+
+    parser = parser or JSONArrayParser()
+
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+        if parser.done:
+            return
+
+    yield from parser.feed(b'', final = True)
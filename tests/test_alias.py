@@ -0,0 +1,37 @@
+"""
+Interfaces dupliquées sous une autre identité (`Interface.alias`), contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 100) as server:
+        yield server
+
+def test_alias_does_not_share_read_data(server, tmp_path):
+    interface = nsarchive.EconomyInterface(server.url, "token", cache = nsarchive.Cache(), snapshots = nsarchive.SnapshotStore(str(tmp_path / "snapshots.db")))
+    requests = []
+    interface.transport.session.hooks['response'].append(lambda res, *args, **kwargs: requests.append(res.request.headers['Authorization']))
+
+    alias = interface.alias('ABC')
+    id = next(iter(server.dataset.accounts))
+
+    interface.get_account(id)
+    alias.get_account(id)
+
+    assert alias.cache is not interface.cache
+    assert alias.snapshots.path == str(tmp_path / "snapshots.ABC.db")
+    assert alias.snapshots.get('accounts', id) is not None
+    assert requests == [ "Bearer token", "Bearer token:ABC" ]
+
+def test_alias_without_cache(server):
+    interface = nsarchive.EconomyInterface(server.url, "token")
+    alias = interface.alias('ABC')
+
+    assert alias.cache is None and alias.snapshots is None
+    assert alias.transport is interface.transport
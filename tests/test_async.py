@@ -0,0 +1,141 @@
+"""
+Parité des interfaces synchrones et asynchrones contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import asyncio
+
+import pytest
+import requests
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+pytest.importorskip("aiohttp")
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 200) as server:
+        yield server
+
+def run(interface: nsarchive.AsyncInterface, coro):
+    async def _run():
+        try:
+            return await coro
+        finally:
+            await interface.transport.aclose()
+
+    return asyncio.run(_run())
+
+def test_fetch_encodes_booleans_like_sync(server):
+    sync = nsarchive.EconomyInterface(server.url, "token")
+    _async = nsarchive.AsyncEconomyInterface(server.url, "token")
+
+    frozen = sorted(_acc['id'] for _acc in sync.fetch('accounts', frozen = True))
+
+    assert frozen == sorted(id for id, _acc in server.dataset.accounts.items() if _acc['frozen'])
+    assert sorted(_acc['id'] for _acc in run(_async, _async.fetch('accounts', frozen = True))) == frozen
+
+def test_fetch_drops_none_values(server):
+    sync = nsarchive.EconomyInterface(server.url, "token")
+    _async = nsarchive.AsyncEconomyInterface(server.url, "token")
+
+    assert len(sync.fetch('accounts', bank = None)) == len(server.dataset.accounts)
+    assert len(run(_async, _async.fetch('accounts', bank = None))) == len(server.dataset.accounts)
+
+def test_fetch_accounts_matches_sync(server):
+    sync = nsarchive.EconomyInterface(server.url, "token")
+    _async = nsarchive.AsyncEconomyInterface(server.url, "token")
+
+    expected = [ _acc.id for _acc in sync.fetch_accounts(frozen = True) ]
+
+    assert [ _acc.id for _acc in run(_async, _async.fetch_accounts(frozen = True)) ] == expected
+
+def test_async_delete_by_id(server):
+    interface = nsarchive.AsyncEconomyInterface(server.url, "token")
+    id = next(iter(server.dataset.accounts))
+
+    run(interface, interface._delete_by_ID('accounts', id))
+
+    assert id not in server.dataset.accounts
+
+def test_upload_file(server):
+    sync = nsarchive.EconomyInterface(server.url, "token")
+    _async = nsarchive.AsyncEconomyInterface(server.url, "token")
+
+    sync._upload_file('avatars', 'a.png', b'\x89PNG sync')
+    run(_async, _async._upload_file('avatars', 'b.png', b'\x89PNG async'))
+
+    uploads = [ data for (bucket, _), data in server.dataset.files.items() if bucket == 'avatars' ]
+
+    assert any(b'\x89PNG sync' in data for data in uploads)
+    assert any(b'\x89PNG async' in data for data in uploads)
+    assert sync.default_headers.get('Content-Type') != 'image/png'
+
+def test_fetch_accounts_columnar_matches_rows(server):
+    pytest.importorskip("numpy")
+
+    sync = nsarchive.EconomyInterface(server.url, "token")
+    _async = nsarchive.AsyncEconomyInterface(server.url, "token")
+
+    expected = sorted((_acc['id'], _acc['amount']) for _acc in sync.fetch('accounts', frozen = True))
+
+    for frame in (sync.fetch_accounts(columnar = True, frozen = True), run(_async, _async.fetch_accounts(columnar = True, frozen = True))):
+        assert sorted(zip(frame.id.tolist(), frame.amount.tolist())) == expected
+
+def test_iter_fetch_goes_through_retry_and_breaker():
+    with FakeNationDB(size = 10) as server:
+        url = server.url # Le serveur est arrêté en sortant du bloc
+
+    transport = nsarchive.Transport(retry = nsarchive.RetryPolicy(retries = 1, backoff = 0), breaker = nsarchive.CircuitBreaker(threshold = 2, recovery_time = 60))
+    interface = nsarchive.AsyncEconomyInterface(url, "token", transport = transport)
+
+    async def scan():
+        return [ _data async for _data in interface.iter_fetch('accounts') ]
+
+    with pytest.raises(requests.ConnectionError) as e:
+        run(interface, scan())
+
+    assert not isinstance(e.value, nsarchive.CircuitOpenError)
+    assert transport.breaker.is_open(url) # Deux tentatives : la requête a été rejouée une fois
+
+    with pytest.raises(nsarchive.CircuitOpenError):
+        run(interface, scan())
+
+def test_iter_fetch_streams_like_sync(server):
+    sync = nsarchive.EconomyInterface(server.url, "token")
+    _async = nsarchive.AsyncEconomyInterface(server.url, "token")
+
+    async def scan():
+        return [ _data['id'] async for _data in _async.iter_fetch('accounts', frozen = True) ]
+
+    assert run(_async, scan()) == [ _data['id'] for _data in sync.iter_fetch('accounts', frozen = True) ]
+
+def test_model_mutators_match_sync(server):
+    sync = nsarchive.EconomyInterface(server.url, "token")
+    _async = nsarchive.AsyncEconomyInterface(server.url, "token")
+    first, second = [ id for id, _acc in server.dataset.accounts.items() if not _acc['frozen'] and _acc['amount'] >= 10 ][:2]
+    amounts = { id: server.dataset.accounts[id]['amount'] for id in (first, second) }
+
+    account = sync.get_account(first)
+    account.debit(10, target = second)
+    account.freeze(reason = "test")
+
+    async def mutate():
+        account = await _async.get_account(second)
+        await account.adebit(10, target = first)
+        await account.afreeze(reason = "test")
+
+        return account
+
+    _account = run(_async, mutate())
+
+    assert account.amount == amounts[first] - 10 # Le virement reçu ensuite n'est pas relu
+    assert _account.amount == amounts[second] # Lu après le virement reçu, puis débité
+
+    for _acc in (account, _account):
+        assert _acc.frozen and server.dataset.accounts[_acc.id]['frozen']
+        assert server.dataset.accounts[_acc.id]['amount'] == amounts[_acc.id]
+
+    with pytest.raises(requests.HTTPError):
+        account.debit(10) # Compte gelé
@@ -0,0 +1,82 @@
+"""
+Traitements de fin de cycle reprenables (`CycleJob`), contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+class Killed(Exception):
+    pass
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 100) as server:
+        yield server
+
+@pytest.fixture
+def interface(server):
+    interface = nsarchive.EconomyInterface(server.url, "token")
+
+    yield interface
+
+    interface.transport.close()
+
+def setup_job(server, interface, journal, rule_shape):
+    accounts = server.dataset.accounts
+    treasury = next(id for id, _acc in accounts.items() if not _acc['frozen'])
+    taxed = [ id for id, _acc in accounts.items() if id != treasury and not _acc['frozen'] ]
+    before = { id: accounts[id]['amount'] for id in taxed }
+
+    def rule(account):
+        if account.id == treasury or account.frozen:
+            return None
+
+        return rule_shape((account.id, treasury, 1, "impot"))
+
+    job = nsarchive.CycleJob(interface, "impots", rule, str(journal), cycle = 1, batch_size = 10)
+
+    return job, taxed, before
+
+@pytest.mark.parametrize("rule_shape", [ lambda op: op, lambda op: (op,), lambda op: [ op ] ], ids = [ "tuple", "tuple-of-tuples", "list" ])
+def test_rule_shapes(server, interface, tmp_path, rule_shape):
+    job, taxed, before = setup_job(server, interface, tmp_path / "journal.jsonl", rule_shape)
+
+    reports = job.run()
+
+    assert sum(report['ok'] for report in reports) == len(taxed)
+    assert all(server.dataset.accounts[id]['amount'] == before[id] - 1 for id in taxed)
+
+def test_resume_after_kill_does_not_debit_twice(server, interface, tmp_path):
+    job, taxed, before = setup_job(server, interface, tmp_path / "journal.jsonl", lambda op: (op,))
+    transfer_many = interface.transfer_many
+    calls = 0
+
+    def killed_transfer_many(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        report = transfer_many(*args, **kwargs)
+
+        # Le troisième lot est appliqué par le serveur, mais le processus meurt avant de l'inscrire au journal
+        if calls == 3:
+            raise Killed()
+
+        return report
+
+    interface.transfer_many = killed_transfer_many
+
+    with pytest.raises(Killed):
+        job.run()
+
+    assert job.progress()['batches'] == 2
+
+    interface.transfer_many = transfer_many
+    resumed = nsarchive.CycleJob(interface, "impots", job.rule, job.journal, cycle = 1, batch_size = 10)
+    reports = resumed.run()
+
+    assert reports[0]['batch'] == 2
+    assert not any(report['errors'] for report in reports)
+    assert all(server.dataset.accounts[id]['amount'] == before[id] - 1 for id in taxed)
+    assert len(resumed.progress()['done']) >= len(taxed)
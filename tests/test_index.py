@@ -0,0 +1,63 @@
+"""
+Index local des entités (`EntityIndex`), contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 200) as server:
+        yield server
+
+@pytest.fixture
+def interface(server):
+    interface = nsarchive.EntityInterface(server.url, "token")
+
+    yield interface
+
+    interface.transport.close()
+
+def test_build_index_matches_query(server, interface):
+    index = interface.build_index(_class = 'individuals', zone = 20)
+    expected = { id for id, _data in server.dataset.individuals.items() if _data['zone'] == 20 }
+
+    assert { entity.id for entity in index } == expected
+    assert { entity.id for entity in index.query(zone = 20) } == expected
+    assert index.query(zone = 10) == []
+
+def test_non_matching_load_is_not_indexed(server, interface):
+    index = interface.build_index(_class = 'individuals', zone = 20)
+    outsider = next(id for id, _data in server.dataset.individuals.items() if _data['zone'] == 10)
+    organization = next(iter(server.dataset.organizations))
+
+    size = len(index)
+
+    interface.get_entity(outsider, 'user')
+    interface.get_entity(organization, 'group')
+    interface.fetch_entities(_class = 'individuals', zone = 10)
+
+    assert outsider not in index
+    assert organization not in index
+    assert len(index) == size
+    assert index.query(zone = 10) == []
+
+def test_indexed_entity_is_replaced(server, interface):
+    index = interface.build_index(_class = 'individuals', zone = 20)
+    id = next(iter(index)).id
+
+    reloaded = interface.get_entity(id, 'user')
+
+    assert index.get(id) is reloaded
+
+def test_write_reindexes_entity(server, interface):
+    index = interface.build_index(_class = 'individuals', zone = 20)
+    user = next(iter(index))
+    xp = user.xp
+
+    user.add_xp(1000000)
+
+    assert index.query(xp = (xp + 1000000, None)) == [ user ]
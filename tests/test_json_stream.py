@@ -0,0 +1,58 @@
+"""
+Décodage en flux des tableaux JSON (`utils.JSONArrayParser`) avec chaque backend de `JSONCodec`, contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import json
+
+import pytest
+
+import nsarchive
+from nsarchive import utils
+
+from benchmarks.server import FakeNationDB
+
+ROWS = [
+    { "id": "1a", "name": "a\"b\\c,]}", "tags": [ "x], [", {} ], "amount": -2500.5 },
+    [ [ 1, 2 ], [] ],
+    "}, {",
+    12345678901234,
+    1e-05,
+    None,
+    { "nested": { "deep": [ { "k": "]" } ] } }
+]
+
+def backends() -> list[str]:
+    res = []
+
+    for backend in nsarchive.JSONCodec.BACKENDS:
+        try:
+            nsarchive.JSONCodec(backend)
+        except ImportError:
+            continue
+
+        res.append(backend)
+
+    return res
+
+@pytest.mark.parametrize("backend", backends())
+@pytest.mark.parametrize("size", [ 1, 3, 7, 64 ])
+@pytest.mark.parametrize("indent", [ None, 2 ])
+def test_parser_matches_json_loads(backend, size, indent):
+    raw = json.dumps(ROWS, indent = indent, ensure_ascii = False).encode()
+    chunks = [ raw[i:i + size] for i in range(0, len(raw), size) ]
+
+    assert list(utils.iter_json_array(chunks, nsarchive.JSONCodec(backend).parser())) == ROWS
+
+@pytest.mark.parametrize("backend", backends())
+def test_parser_rejects_truncated_arrays(backend):
+    for raw in (b'{}', b'[1, 2', b'[{"a": 1}'):
+        with pytest.raises(ValueError):
+            list(utils.iter_json_array([ raw ], nsarchive.JSONCodec(backend).parser()))
+
+@pytest.mark.parametrize("backend", backends())
+def test_iter_fetch_decodes_with_interface_codec(backend):
+    with FakeNationDB(size = 100) as server:
+        transport = nsarchive.Transport(codec = nsarchive.JSONCodec(backend))
+        interface = nsarchive.EconomyInterface(server.url, "token", transport = transport)
+
+        assert list(interface.iter_fetch('accounts')) == interface.fetch('accounts')
@@ -0,0 +1,95 @@
+"""
+Classement des membres (`Leaderboard`), seul et associé à une interface contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+def user(id: int, xp: int, zone: int = 20) -> nsarchive.User:
+    user = nsarchive.User(nsarchive.NSID(id))
+    user.xp = xp
+    user.zone = zone
+
+    return user
+
+@pytest.fixture
+def board():
+    return nsarchive.Leaderboard([
+        user(1, 500),
+        user(2, 300, 10),
+        user(3, 300),
+        user(4, 100),
+        user(5, 900, 10)
+    ])
+
+def test_rank(board):
+    assert [ board.rank(nsarchive.NSID(id)) for id in (5, 1, 2, 3, 4) ] == [ 1, 2, 3, 3, 5 ]
+    assert board.rank(nsarchive.NSID(1), zone = 20) == 1
+    assert board.rank(nsarchive.NSID(5), zone = 20) is None
+    assert board.rank(nsarchive.NSID(42)) is None
+
+def test_ties_share_rank_and_keep_id_order(board):
+    assert board.rank(nsarchive.NSID(2)) == board.rank(nsarchive.NSID(3))
+    assert [ u.id for u in board.page(1, 2) ] == [ nsarchive.NSID(2), nsarchive.NSID(3) ]
+
+def test_pages(board):
+    assert [ u.id for u in board.top(2) ] == [ nsarchive.NSID(5), nsarchive.NSID(1) ]
+    assert [ u.id for u in board.page(2, 2) ] == [ nsarchive.NSID(4) ]
+    assert board.page(3, 2) == []
+    assert [ u.id for u in board.page(0, 10, zone = 10) ] == [ nsarchive.NSID(5), nsarchive.NSID(2) ]
+    assert [ u.id for u in board.around(nsarchive.NSID(3), 1) ] == [ nsarchive.NSID(2), nsarchive.NSID(3), nsarchive.NSID(4) ]
+
+def test_remove_drops_empty_zone(board):
+    board.remove(nsarchive.NSID(2))
+    board.remove(nsarchive.NSID(5))
+
+    assert board.zones() == [ 20 ]
+    assert board.rank(nsarchive.NSID(1)) == 1
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 200) as server:
+        yield server
+
+@pytest.fixture
+def interface(server):
+    interface = nsarchive.EntityInterface(server.url, "token")
+
+    yield interface
+
+    interface.transport.close()
+
+def test_add_xp_replaces_member(server, interface):
+    board = interface.build_leaderboard(zone = 20)
+    last = board.page(len(board) - 1, 1)[0]
+
+    last.add_xp(10 ** 9)
+
+    assert board.rank(last) == 1
+    assert board.top(1) == [ last ]
+    assert board.rank(last, zone = 20) == 1
+
+def test_later_loads_stay_in_scope(server, interface):
+    board = interface.build_leaderboard(zone = 20)
+    outsider = next(id for id, _data in server.dataset.individuals.items() if _data['zone'] == 10)
+    size = len(board)
+
+    interface.get_entity(outsider, 'user')
+    interface.fetch_entities(_class = 'individuals', zone = 10)
+
+    assert outsider not in board
+    assert len(board) == size
+    assert board.zones() == [ 20 ]
+    assert board.rank(outsider) is None
+
+def test_ranked_member_is_replaced_on_reload(server, interface):
+    board = interface.build_leaderboard(zone = 20)
+    member = board.top(1)[0]
+
+    reloaded = interface.get_entity(member.id, 'user')
+
+    assert board.get(member.id) is reloaded
+    assert board.rank(reloaded) == 1
@@ -0,0 +1,41 @@
+"""
+Rapprochement des comptes en banque avec un `LedgerMirror`, contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 200) as server:
+        yield server
+
+def test_row_hash_ignores_value_types():
+    mirror = nsarchive.LedgerMirror()
+
+    assert mirror.row_hash('1', (100.0, 0, 1)) == mirror.row_hash('1', (100, False, True))
+    assert mirror.row_hash('1', (100, False, False)) != mirror.row_hash('1', (101, False, False))
+
+def test_float_amounts_are_not_mismatches(server):
+    interface = nsarchive.EconomyInterface(server.url, "token")
+    rows = list(server.dataset.accounts.values())
+
+    mirror = nsarchive.LedgerMirror({ **row, "amount": float(row['amount']), "frozen": int(row['frozen']) } for row in rows)
+    report = interface.reconcile_accounts(mirror, page_size = 50).run()
+
+    assert report.rows == len(rows)
+    assert report.mismatches == 0
+
+def test_changed_amount_is_a_mismatch(server):
+    interface = nsarchive.EconomyInterface(server.url, "token")
+    rows = list(server.dataset.accounts.values())
+
+    mirror = nsarchive.LedgerMirror(rows)
+    mirror.set({ **rows[0], "amount": rows[0]['amount'] + 1 })
+
+    report = interface.reconcile_accounts(mirror, page_size = 50).run()
+
+    assert report.mismatches == 1
@@ -0,0 +1,72 @@
+"""
+Niveaux d'XP (`level_for_xp`, `levels_for_xp`) : parité avec l'ancien calcul de `User.get_level`.
+"""
+
+import pytest
+
+from nsarchive.models import entities
+
+def get_level(xp: int) -> int:
+    # Ancienne implémentation de `User.get_level`, conservée comme référence
+    i = 0
+    while xp > int(round(25 * (i * 2.5) ** 2, -2)):
+        i += 1
+
+    return i
+
+@pytest.fixture
+def levels():
+    # Table réduite aux 10 premiers niveaux : les valeurs au-delà passent par `_extend_levels`
+    saved = list(entities._LEVELS)
+    entities._LEVELS.clear()
+    entities._extend_levels(entities.level_threshold(10))
+
+    yield entities._LEVELS
+
+    entities._LEVELS[:] = saved
+
+def boundaries(max_level: int) -> list[int]:
+    values = [ -5, 0 ]
+
+    for level in range(max_level + 1):
+        threshold = entities.level_threshold(level)
+        values += [ threshold - 1, threshold, threshold + 1 ]
+
+    return values
+
+def test_level_for_xp_matches_get_level(levels):
+    assert len(levels) == 11
+
+    values = boundaries(60)
+
+    assert [ entities.level_for_xp(xp) for xp in values ] == [ get_level(xp) for xp in values ]
+    assert len(levels) > 60 # Table étendue au-delà du précalcul
+
+def test_levels_for_xp_matches_get_level(levels):
+    numpy = pytest.importorskip("numpy")
+
+    values = boundaries(80)
+    expected = [ get_level(xp) for xp in values ]
+
+    assert entities.levels_for_xp(values).tolist() == expected
+    assert entities.levels_for_xp(numpy.asarray(values[::-1])).tolist() == expected[::-1]
+    assert entities.levels_for_xp([]).tolist() == []
+
+def test_extension_keeps_earlier_thresholds(levels):
+    before = list(levels)
+
+    entities.level_for_xp(entities.level_threshold(200) + 1)
+
+    assert levels[:len(before)] == before
+    assert levels == [ entities.level_threshold(level) for level in range(len(levels)) ]
+
+def test_xp_to_next_level_reaches_next_level(levels):
+    for xp in boundaries(40):
+        if xp < 0: continue
+
+        level = get_level(xp)
+        missing = entities.xp_to_next_level(xp)
+
+        assert missing > 0
+        assert get_level(xp + missing) == level + 1
+        assert get_level(xp + missing - 1) == level
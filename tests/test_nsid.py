@@ -0,0 +1,71 @@
+"""
+Table d'internement des `NSID`.
+"""
+
+import pytest
+
+import nsarchive
+from nsarchive import NSID
+
+@pytest.fixture(autouse = True)
+def interned():
+    # Chaque test part d'une table vide, restaurée ensuite pour ne pas perturber les autres modules
+    saved = dict(NSID._interned)
+    NSID._interned.clear()
+
+    yield NSID._interned
+
+    NSID._interned.clear()
+    NSID._interned.update(saved)
+
+def test_equal_inputs_return_the_same_object():
+    assert NSID("1a2b") is NSID("1a2b")
+    assert NSID(6699) is NSID(6699)
+
+    nsid = NSID("1a2b")
+
+    assert NSID(nsid) is nsid
+    assert NSID.many([ "1a2b", 6699, nsid ]) == [ nsid, NSID(6699), nsid ]
+    assert all(a is b for a, b in zip(NSID.many([ "1a2b", 6699 ]), [ nsid, NSID(6699) ]))
+
+def test_int_and_str_inputs_normalise_the_same():
+    for value in (0, 1, 255, 6699, 2 ** 40):
+        assert NSID(value) == NSID(format(value, 'x')) == NSID(format(value, 'X')) == format(value, 'X')
+        assert hash(NSID(value)) == hash(NSID(format(value, 'x')))
+
+    assert NSID("ff") == "FF"
+    assert NSID("00ff") == NSID(255)
+    assert NSID(-1) == "-0X1"
+
+    with pytest.raises(TypeError):
+        NSID(1.5)
+
+    with pytest.raises(TypeError):
+        NSID(None)
+
+def test_table_is_cleared_at_intern_size(interned, monkeypatch):
+    monkeypatch.setattr(NSID, 'INTERN_SIZE', 4)
+
+    first = NSID(1)
+
+    for value in range(2, 5):
+        NSID(value)
+
+    assert len(interned) == 4
+
+    NSID(5) # Table pleine : vidée avant d'ajouter le nouvel ID
+
+    assert len(interned) == 1
+    assert 1 not in interned
+
+    # Un ID déjà rendu reste valide, mais n'est plus partagé avec les nouveaux appels
+    again = NSID(1)
+
+    assert again == first
+    assert again is not first
+    assert NSID(1) is again
+
+def test_models_share_interned_ids():
+    account = nsarchive.BankAccount(NSID("1a2b"))
+
+    assert account.owner_id is NSID("1a2b")
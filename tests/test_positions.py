@@ -0,0 +1,105 @@
+"""
+Positions partagées par les entités d'une interface (`PositionCatalog`), contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 200) as server:
+        yield server
+
+@pytest.fixture
+def interface(server):
+    interface = nsarchive.EntityInterface(server.url, "token")
+
+    yield interface
+
+    interface.transport.close()
+
+def members(server, interface, count: int = 2) -> list[nsarchive.User]:
+    ids = [ id for id, _data in server.dataset.individuals.items() if _data['position'] == 'membre' ][:count]
+
+    return [ interface.get_entity(id, 'user') for id in ids ]
+
+def test_catalog_positions_are_read_only(server, interface):
+    first, second = members(server, interface)
+
+    assert first.position is second.position
+
+    with pytest.raises(AttributeError):
+        first.position.permissions.money.append = True
+
+    with pytest.raises(AttributeError):
+        first.position.permissions.merge({ 'constitution': "--e-" })
+
+    with pytest.raises(AttributeError):
+        first.position.name = "Chef"
+
+    assert not second.position.permissions.has('money', 'append')
+    assert not second.position.permissions.has('constitution', 'edit')
+    assert second.position.name == server.dataset.positions['membre']['name']
+
+def test_copied_position_does_not_affect_other_entities(server, interface):
+    first, second = members(server, interface)
+
+    first.position = first.position.copy()
+    first.position.permissions.money.append = True
+    first.position.name = "Chef"
+
+    assert first.position.permissions.has('money', 'append')
+    assert not second.position.permissions.has('money', 'append')
+    assert second.position.name != "Chef"
+
+def test_update_permissions_replaces_shared_permissions(server, interface):
+    first, second = members(server, interface)
+    permissions = first.position.permissions
+
+    first.position.update_permisions(constitution = "--e-")
+
+    assert first.position.permissions is not permissions
+    assert not permissions.has('constitution', 'edit')
+    assert second.position.permissions.has('constitution', 'edit') # Même position côté serveur
+
+    with pytest.raises(AttributeError):
+        second.position.permissions.constitution.edit = False
+
+def test_catalog_reload_keeps_positions_read_only(server, interface):
+    first, _ = members(server, interface)
+
+    interface.fetch_positions()
+
+    with pytest.raises(AttributeError):
+        first.position.permissions.money.append = True
+
+def test_get_position_returns_private_copy(server, interface):
+    first, second = members(server, interface)
+
+    position = interface.get_position('membre')
+    position.name = "Chef"
+    position.permissions.money.append = True
+
+    assert position is not first.position
+    assert first.position.name != "Chef"
+    assert not second.position.permissions.has('money', 'append')
+    assert interface.positions.get('membre') is first.position
+
+def test_allowed_and_having_accept_generators(server, interface):
+    users = members(server, interface, 3)
+    users[0].position = users[0].position.copy()
+    users[0].position.permissions.money.append = True
+
+    assert nsarchive.PositionPermissions.allowed(iter(users), 'money', 'append') == [ True, False, False ]
+    assert nsarchive.PositionPermissions.having(( user for user in users ), 'money', 'append') == [ users[0] ]
+
+def test_only_frozen_permissions_are_hashable(server, interface):
+    first, _ = members(server, interface)
+
+    assert hash(first.position.permissions) == hash(first.position.permissions.bits)
+
+    with pytest.raises(TypeError):
+        hash(first.position.permissions.copy())
@@ -0,0 +1,132 @@
+"""
+Index des prix du marché (`PriceIndex`), sur des annonces construites et contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import statistics
+
+import pytest
+
+import nsarchive
+from nsarchive import NSID
+
+from benchmarks.server import FakeNationDB
+
+numpy = pytest.importorskip("numpy")
+
+def sale(id: int, item: int, quantity: int, price: int, open: bool = True) -> dict:
+    return { "id": format(id, 'x'), "open": open, "item_id": format(item, 'x'), "quantity": quantity, "price": price }
+
+SALES = [
+    sale(1, 0xA, 2, 20),  # 10 / unité
+    sale(2, 0xA, 1, 30),  # 30
+    sale(3, 0xA, 5, 100), # 20
+    sale(4, 0xB, 4, 10),  # 2.5
+    sale(5, 0xB, 1, 5),   # 5
+    sale(6, 0xC, 3, 30, open = False) # Fermée : ignorée
+]
+
+def expected(sales: list[dict], item: int) -> dict:
+    rows = [ _sale for _sale in sales if _sale['open'] and _sale['item_id'] == format(item, 'x') ]
+    units = [ _sale['price'] / _sale['quantity'] for _sale in rows ]
+
+    return {
+        "min": min(units),
+        "median": statistics.median(units),
+        "vwap": sum(_sale['price'] for _sale in rows) / sum(_sale['quantity'] for _sale in rows),
+        "volume": sum(_sale['quantity'] for _sale in rows),
+        "sales": len(rows)
+    }
+
+def test_min_median_vwap():
+    index = nsarchive.PriceIndex(SALES)
+
+    assert len(index) == 2
+    assert NSID(0xC) not in index
+    assert index.price(0xC) is None
+
+    for item in (0xA, 0xB):
+        assert index.stats(item) == pytest.approx(expected(SALES, item))
+
+    assert index.price(0xA, 'min') == 10
+    assert index.price(0xA, 'median') == 20
+    assert index.price(0xA, 'vwap') == pytest.approx(150 / 8)
+    assert index.price(0xB, 'median') == pytest.approx(3.75) # Nombre pair d'annonces
+
+def test_incremental_sync_after_new_sales():
+    index = nsarchive.PriceIndex(SALES)
+    index.price(0xA) # Tableaux synchronisés
+
+    index.add(sale(7, 0xA, 1, 1))
+    index.add(sale(8, 0xD, 2, 8))
+
+    # Seuls les objets touchés sont à recalculer
+    assert index._dirty == { NSID(0xA), NSID(0xD) }
+
+    sales = SALES + [ sale(7, 0xA, 1, 1), sale(8, 0xD, 2, 8) ]
+
+    for item in (0xA, 0xB, 0xD):
+        assert index.stats(item) == pytest.approx(expected(sales, item))
+
+    assert not index._dirty
+
+    # Annonce vendue, puis modifiée : retirée puis remplacée
+    index.remove(format(7, 'x'))
+    index.update(sale(4, 0xB, 4, 40))
+
+    sales = [ _sale for _sale in sales if _sale['id'] not in ('7', '4') ] + [ sale(4, 0xB, 4, 40) ]
+
+    for item in (0xA, 0xB):
+        assert index.stats(item) == pytest.approx(expected(sales, item))
+
+def test_refresh_counts_changed_items():
+    index = nsarchive.PriceIndex(SALES)
+    index.price(0xA)
+
+    assert index.refresh(SALES) == 0
+
+    # 0xA : annonce retirée ; 0xB : annonce fermée ; 0xC : annonce rouverte
+    current = [ SALES[0], SALES[2], SALES[3], { **SALES[4], "open": False }, { **SALES[5], "open": True } ]
+
+    assert index.refresh(current) == 3
+    assert index.stats(0xA) == pytest.approx(expected(current, 0xA))
+    assert index.stats(0xB) == pytest.approx(expected(current, 0xB))
+    assert index.price(0xC) == 10
+
+def test_values_use_default_for_items_without_sales():
+    index = nsarchive.PriceIndex(SALES)
+    vwap_a = 150 / 8
+
+    inventories = [
+        { NSID(0xA): 2, NSID(0xB): 4 },
+        { NSID(0xC): 3, "ff": 1 },          # Objets sans annonce ouverte
+        {},                                 # Inventaire vide
+        { "a": 1 }                          # Clé non convertie en NSID
+    ]
+
+    assert index.values(inventories).tolist() == pytest.approx([ 2 * vwap_a + 4 * 3, 0, 0, vwap_a ])
+    assert index.values(inventories, default = 7).tolist() == pytest.approx([ 2 * vwap_a + 4 * 3, 4 * 7, 0, vwap_a ])
+    assert index.values(inventories, kind = 'min').tolist() == pytest.approx([ 2 * 10 + 4 * 2.5, 0, 0, 10 ])
+    assert index.value({ NSID(0xB): 1 }, kind = 'median') == pytest.approx(3.75)
+    assert index.values([]).tolist() == []
+
+    # Un objet dont toutes les annonces ont disparu retombe sur le prix par défaut
+    index.remove(format(4, 'x'))
+    index.remove(format(5, 'x'))
+
+    assert index.value({ NSID(0xB): 2 }, default = 1) == 2
+
+def test_build_and_refresh_from_server():
+    with FakeNationDB(size = 100) as server:
+        interface = nsarchive.EconomyInterface(server.url, "token")
+        index = interface.build_price_index()
+        sales = list(server.dataset.sales.values())
+
+        for item in { _sale['item_id'] for _sale in sales if _sale['open'] and _sale['quantity'] > 0 }:
+            assert index.stats(item) == pytest.approx(expected(sales, int(item, 16)))
+
+        id = next(id for id, _sale in server.dataset.sales.items() if _sale['open'])
+        server.dataset.sales[id]['open'] = False
+
+        assert interface.refresh_price_index(index) == 1
+
+        interface.transport.close()
@@ -0,0 +1,120 @@
+"""
+Politique de réessai (`RetryPolicy`) et disjoncteur (`CircuitBreaker`) du transport, contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import random
+import time
+
+import pytest
+import requests
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+def interface_for(url: str, retries: int = 2, timeout: float = 5, threshold: int = 5, recovery_time: float = 10) -> nsarchive.EconomyInterface:
+    transport = nsarchive.Transport(
+        retry = nsarchive.RetryPolicy(retries = retries, backoff = 0, timeout = timeout),
+        breaker = nsarchive.CircuitBreaker(threshold = threshold, recovery_time = recovery_time)
+    )
+
+    return nsarchive.EconomyInterface(url, "token", transport = transport)
+
+def debitable(server: FakeNationDB) -> tuple[nsarchive.NSID, nsarchive.NSID]:
+    return tuple(id for id, _acc in server.dataset.accounts.items() if not _acc['frozen'] and _acc['amount'] >= 10)[:2]
+
+def test_backoff_bounds():
+    policy = nsarchive.RetryPolicy(backoff = 0.2, max_backoff = 1)
+    random.seed(0)
+
+    for attempt in range(8):
+        delays = [ policy.delay(attempt) for _ in range(200) ]
+
+        assert all(0 <= delay <= min(1, 0.2 * 2 ** attempt) for delay in delays)
+        assert max(delays) > min(1, 0.2 * 2 ** attempt) / 2 # Full jitter : tout l'intervalle est utilisé
+
+    res = requests.Response()
+    res.headers['Retry-After'] = "30"
+
+    assert policy.delay(0, res) == 1 # `Retry-After` plafonné par `max_backoff`
+
+def test_post_without_idempotency_key_is_not_retried():
+    with FakeNationDB(size = 50, drop = 1.0) as server:
+        interface = interface_for(server.url)
+        source, target = debitable(server)
+        amount = server.dataset.accounts[source]['amount']
+
+        account = interface.get_account(source)
+
+        with pytest.raises(requests.ConnectionError):
+            account.debit(10, target = target)
+
+        # Écriture appliquée une seule fois : la coupure n'a pas provoqué de nouvel envoi
+        assert server.dataset.accounts[source]['amount'] == amount - 10
+
+def test_post_with_idempotency_key_is_retried_once_applied():
+    with FakeNationDB(size = 50, drop = 1.0) as server:
+        interface = interface_for(server.url)
+        source, target = debitable(server)
+        amount = server.dataset.accounts[source]['amount']
+
+        account = interface.get_account(source)
+        account.debit(10, target = target, idempotency_key = "debit-1")
+
+        # La nouvelle tentative reçoit la réponse mémorisée par le serveur sans débiter à nouveau
+        assert server.dataset.accounts[source]['amount'] == amount - 10
+        assert account.amount == amount - 10
+
+def test_timeouts_are_retried_and_open_the_breaker():
+    with FakeNationDB(size = 50, latency = 0.3, jitter = 0.05) as server:
+        interface = interface_for(server.url, retries = 1, timeout = 0.05, threshold = 2)
+        id = next(iter(server.dataset.accounts))
+
+        start = time.monotonic()
+
+        with pytest.raises(requests.Timeout):
+            interface.get_account(id)
+
+        assert time.monotonic() - start < 0.3 # Deux tentatives abandonnées, sans attendre le serveur
+        assert interface.transport.breaker.is_open(server.url)
+
+        with pytest.raises(nsarchive.CircuitOpenError):
+            interface.get_account(id)
+
+def test_breaker_open_half_open_closed():
+    server = FakeNationDB(size = 50)
+    port, url = server.server_port, server.url
+    server.server_close() # Hôte injoignable
+
+    interface = interface_for(url, retries = 0, threshold = 2, recovery_time = 0.2)
+    breaker = interface.transport.breaker
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError) as e:
+            interface.fetch('accounts')
+
+        assert not isinstance(e.value, nsarchive.CircuitOpenError)
+
+    # Ouvert : échec immédiat
+    assert breaker.is_open(url)
+
+    with pytest.raises(nsarchive.CircuitOpenError):
+        interface.fetch('accounts')
+
+    # Semi-ouvert : une requête d'essai passe, son échec rouvre le disjoncteur
+    time.sleep(0.25)
+
+    with pytest.raises(requests.ConnectionError) as e:
+        interface.fetch('accounts')
+
+    assert not isinstance(e.value, nsarchive.CircuitOpenError)
+
+    with pytest.raises(nsarchive.CircuitOpenError):
+        interface.fetch('accounts')
+
+    # Semi-ouvert, hôte revenu : la requête d'essai réussit et referme le disjoncteur
+    with FakeNationDB(size = 50, port = port) as server:
+        time.sleep(0.25)
+
+        assert len(interface.fetch('accounts')) == len(server.dataset.accounts)
+        assert not breaker.is_open(url)
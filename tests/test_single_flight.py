@@ -0,0 +1,99 @@
+"""
+Regroupement des lectures identiques simultanées (`SingleFlight`) contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+CALLERS = 8
+
+@pytest.fixture
+def server():
+    # La latence garde la première lecture en cours pendant que les autres appelants arrivent
+    with FakeNationDB(size = 50, latency = 0.2) as server:
+        yield server
+
+def test_concurrent_reads_share_one_request(server):
+    interface = nsarchive.EntityInterface(server.url, "token")
+    interface.validators = None
+    requests = []
+
+    interface.transport.session.hooks['response'].append(lambda res, *args, **kwargs: requests.append(res.request.url))
+
+    entity_id = next(iter(server.dataset.individuals))
+    barrier = threading.Barrier(CALLERS)
+    results = [ None ] * CALLERS
+
+    def read(i: int):
+        barrier.wait()
+        results[i] = interface._get_by_ID('individuals', entity_id)
+
+    threads = [ threading.Thread(target = read, args = (i,)) for i in range(CALLERS) ]
+
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+
+    interface.transport.close()
+
+    assert len(requests) == 1
+    assert interface.flights.shared == CALLERS - 1
+    assert all(result == results[0] for result in results)
+
+    # Chaque appelant reçoit sa propre copie : la modifier ne change pas celle des autres
+    assert len({ id(result) for result in results }) == CALLERS
+
+    results[0]['name'] = "Modifié"
+    results[0]['boosts']['test'] = 2
+
+    assert all(result['name'] != "Modifié" and 'test' not in result['boosts'] for result in results[1:])
+
+def test_concurrent_async_reads_share_one_request(server):
+    pytest.importorskip("aiohttp")
+
+    interface = nsarchive.AsyncEntityInterface(server.url, "token")
+    interface.validators = None
+    entity_id = next(iter(server.dataset.individuals))
+
+    async def run():
+        try:
+            return await asyncio.gather(*( interface._get_by_ID('individuals', entity_id) for _ in range(CALLERS) ))
+        finally:
+            await interface.transport.aclose()
+
+    results = asyncio.run(run())
+
+    assert interface.flights.shared == CALLERS - 1
+    assert len({ id(result) for result in results }) == CALLERS
+
+    results[0]['boosts']['test'] = 2
+
+    assert all('test' not in result['boosts'] for result in results[1:])
+
+def test_missing_item_is_shared(server):
+    interface = nsarchive.EntityInterface(server.url, "token")
+    requests = []
+
+    interface.transport.session.hooks['response'].append(lambda res, *args, **kwargs: requests.append(res.status_code))
+
+    barrier = threading.Barrier(CALLERS)
+    results = []
+
+    def read():
+        barrier.wait()
+        results.append(interface._get_item("/model/individuals/ffffffffff"))
+
+    threads = [ threading.Thread(target = read) for _ in range(CALLERS) ]
+
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+
+    interface.transport.close()
+
+    assert requests == [ 404 ]
+    assert results == [ None ] * CALLERS
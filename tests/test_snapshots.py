@@ -0,0 +1,69 @@
+"""
+Copie locale (`SnapshotStore`) des interfaces, contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import asyncio
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 200) as server:
+        yield server
+
+def test_delete_invalidates_snapshots(server, tmp_path):
+    snapshots = nsarchive.SnapshotStore(str(tmp_path / "snapshots.db"))
+    interface = nsarchive.EconomyInterface(server.url, "token", snapshots = snapshots)
+    ids = list(server.dataset.accounts)[:2]
+
+    for id in ids:
+        interface.get_account(id)
+        assert snapshots.get('accounts', id) is not None
+
+    interface._delete('accounts', ids)
+
+    assert all(snapshots.get('accounts', id) is None for id in ids)
+
+    # Un nouveau processus ne doit pas servir les comptes supprimés depuis la copie
+    restarted = nsarchive.EconomyInterface(server.url, "token", snapshots = nsarchive.SnapshotStore(snapshots.path))
+
+    with pytest.raises(Exception):
+        restarted.get_account(ids[0])
+
+def test_async_delete_invalidates_snapshots(server, tmp_path):
+    pytest.importorskip("aiohttp")
+
+    snapshots = nsarchive.SnapshotStore(str(tmp_path / "snapshots.db"))
+    interface = nsarchive.AsyncEconomyInterface(server.url, "token", snapshots = snapshots)
+    id = next(iter(server.dataset.accounts))
+
+    async def run():
+        try:
+            await interface.get_account(id)
+            await interface._delete('accounts', [ id ])
+        finally:
+            await interface.transport.aclose()
+
+    asyncio.run(run())
+
+    assert snapshots.get('accounts', id) is None
+
+def test_create_entity_invalidates_fetch_snapshots(server, tmp_path):
+    snapshots = nsarchive.SnapshotStore(str(tmp_path / "snapshots.db"))
+    interface = nsarchive.EntityInterface(server.url, "token", snapshots = snapshots)
+
+    before = interface.fetch('entities')
+    assert snapshots.get('fetch/entities', '') is not None
+
+    interface.create_entity(999999, "Nouveau", "user")
+
+    assert snapshots.get('fetch/entities', '') is None
+
+    # Un nouveau processus relit la liste depuis le réseau et voit la nouvelle entité
+    restarted = nsarchive.EntityInterface(server.url, "token", snapshots = nsarchive.SnapshotStore(snapshots.path))
+
+    assert len(restarted.fetch('entities')) == len(before) + 1
@@ -0,0 +1,78 @@
+"""
+Virements groupés (`transfer_many`), contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import asyncio
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+def transfers_for(server, count: int) -> tuple[list[tuple], dict]:
+    ids = [ id for id, _acc in server.dataset.accounts.items() if not _acc['frozen'] ][:count + 1]
+    target = ids.pop()
+    before = { id: server.dataset.accounts[id]['amount'] for id in ids + [ target ] }
+
+    return [ (id, target, 1, "test") for id in ids ], before
+
+def retrying_transport() -> nsarchive.Transport:
+    return nsarchive.Transport(retry = nsarchive.RetryPolicy(retries = 10, backoff = 0.001, max_backoff = 0.01), breaker = None)
+
+def test_dropped_responses_apply_exactly_once():
+    with FakeNationDB(size = 200, drop = 0.3) as server:
+        interface = nsarchive.EconomyInterface(server.url, "token", transport = retrying_transport())
+        transfers, before = transfers_for(server, 40)
+        target = transfers[0][1]
+
+        report = interface.transfer_many(transfers, max_workers = 8)
+
+        assert all(transfer.ok for transfer in report), [ t for t in report if not t.ok ]
+        assert all(server.dataset.accounts[source]['amount'] == before[source] - 1 for source, *_ in transfers)
+        assert server.dataset.accounts[target]['amount'] == before[target] + len(transfers)
+
+        # Rejouer le bilan ne réapplique rien : les clés d'idempotence sont les mêmes
+        interface.transfer_many(report)
+
+        assert server.dataset.accounts[target]['amount'] == before[target] + len(transfers)
+
+def test_async_dropped_responses_apply_exactly_once():
+    pytest.importorskip("aiohttp")
+
+    with FakeNationDB(size = 200, drop = 0.3) as server:
+        interface = nsarchive.AsyncEconomyInterface(server.url, "token", transport = retrying_transport())
+        transfers, before = transfers_for(server, 40)
+        target = transfers[0][1]
+
+        async def run():
+            try:
+                return await interface.transfer_many(transfers, max_workers = 8)
+            finally:
+                await interface.transport.aclose()
+
+        report = asyncio.run(run())
+
+        assert all(transfer.ok for transfer in report), [ t for t in report if not t.ok ]
+        assert server.dataset.accounts[target]['amount'] == before[target] + len(transfers)
+
+def test_unexpected_error_is_reported_per_transfer():
+    with FakeNationDB(size = 200) as server:
+        interface = nsarchive.EconomyInterface(server.url, "token")
+        transfers, _ = transfers_for(server, 5)
+        broken = transfers[2][0]
+        apply_transfer = interface._apply_transfer
+
+        def _apply_transfer(transfer, res, accounts):
+            if transfer.source == broken:
+                raise ValueError("decode error")
+
+            apply_transfer(transfer, res, accounts)
+
+        interface._apply_transfer = _apply_transfer
+
+        report = interface.transfer_many(transfers)
+
+        assert len(report) == len(transfers)
+        assert [ transfer.ok for transfer in report ] == [ True, True, False, True, True ]
+        assert isinstance(report[2].error, ValueError)
@@ -0,0 +1,65 @@
+"""
+Requêtes conditionnelles (`ValidatorStore`) contre le serveur NationDB factice (`benchmarks.server`).
+"""
+
+import pytest
+
+import nsarchive
+
+from benchmarks.server import FakeNationDB
+
+@pytest.fixture
+def server():
+    with FakeNationDB(size = 200, etag = True) as server:
+        yield server
+
+@pytest.fixture
+def interface(server):
+    interface = nsarchive.EntityInterface(server.url, "token")
+    interface.exchanges = [] # (méthode, URL, en-têtes envoyés, code de réponse)
+
+    interface.transport.session.hooks['response'].append(
+        lambda res, *args, **kwargs: interface.exchanges.append((res.request.method, res.request.url, res.request.headers, res.status_code))
+    )
+
+    yield interface
+
+    interface.transport.close()
+
+def reads(interface: nsarchive.EntityInterface) -> list[tuple]:
+    return [ (headers, status) for method, _, headers, status in interface.exchanges if method == 'GET' ]
+
+def test_second_read_is_revalidated(server, interface):
+    id = next(iter(server.dataset.individuals))
+
+    first = interface.get_entity(id, 'user')
+    second = interface.get_entity(id, 'user')
+
+    (first_headers, first_status), (second_headers, second_status) = reads(interface)
+
+    assert first_status == 200
+    assert 'If-None-Match' not in first_headers and 'If-Modified-Since' not in first_headers
+
+    assert 'If-None-Match' in second_headers or 'If-Modified-Since' in second_headers
+    assert second_status == 304
+    assert interface.validators.revalidated == 1
+
+    assert second._export() == first._export()
+    assert second.xp == first.xp
+
+def test_write_forces_full_read(server, interface):
+    id = next(iter(server.dataset.individuals))
+
+    user = interface.get_entity(id, 'user')
+    before = user._export()
+    user.add_xp(10)
+
+    updated = interface.get_entity(id, 'user')
+
+    _, (headers, status) = reads(interface)
+
+    assert 'If-None-Match' in headers or 'If-Modified-Since' in headers
+    assert status == 200
+    assert interface.validators.revalidated == 0
+    assert updated._export() != before
+    assert updated.xp == server.dataset.individuals[id]['xp']